@@ -0,0 +1,3 @@
+'''
+Shared tooling for running, timing and benchmarking the day-N/day-N.py solvers.
+'''
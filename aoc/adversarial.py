@@ -0,0 +1,241 @@
+'''
+Search for worst-case inputs.
+
+Each target describes a family of small inputs for one day and part, how to
+draw one at random and how to change it a little. A seeded hill climb keeps
+every change that does not lower the solver's cost, measured with the
+deterministic counters of aoc.metrics rather than with time so that noise
+never steers the search:
+
+    day 4 part 2   card chains, counted in recursive get_points calls
+    day 12 part 2  spring rows, counted in distinct `count` states
+    day 16 part 2  mirror and splitter layouts, counted in beam steps
+    day 23 part 2  junction lattices, counted in DFS states
+
+The best input of each target is written to benchmarks/adversarial/, where
+aoc.bench picks it up as one more case of that day and part.
+'''
+
+import argparse
+import json
+import os
+import random
+import sys
+from abc import ABC, abstractmethod
+from typing import Any
+
+from aoc import metrics
+from aoc.days import ADVERSARIAL_DIR, ROOT, get_solver, load_day, reset_caches
+from aoc.generators import DEFAULT_SEED, card_line, join_grid, lattice_connected, lattice_edges, lattice_maze
+
+SUMMARY_PATH = os.path.join(ADVERSARIAL_DIR, 'searched.json')
+
+class Target(ABC):
+    day: int
+    part: int
+    counter: str
+
+    @abstractmethod
+    def initial(self, rng: random.Random) -> Any:
+        pass
+
+    @abstractmethod
+    def mutate(self, rng: random.Random, candidate: Any) -> Any:
+        pass
+
+    @abstractmethod
+    def render(self, candidate: Any) -> str:
+        pass
+
+class CardChains(Target):
+    # Every card may win up to MAX_MATCHES of the cards after it; the number
+    # of instances, and of get_points calls, grows with the chains they form.
+    day, part, counter = 4, 2, 'get_points_calls'
+    CARDS = 18
+    MAX_MATCHES = 5
+
+    def limit(self, card: int) -> int:
+        return min(self.MAX_MATCHES, self.CARDS - 1 - card)
+
+    def initial(self, rng: random.Random) -> tuple[int, ...]:
+        return tuple(rng.randint(0, self.limit(card)) for card in range(self.CARDS))
+
+    def mutate(self, rng: random.Random, matches: tuple[int, ...]) -> tuple[int, ...]:
+        card = rng.randrange(self.CARDS)
+        changed = list(matches)
+        changed[card] = rng.randint(0, self.limit(card))
+        return tuple(changed)
+
+    def render(self, matches: tuple[int, ...]) -> str:
+        rng = random.Random(0)
+        return '\n'.join(card_line(rng, card + 1, self.CARDS, count) for card, count in enumerate(matches))
+
+class SpringRows(Target):
+    # Long runs of '?' and many small groups make the unfolded rows branch the most.
+    day, part, counter = 12, 2, 'cache_misses'
+    ROWS = 8
+    LENGTH = 20
+
+    def random_row(self, rng: random.Random) -> tuple[str, tuple[int, ...]]:
+        springs = ''.join(rng.choices('.#?', k=self.LENGTH))
+        groups = tuple(rng.randint(1, 3) for _ in range(rng.randint(1, 6)))
+        return springs, groups
+
+    def initial(self, rng: random.Random) -> tuple:
+        return tuple(self.random_row(rng) for _ in range(self.ROWS))
+
+    def mutate(self, rng: random.Random, rows: tuple) -> tuple:
+        idx = rng.randrange(self.ROWS)
+        springs, groups = rows[idx]
+
+        if rng.random() < 0.7:
+            pos = rng.randrange(self.LENGTH)
+            springs = springs[:pos] + rng.choice('.#?') + springs[pos + 1:]
+        else:
+            groups = list(groups)
+            move = rng.choice(['add', 'remove', 'change'])
+            if move == 'add' or len(groups) == 1:
+                groups.insert(rng.randint(0, len(groups)), rng.randint(1, 3))
+            elif move == 'remove':
+                groups.pop(rng.randrange(len(groups)))
+            else:
+                groups[rng.randrange(len(groups))] = rng.randint(1, 3)
+            groups = tuple(groups)
+
+        changed = list(rows)
+        changed[idx] = (springs, groups)
+        return tuple(changed)
+
+    def render(self, rows: tuple) -> str:
+        return '\n'.join(f'{springs} {",".join(map(str, groups))}' for springs, groups in rows)
+
+class MirrorLayouts(Target):
+    # Splitters that keep sending beams across the whole grid from every edge.
+    day, part, counter = 16, 2, 'beam_steps'
+    SIDE = 24
+    CHARS = '.' * 4 + '/\\|-'
+
+    def initial(self, rng: random.Random) -> tuple[str, ...]:
+        return tuple(''.join(rng.choices(self.CHARS, k=self.SIDE)) for _ in range(self.SIDE))
+
+    def mutate(self, rng: random.Random, rows: tuple[str, ...]) -> tuple[str, ...]:
+        row, col = rng.randrange(self.SIDE), rng.randrange(self.SIDE)
+        changed = list(rows)
+        changed[row] = rows[row][:col] + rng.choice('./\\|-') + rows[row][col + 1:]
+        return tuple(changed)
+
+    def render(self, rows: tuple[str, ...]) -> str:
+        return join_grid(rows)
+
+class JunctionLattices(Target):
+    # Corridors between junctions on a lattice, as in the real input; part 2
+    # walks every simple path, so the search looks for the corridors to keep.
+    day, part, counter = 23, 2, 'states_expanded'
+    LATTICE = 5
+    SPACING = 4
+
+    def initial(self, rng: random.Random) -> frozenset:
+        edges = lattice_edges(self.LATTICE)
+        for edge in rng.sample(sorted(edges), len(edges) // 3):
+            edges.discard(edge)
+            if not lattice_connected(self.LATTICE, edges):
+                edges.add(edge)
+
+        return frozenset(edges)
+
+    def mutate(self, rng: random.Random, edges: frozenset) -> frozenset:
+        edge = rng.choice(sorted(lattice_edges(self.LATTICE)))
+        changed = set(edges) ^ {edge}
+        return frozenset(changed) if lattice_connected(self.LATTICE, changed) else edges
+
+    def render(self, edges: frozenset) -> str:
+        return lattice_maze(self.LATTICE, edges, self.SPACING)
+
+TARGETS: dict[tuple[int, int], Target] = {
+    (target.day, target.part): target
+    for target in [CardChains(), SpringRows(), MirrorLayouts(), JunctionLattices()]
+}
+
+def adversarial_path(day: int, part: int) -> str:
+    return os.path.join(ADVERSARIAL_DIR, f'day-{day}-part-{part}.txt')
+
+def cost(target: Target, data: str) -> int:
+    module = load_day(target.day)
+    parsed = module.parse(data)
+
+    reset_caches(module)
+    metrics.reset()
+    get_solver(module, target.part)(parsed)
+
+    return metrics.snapshot().get(target.counter, 0)
+
+def search(target: Target, iterations: int, seed: int = DEFAULT_SEED) -> tuple[str, int, int]:
+    # (best input, its cost, the cost of the random input the climb started from)
+    rng = random.Random(f'{seed}-{target.day}-{target.part}')
+
+    current = target.initial(rng)
+    current_cost = initial_cost = cost(target, target.render(current))
+
+    for _ in range(iterations):
+        candidate = target.mutate(rng, current)
+        candidate_cost = cost(target, target.render(candidate))
+
+        # Ties are accepted too, so the climb can drift across plateaus.
+        if candidate_cost >= current_cost:
+            current, current_cost = candidate, candidate_cost
+
+    return target.render(current), current_cost, initial_cost
+
+def load_summary() -> dict:
+    if not os.path.exists(SUMMARY_PATH):
+        return {}
+
+    with open(SUMMARY_PATH, 'r') as file:
+        return json.load(file)
+
+def write_result(target: Target, data: str, found: int, iterations: int, seed: int):
+    os.makedirs(ADVERSARIAL_DIR, exist_ok=True)
+
+    with open(adversarial_path(target.day, target.part), 'w') as file:
+        file.write(data)
+
+    summary = load_summary()
+    summary[f'{target.day}/{target.part}'] = {
+        'counter': target.counter,
+        'cost': found,
+        'iterations': iterations,
+        'seed': seed,
+    }
+
+    with open(SUMMARY_PATH, 'w') as file:
+        json.dump(summary, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Hill-climb towards inputs that maximize a solver\'s work.')
+    parser.add_argument('days', nargs='*', type=int, help=f'days to search (default: {sorted({day for day, _ in TARGETS})})')
+    parser.add_argument('--iterations', type=int, default=300, help='mutations tried per target')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--dry-run', action='store_true', help='report the costs without writing the inputs')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # The counters are only installed in day modules imported after this.
+    metrics.enable()
+
+    for (day, part), target in TARGETS.items():
+        if args.days and day not in args.days:
+            continue
+
+        data, found, baseline = search(target, args.iterations, args.seed)
+        print(f'day {day} part {part}: {target.counter} {baseline:,} at random, {found:,} after {args.iterations} mutations')
+
+        if not args.dry_run:
+            write_result(target, data, found, args.iterations, args.seed)
+            print(f'  written to {os.path.relpath(adversarial_path(day, part), ROOT)}')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
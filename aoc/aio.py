@@ -0,0 +1,229 @@
+'''
+asyncio front-end for the solvers.
+
+    async with AsyncSolver(max_workers=4) as solver:
+        result = await solver.solve(23, 2, data, timeout=60)
+
+A solver keeps `max_workers` long-lived worker processes and gives each
+request to an idle one; the event loop only waits on the worker's pipe, so
+it stays free for I/O. Workers come from a forkserver, never from a fork of
+the (threaded) event loop process, and import every day once when they
+start, so they are warm by the time requests arrive. A request that times
+out or is cancelled kills its worker, which is the only way to stop a
+CPU-bound solver such as day 23's longest-path search, and only that worker
+is replaced. Solver errors are raised as RuntimeError.
+
+An AsyncSolver belongs to the event loop it is first used on; the
+module-level `solve` keeps one per loop.
+'''
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import weakref
+from time import perf_counter
+
+from aoc.days import PARTS, available_days, get_solver, input_path, load_day, read_input, solver_parts
+
+def _solve(day: int, part: int, data: str) -> dict:
+    try:
+        module = load_day(day)
+
+        start = perf_counter()
+        parsed = module.parse(data)
+        parse_time = perf_counter() - start
+
+        start = perf_counter()
+        answer = get_solver(module, part)(parsed)
+        solve_time = perf_counter() - start
+
+        return {'status': 'ok', 'answer': str(answer), 'parse': parse_time, 'solve': solve_time}
+    except Exception as error:
+        return {'status': 'error', 'error': f'{type(error).__name__}: {error}'}
+
+def _serve(conn, preload: bool):
+    if preload:
+        for day in available_days():
+            try:
+                load_day(day)
+            except ImportError:
+                pass
+
+    while True:
+        try:
+            day, part, data = conn.recv()
+        except EOFError:
+            return
+        conn.send(_solve(day, part, data))
+
+class Worker:
+    def __init__(self, context, preload: bool) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, preload), daemon=True)
+        self.process.start()
+        child.close()
+        # The request being written to the pipe from a thread, if any.
+        self.sending: asyncio.Future | None = None
+
+    def stop(self):
+        # Kill first, so a send still in progress fails on the broken pipe
+        # instead of writing to a descriptor closed under it.
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+        if self.sending is None or self.sending.done():
+            self.conn.close()
+        else:
+            self.sending.add_done_callback(self._close_after_send)
+
+    def _close_after_send(self, sending: asyncio.Future):
+        if not sending.cancelled():
+            sending.exception()
+        self.conn.close()
+
+class AsyncSolver:
+    def __init__(self, max_workers: int = None, preload: bool = True) -> None:
+        self.max_workers = max_workers or os.cpu_count()
+        self.preload = preload
+        self._loop = None
+        self._idle: asyncio.Queue | None = None
+        self._workers: list[Worker] = []
+
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        if self._context.get_start_method() == 'forkserver':
+            self._context.set_forkserver_preload(['aoc.days'])
+
+    async def __aenter__(self):
+        self._start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            raise RuntimeError('this AsyncSolver belongs to another event loop')
+
+        self._loop = loop
+        self._idle = asyncio.Queue()
+        for _ in range(self.max_workers):
+            self._add_worker()
+
+    def _add_worker(self):
+        worker = Worker(self._context, self.preload)
+        self._workers.append(worker)
+        self._idle.put_nowait(worker)
+
+    def _replace(self, worker: Worker):
+        worker.stop()
+        self._workers.remove(worker)
+        self._add_worker()
+
+    def close(self):
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+
+    async def solve(self, day: int, part: int, data: str, timeout: float = None) -> dict:
+        self._start()
+        worker = await self._idle.get()
+
+        try:
+            result = await asyncio.wait_for(self._run(worker, day, part, data), timeout)
+        except BaseException:
+            # Timed out or cancelled: the solver may still be running.
+            self._replace(worker)
+            raise
+
+        if worker.process.is_alive():
+            self._idle.put_nowait(worker)
+        else:
+            self._replace(worker)
+
+        if result['status'] != 'ok':
+            raise RuntimeError(f'day {day} part {part}: {result["error"]}')
+
+        return result
+
+    async def solve_file(self, day: int, part: int, path: str = None, timeout: float = None) -> dict:
+        data = await asyncio.to_thread(read_input, path or input_path(day))
+        return await self.solve(day, part, data, timeout)
+
+    async def _run(self, worker: Worker, day: int, part: int, data: str) -> dict:
+        loop = asyncio.get_running_loop()
+        # Shielded: cancelling the await must not abandon the thread mid-write.
+        worker.sending = asyncio.ensure_future(asyncio.to_thread(worker.conn.send, (day, part, data)))
+        await asyncio.shield(worker.sending)
+        worker.sending = None
+
+        ready = loop.create_future()
+        loop.add_reader(worker.conn.fileno(), lambda: ready.done() or ready.set_result(None))
+
+        try:
+            await ready
+            try:
+                return worker.conn.recv()
+            except (EOFError, ConnectionError):
+                worker.process.join()
+                return {'status': 'error', 'error': f'worker exited with code {worker.process.exitcode}'}
+        finally:
+            loop.remove_reader(worker.conn.fileno())
+
+_defaults: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+async def solve(day: int, part: int, data: str, timeout: float = None) -> dict:
+    loop = asyncio.get_running_loop()
+
+    if loop not in _defaults:
+        # Solvers of loops that have ended only hold idle workers.
+        for old_loop, old in list(_defaults.items()):
+            if old_loop.is_closed():
+                old.close()
+                del _defaults[old_loop]
+        _defaults[loop] = AsyncSolver()
+
+    return await _defaults[loop].solve(day, part, data, timeout)
+
+async def solve_all(days: list[int], parts: tuple[int, ...], jobs: int, timeout: float | None):
+    async with AsyncSolver(jobs) as solver:
+        async def run(day: int, part: int) -> dict:
+            start = perf_counter()
+            try:
+                result = await solver.solve_file(day, part, timeout=timeout)
+            except asyncio.TimeoutError:
+                result = {'status': 'timeout', 'error': f'no answer after {timeout}s'}
+            except RuntimeError as error:
+                result = {'status': 'error', 'error': str(error)}
+
+            return {'day': day, 'part': part, **result, 'latency': perf_counter() - start}
+
+        tasks = [run(day, part) for day in days for part in solver_parts(day) if part in parts]
+        for task in asyncio.as_completed(tasks):
+            print(json.dumps(await task), flush=True)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Solve days concurrently through the asyncio front-end.')
+    parser.add_argument('days', nargs='*', type=int, help='days to run (default: all)')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only run the given part')
+    parser.add_argument('--jobs', type=int, default=0, help='concurrent worker processes, 0 for one per CPU')
+    parser.add_argument('--timeout', type=float, help='seconds before a request is cancelled')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    parts = tuple(args.part) if args.part else PARTS
+
+    asyncio.run(solve_all(args.days or available_days(), parts, args.jobs or os.cpu_count(), args.timeout))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
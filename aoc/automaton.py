@@ -0,0 +1,85 @@
+'''
+Aho-Corasick automaton over a fixed set of patterns.
+
+The trie of the patterns is completed into a DFA: every state has a
+transition for every character that appears in some pattern, and any other
+character leads back to the root. A scan is then one dict lookup per
+character, with no failure links to follow and no copy of the text. Every
+state knows all the patterns that end there, its own and those reached
+through its suffixes, so overlapping matches such as the `eight` and `two`
+of `eightwo` are both reported.
+'''
+
+from collections import deque
+from typing import Any, Iterator
+
+class Automaton:
+    def __init__(self, patterns: dict[str, Any]) -> None:
+        if not patterns or '' in patterns:
+            raise ValueError('patterns must be non-empty strings')
+
+        self.patterns = dict(patterns)
+        self.delta: list[dict[str, int]] = [{}]
+        # (length, value) of every pattern ending in each state.
+        self.outputs: list[tuple[tuple[int, Any], ...]] = [()]
+
+        for pattern, value in self.patterns.items():
+            state = 0
+            for char in pattern:
+                if char not in self.delta[state]:
+                    self.delta[state][char] = len(self.delta)
+                    self.delta.append({})
+                    self.outputs.append(())
+                state = self.delta[state][char]
+            self.outputs[state] = ((len(pattern), value),)
+
+        alphabet = {char for pattern in self.patterns for char in pattern}
+        fail = [0] * len(self.delta)
+        queue = deque()
+
+        for char in alphabet:
+            child = self.delta[0].setdefault(char, 0)
+            if child:
+                queue.append(child)
+
+        # Breadth first, so a state's failure target is complete before it is used.
+        while queue:
+            state = queue.popleft()
+            self.outputs[state] += self.outputs[fail[state]]
+
+            for char in alphabet:
+                child = self.delta[state].get(char)
+                if child is None:
+                    self.delta[state][char] = self.delta[fail[state]][char]
+                else:
+                    fail[child] = self.delta[fail[state]][char]
+                    queue.append(child)
+
+    def matches(self, text: str) -> Iterator[tuple[int, Any]]:
+        # (start, value) of every match, in the order they end.
+        delta, outputs = self.delta, self.outputs
+        state = 0
+
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            for length, value in outputs[state]:
+                yield end - length, value
+
+    def first_last(self, text: str) -> tuple[Any, Any] | None:
+        # Values of the matches that start first and last, in a single pass.
+        delta, outputs = self.delta, self.outputs
+        state = 0
+        first = last = None
+        first_start = len(text)
+        last_start = -1
+
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            for length, value in outputs[state]:
+                start = end - length
+                if start < first_start:
+                    first_start, first = start, value
+                if start > last_start:
+                    last_start, last = start, value
+
+        return None if last_start < 0 else (first, last)
@@ -0,0 +1,116 @@
+'''
+Run one day's solvers over a directory of inputs.
+
+The inputs are spread over a process pool and every result is printed as a
+JSON line as soon as it finishes, so the output can be piped while the batch
+is still running. A throughput and latency summary goes to stderr at the end.
+'''
+
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+
+from aoc.bench import percentile
+from aoc.days import PARTS, get_solver, load_day, read_input, reset_caches, solver_parts
+from aoc.runner import format_seconds
+
+def solve_file(day: int, parts: tuple[int, ...], path: str) -> dict:
+    start = perf_counter()
+    result = {'input': path, 'status': 'ok', 'parts': {}}
+
+    try:
+        module = load_day(day)
+        parsed = module.parse(read_input(path))
+        result['parse'] = perf_counter() - start
+
+        for part in parts:
+            reset_caches(module)
+            part_start = perf_counter()
+            answer = get_solver(module, part)(parsed)
+            result['parts'][str(part)] = {'answer': str(answer), 'time': perf_counter() - part_start}
+    except Exception as error:
+        result['status'] = 'error'
+        result['error'] = f'{type(error).__name__}: {error}'
+
+    result['latency'] = perf_counter() - start
+    return result
+
+def input_files(directory: str, pattern: str) -> list[str]:
+    return sorted(path for path in glob.glob(os.path.join(directory, pattern)) if os.path.isfile(path))
+
+def run_batch(day: int, parts: tuple[int, ...], paths: list[str], jobs: int, out=sys.stdout) -> dict:
+    latencies = []
+    errors = 0
+    start = perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(solve_file, day, parts, path) for path in paths]
+
+        for future in as_completed(futures):
+            result = future.result()
+            latencies.append(result['latency'])
+            if result['status'] != 'ok':
+                errors += 1
+
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+
+    wall = perf_counter() - start
+
+    return {
+        'day': day,
+        'inputs': len(paths),
+        'errors': errors,
+        'jobs': jobs,
+        'wall': wall,
+        'throughput': len(paths) / wall if wall > 0 else None,
+        'p50': percentile(latencies, 50) if latencies else None,
+        'p95': percentile(latencies, 95) if latencies else None,
+        'p99': percentile(latencies, 99) if latencies else None,
+        'max': max(latencies, default=None),
+    }
+
+def format_summary(summary: dict) -> str:
+    throughput = '-' if summary['throughput'] is None else f'{summary["throughput"]:.1f}'
+
+    return (
+        f'day {summary["day"]}: {summary["inputs"]} inputs, {summary["errors"]} errors, '
+        f'{summary["jobs"]} job(s), wall {format_seconds(summary["wall"])}, {throughput} inputs/s\n'
+        f'latency p50 {format_seconds(summary["p50"])}, p95 {format_seconds(summary["p95"])}, '
+        f'p99 {format_seconds(summary["p99"])}, max {format_seconds(summary["max"])}'
+    )
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run one day over every input file in a directory.')
+    parser.add_argument('day', type=int)
+    parser.add_argument('directory', help='directory holding the input files')
+    parser.add_argument('--pattern', default='*.txt', help='glob for the input files inside the directory')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only run the given part')
+    parser.add_argument('--jobs', type=int, default=0, help='worker processes, 0 for one per CPU')
+    parser.add_argument('--summary-json', action='store_true', help='print the summary to stderr as JSON')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    parts = tuple(part for part in solver_parts(args.day) if args.part is None or part in args.part)
+    paths = input_files(args.directory, args.pattern)
+
+    if not paths:
+        print(f'no files match {os.path.join(args.directory, args.pattern)}', file=sys.stderr)
+        return 2
+
+    summary = run_batch(args.day, parts, paths, args.jobs or os.cpu_count())
+
+    if args.summary_json:
+        print(json.dumps(summary), file=sys.stderr)
+    else:
+        print(format_summary(summary), file=sys.stderr)
+
+    return 1 if summary['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
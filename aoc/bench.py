@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+
+from aoc.budget import run_budgeted
+from aoc.days import (
+    BASELINE_PATH,
+    PARTS,
+    ROOT,
+    adversarial_input_paths,
+    available_days,
+    input_path,
+    module_path,
+    solver_parts,
+    test_input_paths,
+)
+from aoc.runner import format_seconds
+
+BASELINE_VERSION = 1
+
+# Fixtures that only exist for the other part or that the solver cannot handle
+# (hard-coded module names, assumptions about the real input's shape).
+FIXTURE_SKIPS = {
+    ('day-1-input-2.test.txt', 1): 'fixture is for part 2 only',
+    ('day-20-input.test.txt', 2): 'solver expects the conjunctions of the real input',
+    ('day-21-input.test.txt', 2): 'solver expects a square grid with the start in the middle',
+}
+
+ANSWER_PATTERN = re.compile(r'Your puzzle answer was (\S+?)\.')
+
+def expected_answers(day: int) -> dict[int, str]:
+    with open(module_path(day), 'r') as file:
+        answers = ANSWER_PATTERN.findall(file.read())
+
+    return {part: answer for part, answer in zip(PARTS, answers)}
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+def measure(
+    day: int,
+    part: int,
+    path: str,
+    repeat: int,
+    timeout: float | None,
+    cache: bool = False,
+    memory_limit: int | None = None
+) -> dict:
+    result = run_budgeted(day, part, path, repeat, timeout, memory_limit, cache)
+    del result['wall']
+
+    if result['status'] == 'ok':
+        times = result.pop('times')
+        result['median'] = statistics.median(times)
+        result['p95'] = percentile(times, 95)
+        result['runs'] = len(times)
+
+    return result
+
+def cases(days: list[int], include_tests: bool, include_adversarial: bool = True) -> list[tuple[int, int, str]]:
+    all_cases = []
+
+    for day in days:
+        paths = [input_path(day)]
+        if include_tests:
+            paths += test_input_paths(day)
+
+        for path in paths:
+            for part in solver_parts(day):
+                if (os.path.basename(path), part) in FIXTURE_SKIPS:
+                    continue
+                all_cases.append((day, part, path))
+
+        if include_adversarial:
+            for part, path in adversarial_input_paths(day):
+                all_cases.append((day, part, path))
+
+    return all_cases
+
+def case_key(day: int, part: int, path: str) -> str:
+    return f'{day}/{part}/{os.path.basename(path)}'
+
+def run_benchmarks(
+    days: list[int],
+    repeat: int,
+    timeout: float | None,
+    include_tests: bool,
+    cache: bool = False,
+    memory_limit: int | None = None,
+    include_adversarial: bool = True
+) -> dict[str, dict]:
+    results = {}
+
+    for day, part, path in cases(days, include_tests, include_adversarial):
+        result = measure(day, part, path, repeat, timeout, cache, memory_limit)
+        result['day'] = day
+        result['part'] = part
+        result['input'] = os.path.relpath(path, ROOT)
+
+        if path == input_path(day):
+            result['expected'] = expected_answers(day).get(part)
+
+        results[case_key(day, part, path)] = result
+
+    return results
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {'version': BASELINE_VERSION, 'results': {}}
+
+    with open(path, 'r') as file:
+        baseline = json.load(file)
+
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f'baseline {path} has version {baseline.get("version")}, expected {BASELINE_VERSION}')
+
+    return baseline
+
+def save_baseline(path: str, results: dict[str, dict]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    baseline = {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        # Failures depend on the machine (a missing optional dependency, say)
+        # and would only hide regressions, so they are never recorded.
+        'results': {key: result for key, result in results.items() if result['status'] == 'ok'},
+    }
+
+    with open(path, 'w') as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+def compare(results: dict[str, dict], baseline: dict, threshold: float, noise: float) -> list[str]:
+    failures = []
+
+    for key, result in results.items():
+        previous = baseline['results'].get(key)
+
+        if result['status'] != 'ok':
+            failures.append(f'{key}: {result["status"]} ({result["error"]})')
+            continue
+
+        expected = result.get('expected')
+        if expected is None and previous is not None and previous['status'] == 'ok':
+            expected = previous['answer']
+
+        if expected is not None and result['answer'] != expected:
+            failures.append(f'{key}: answer {result["answer"]} != expected {expected}')
+
+        if previous is None or previous['status'] != 'ok':
+            continue
+
+        limit = previous['median'] * (1 + threshold / 100)
+        if result['median'] > limit and result['median'] - previous['median'] > noise:
+            change = (result['median'] / previous['median'] - 1) * 100
+            failures.append(
+                f'{key}: median {format_seconds(result["median"])} is {change:.1f}% slower '
+                f'than baseline {format_seconds(previous["median"])}'
+            )
+
+    return failures
+
+def format_report(results: dict[str, dict], baseline: dict) -> str:
+    lines = [f'{"case":<32} {"status":>8} {"answer":>18} {"median":>10} {"p95":>10} {"rss":>9} {"change":>8}']
+
+    for key, result in results.items():
+        if result['status'] != 'ok':
+            lines.append(f'{key:<32} {result["status"]:>8}  {result["error"]}')
+            continue
+
+        change = '-'
+        previous = baseline['results'].get(key)
+        if previous is not None and previous['status'] == 'ok':
+            change = f'{(result["median"] / previous["median"] - 1) * 100:+.1f}%'
+
+        lines.append(
+            f'{key:<32} {result["status"]:>8} {result["answer"]:>18} '
+            f'{format_seconds(result["median"]):>10} {format_seconds(result["p95"]):>10} '
+            f'{result["peak_rss"] / 2 ** 20:>7.1f}MB {change:>8}'
+        )
+
+    return '\n'.join(lines)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark the day-N solvers against a stored baseline.')
+    parser.add_argument('days', nargs='*', type=int, help='days to benchmark (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds before a case is killed')
+    parser.add_argument('--memory-limit', type=float, help='megabytes of resident memory before a case is killed')
+    parser.add_argument('--no-tests', action='store_true', help='skip the .test.txt fixtures')
+    parser.add_argument('--no-adversarial', action='store_true', help='skip the worst-case inputs in benchmarks/adversarial/')
+    parser.add_argument('--cache', action='store_true', help='load parsed inputs from the on-disk cache (see aoc.cache)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=10, help='allowed median slowdown in percent')
+    parser.add_argument('--noise', type=float, default=0.002, help='slowdowns below this many seconds are ignored')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    days = args.days or available_days()
+
+    baseline = load_baseline(args.baseline)
+    memory_limit = None if args.memory_limit is None else int(args.memory_limit * 2 ** 20)
+    results = run_benchmarks(days, args.repeat, args.timeout, not args.no_tests, args.cache, memory_limit, not args.no_adversarial)
+
+    print(format_report(results, baseline))
+
+    failures = compare(results, baseline, args.threshold, args.noise)
+    for failure in failures:
+        print(f'FAIL {failure}', file=sys.stderr)
+
+    if args.save:
+        merged = {**baseline['results'], **results}
+        save_baseline(args.baseline, merged)
+        print(f'baseline written to {os.path.relpath(args.baseline, ROOT)}')
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+'''
+Run a solver in a child process under a wall-clock and a memory budget.
+
+The parent polls the child's resident set size (from /proc, so the memory
+budget is only enforced while running on Linux; the child's own peak is
+checked again when it finishes) and kills it as soon as either budget is
+exceeded. The result's status says which one: 'timeout' or 'memory'.
+'''
+
+import multiprocessing
+import os
+import resource
+import sys
+from time import perf_counter
+
+from aoc.days import get_solver, load_day, read_input, reset_caches
+from aoc.runner import cache, incremental, time_call
+
+POLL_INTERVAL = 0.05
+
+def peak_rss() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+def current_rss(pid: int) -> int | None:
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _worker(conn, day: int, part: int, path: str, repeat: int, use_cache: bool):
+    try:
+        module = load_day(day)
+        solver = get_solver(module, part)
+        data = read_input(path)
+        parse = (lambda data: cache.cached_parse(day, data)) if use_cache else module.parse
+        parsed, parse_times = time_call(parse, data, 1)
+        answer, times = time_call(solver, parsed, repeat, lambda: reset_caches(module))
+        if incremental.enabled():
+            incremental.save()
+        conn.send({
+            'status': 'ok',
+            'answer': str(answer),
+            'parse': parse_times[0],
+            'times': times,
+            'peak_rss': peak_rss(),
+        })
+    except Exception as error:
+        conn.send({'status': 'error', 'error': f'{type(error).__name__}: {error}'})
+    finally:
+        conn.close()
+
+def format_megabytes(size: int) -> str:
+    return f'{size / 2 ** 20:.1f}MB'
+
+def run_budgeted(
+    day: int,
+    part: int,
+    path: str,
+    repeat: int = 1,
+    time_limit: float | None = None,
+    memory_limit: int | None = None,
+    use_cache: bool = False
+) -> dict:
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_worker, args=(sender, day, part, path, repeat, use_cache))
+    start = perf_counter()
+    process.start()
+    sender.close()
+
+    deadline = None if time_limit is None else start + time_limit
+    result = None
+
+    while result is None:
+        wait = None if deadline is None else max(0, deadline - perf_counter())
+        if memory_limit is not None:
+            wait = POLL_INTERVAL if wait is None else min(wait, POLL_INTERVAL)
+
+        if receiver.poll(wait):
+            try:
+                result = receiver.recv()
+            except EOFError:
+                result = {'status': 'error', 'error': f'worker exited with code {process.exitcode}'}
+            break
+
+        rss = current_rss(process.pid) if memory_limit is not None else None
+        if rss is not None and rss > memory_limit:
+            result = {'status': 'memory', 'error': f'resident memory {format_megabytes(rss)} over the {format_megabytes(memory_limit)} budget'}
+        elif deadline is not None and perf_counter() >= deadline:
+            result = {'status': 'timeout', 'error': f'no answer after {time_limit}s'}
+
+    if process.is_alive():
+        process.kill()
+    process.join()
+    receiver.close()
+
+    # A short spike can fall between two polls; the child's own peak catches it.
+    if result['status'] == 'ok' and memory_limit is not None and result['peak_rss'] > memory_limit:
+        result = {'status': 'memory', 'error': f'peak memory {format_megabytes(result["peak_rss"])} over the {format_megabytes(memory_limit)} budget'}
+
+    result['wall'] = perf_counter() - start
+    return result
@@ -0,0 +1,152 @@
+'''
+On-disk cache of parsed inputs.
+
+Each entry is the pickled result of a day's `parse`, stored under
+.cache/parsed/day-N/ and named after the SHA-256 of the day's source and of
+the input text, so editing either one simply misses the cache. Entries are
+memory-mapped and unpickled on later runs instead of parsing the text again.
+'''
+
+import argparse
+import ast
+import hashlib
+import mmap
+import os
+import pickle
+import shutil
+import sys
+from typing import Any
+
+from aoc.days import ROOT, available_days, input_path, load_day, module_path, read_input
+
+CACHE_DIR = os.path.join(ROOT, '.cache', 'parsed')
+
+# Linked structures such as day-22's settled bricks pickle recursively.
+PICKLE_RECURSION_LIMIT = 20000
+
+def source_paths(day: int) -> list[str]:
+    # The day's own file plus the shared aoc modules it imports, such as aoc.grid.
+    with open(module_path(day), 'r') as file:
+        tree = ast.parse(file.read())
+
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == 'aoc':
+            # `from aoc import incremental, metrics` names the modules themselves.
+            modules += [f'aoc.{alias.name}' for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.module.startswith('aoc.'):
+            modules.append(node.module)
+        elif isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names if alias.name.startswith('aoc.')]
+
+    paths = [module_path(day)]
+    for module in modules:
+        path = os.path.join(ROOT, *module.split('.')) + '.py'
+        if not os.path.exists(path):
+            # A name defined in aoc/__init__.py rather than a module.
+            path = os.path.join(ROOT, 'aoc', '__init__.py')
+        if path not in paths:
+            paths.append(path)
+
+    return paths
+
+def source_hash(day: int) -> str:
+    digest = hashlib.sha256()
+    for path in source_paths(day):
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+def cache_path(day: int, data: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(source_hash(day).encode())
+    digest.update(data.encode())
+    return os.path.join(CACHE_DIR, f'day-{day}', f'{digest.hexdigest()}.pickle')
+
+def load(path: str) -> Any:
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return pickle.loads(buffer)
+
+def store(path: str, parsed: Any) -> bool:
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, PICKLE_RECURSION_LIMIT))
+    try:
+        payload = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+        return False
+    finally:
+        sys.setrecursionlimit(limit)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so concurrent runs never map a half-written file.
+    partial = f'{path}.{os.getpid()}.tmp'
+    with open(partial, 'wb') as file:
+        file.write(payload)
+    os.replace(partial, path)
+
+    return True
+
+def cached_parse(day: int, data: str) -> Any:
+    path = cache_path(day, data)
+    # Imported first: pickles may reference the day's own classes.
+    module = load_day(day)
+
+    if os.path.exists(path):
+        try:
+            return load(path)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ModuleNotFoundError):
+            # Unreadable or stale entry; parse again and overwrite it.
+            pass
+
+    parsed = module.parse(data)
+    store(path, parsed)
+
+    return parsed
+
+def clear(days: list[int] = None):
+    if days is None:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        return
+
+    for day in days:
+        shutil.rmtree(os.path.join(CACHE_DIR, f'day-{day}'), ignore_errors=True)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Fill or clear the on-disk cache of parsed inputs.')
+    parser.add_argument('days', nargs='*', type=int, help='days to cache (default: all)')
+    parser.add_argument('--input', help='input file to use instead of day-N-input.txt (single day only)')
+    parser.add_argument('--clear', action='store_true', help='remove the cached entries instead')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    days = args.days or available_days()
+
+    if args.input and len(days) != 1:
+        print('--input requires exactly one day', file=sys.stderr)
+        return 2
+
+    if args.clear:
+        clear(args.days or None)
+        return 0
+
+    for day in days:
+        try:
+            data = read_input(args.input or input_path(day))
+            cached_parse(day, data)
+        except ImportError as error:
+            print(f'skipping day {day}: {error}', file=sys.stderr)
+            continue
+
+        path = cache_path(day, data)
+        if os.path.exists(path):
+            print(f'day {day}: {os.path.getsize(path)} bytes in {os.path.relpath(path, ROOT)}')
+        else:
+            print(f'day {day}: parsed input cannot be pickled, not cached')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,326 @@
+'''
+Spread (day, part, input) jobs over worker processes on any number of hosts.
+
+    AOC_AUTHKEY=... python -m aoc.cluster --address 0.0.0.0:50000 coordinator 12 16 23
+    AOC_AUTHKEY=... python -m aoc.cluster --address coordinator-host:50000 worker
+
+The coordinator serves a job board through multiprocessing.managers. Jobs
+carry the input text, so workers need the repository but not the inputs.
+A worker keeps every day loaded (see aoc.server), takes one job at a time
+and sends a heartbeat while it solves it. A job whose worker stops
+heartbeating is handed out again, at most MAX_ATTEMPTS times. The results
+are printed as JSON lines as they come in, and a summary follows at the end.
+
+The managers unpickle whatever a peer sends, so the authkey is all that
+stands between the network and code execution on either side. There is no
+default: both sides take --authkey or $AOC_AUTHKEY. A coordinator given
+neither makes up a random key and prints it, and then only listens on a
+loopback address.
+'''
+
+import argparse
+import ipaddress
+import json
+import os
+import secrets
+import socket
+import sys
+import threading
+from collections import Counter, deque
+from multiprocessing.managers import BaseManager
+from time import monotonic, perf_counter, sleep
+
+from aoc.batch import input_files
+from aoc.days import PARTS, ROOT, input_path, read_input, solver_parts
+from aoc.runner import format_seconds
+from aoc.server import SolverState
+
+DEFAULT_ADDRESS = '127.0.0.1:50000'
+
+HEARTBEAT_INTERVAL = 1.0
+# A lease not renewed for this long belongs to a dead or stuck worker.
+LEASE_TIMEOUT = 10.0
+MAX_ATTEMPTS = 3
+IDLE_POLL = 0.2
+# Workers may be started before the coordinator.
+CONNECT_TIMEOUT = 30.0
+
+class JobBoard:
+    def __init__(self, jobs: list[dict]) -> None:
+        self.lock = threading.Lock()
+        self.pending = deque(jobs)
+        self.total = len(jobs)
+        self.leases: dict[int, tuple[dict, str, float]] = {}
+        self.attempts: Counter = Counter()
+        self.results: list[dict] = []
+        self.workers: set[str] = set()
+
+    def take(self, worker: str) -> dict | None:
+        # None means no job right now; a job with 'stop' means the board is done.
+        with self.lock:
+            self.workers.add(worker)
+            if len(self.results) == self.total:
+                return {'stop': True}
+            if not self.pending:
+                return None
+
+            job = self.pending.popleft()
+            self.attempts[job['id']] += 1
+            self.leases[job['id']] = (job, worker, monotonic())
+            return job
+
+    def heartbeat(self, worker: str, job_id: int) -> bool:
+        with self.lock:
+            lease = self.leases.get(job_id)
+            if lease is None or lease[1] != worker:
+                # The job was given to someone else in the meantime.
+                return False
+            self.leases[job_id] = (lease[0], worker, monotonic())
+            return True
+
+    def complete(self, worker: str, job_id: int, result: dict) -> bool:
+        with self.lock:
+            lease = self.leases.pop(job_id, None)
+            if lease is None or lease[1] != worker:
+                if lease is not None:
+                    self.leases[job_id] = lease
+                return False
+
+            job = lease[0]
+            self.results.append({
+                'id': job_id,
+                'day': job['day'],
+                'part': job['part'],
+                'input': job['input'],
+                **result,
+                'worker': worker,
+                'attempts': self.attempts[job_id],
+            })
+            return True
+
+    def expire(self) -> list[dict]:
+        # Requeue the jobs of silent workers, or fail them after MAX_ATTEMPTS.
+        now = monotonic()
+        failed = []
+
+        with self.lock:
+            for job_id, (job, worker, renewed) in list(self.leases.items()):
+                if now - renewed < LEASE_TIMEOUT:
+                    continue
+
+                del self.leases[job_id]
+                if self.attempts[job_id] < MAX_ATTEMPTS:
+                    self.pending.appendleft(job)
+                    continue
+
+                result = {
+                    'id': job_id,
+                    'day': job['day'],
+                    'part': job['part'],
+                    'input': job['input'],
+                    'status': 'error',
+                    'error': f'no answer after {MAX_ATTEMPTS} attempts, last on {worker}',
+                    'worker': worker,
+                    'attempts': self.attempts[job_id],
+                }
+                self.results.append(result)
+                failed.append(result)
+
+        return failed
+
+    def results_since(self, start: int) -> list[dict]:
+        with self.lock:
+            return self.results[start:]
+
+    def finished(self) -> bool:
+        with self.lock:
+            return len(self.results) == self.total
+
+class BoardManager(BaseManager):
+    pass
+
+def parse_address(address: str) -> tuple[str, int]:
+    host, port = address.rsplit(':', 1)
+    return host, int(port)
+
+def is_loopback(host: str) -> bool:
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def make_jobs(days: list[int], parts: tuple[int, ...], directory: str = None, pattern: str = '*.txt') -> list[dict]:
+    jobs = []
+
+    for day in days:
+        paths = input_files(directory, pattern) if directory else [input_path(day)]
+        for path in paths:
+            data = read_input(path)
+            for part in solver_parts(day):
+                if part in parts:
+                    jobs.append({'id': len(jobs), 'day': day, 'part': part, 'input': os.path.relpath(path, ROOT), 'data': data})
+
+    return jobs
+
+def coordinate(jobs: list[dict], address: tuple[str, int], authkey: bytes, out=sys.stdout) -> dict:
+    board = JobBoard(jobs)
+    BoardManager.register('board', callable=lambda: board)
+    server = BoardManager(address=address, authkey=authkey).get_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f'coordinating {len(jobs)} jobs on {address[0]}:{address[1]}', file=sys.stderr)
+
+    start = perf_counter()
+    reported = 0
+
+    while True:
+        board.expire()
+        for result in board.results_since(reported):
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+            reported += 1
+
+        if board.finished():
+            break
+        sleep(IDLE_POLL)
+
+    wall = perf_counter() - start
+    # Let idle workers pick up the stop job before the server goes away.
+    sleep(IDLE_POLL * 2)
+
+    return {
+        'jobs': len(jobs),
+        'errors': sum(result['status'] != 'ok' for result in board.results),
+        'retried': sum(result['attempts'] > 1 for result in board.results),
+        'workers': len(board.workers),
+        'by_worker': dict(Counter(result['worker'] for result in board.results)),
+        'wall': wall,
+        'throughput': len(jobs) / wall if wall > 0 else None,
+    }
+
+def connect(address: tuple[str, int], authkey: bytes):
+    BoardManager.register('board')
+    manager = BoardManager(address=address, authkey=authkey)
+    manager.connect()
+    return manager.board()
+
+def heartbeat(address: tuple[str, int], authkey: bytes, worker: str, job_id: int, done: threading.Event):
+    # Proxies are not shared between threads, so this one has its own connection.
+    board = connect(address, authkey)
+    while not done.wait(HEARTBEAT_INTERVAL):
+        if not board.heartbeat(worker, job_id):
+            return
+
+def work(address: tuple[str, int], authkey: bytes, name: str = None, wait: float = CONNECT_TIMEOUT):
+    state = SolverState()
+    worker = name or f'{socket.gethostname()}:{os.getpid()}'
+
+    deadline = monotonic() + wait
+    while True:
+        try:
+            board = connect(address, authkey)
+            break
+        except ConnectionRefusedError:
+            if monotonic() >= deadline:
+                raise
+            sleep(IDLE_POLL)
+
+    print(f'worker {worker} connected to {address[0]}:{address[1]}', file=sys.stderr)
+
+    try:
+        while True:
+            job = board.take(worker)
+            if job is None:
+                sleep(IDLE_POLL)
+                continue
+            if job.get('stop'):
+                return
+
+            done = threading.Event()
+            beat = threading.Thread(target=heartbeat, args=(address, authkey, worker, job['id'], done), daemon=True)
+            beat.start()
+
+            try:
+                response = state.solve(job)
+                result = {key: response[key] for key in ('status', 'answer', 'parse', 'solve')}
+            except Exception as error:
+                result = {'status': 'error', 'error': f'{type(error).__name__}: {error}'}
+            finally:
+                done.set()
+                beat.join()
+
+            board.complete(worker, job['id'], result)
+    except (EOFError, ConnectionError):
+        # The coordinator finished or went away.
+        return
+
+def format_summary(summary: dict) -> str:
+    throughput = '-' if summary['throughput'] is None else f'{summary["throughput"]:.2f}'
+    per_worker = ', '.join(f'{worker} {count}' for worker, count in sorted(summary['by_worker'].items()))
+
+    return (
+        f'{summary["jobs"]} jobs, {summary["errors"]} errors, {summary["retried"]} retried, '
+        f'{summary["workers"]} worker(s), wall {format_seconds(summary["wall"])}, {throughput} jobs/s\n'
+        f'jobs per worker: {per_worker}'
+    )
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Distribute solver jobs from a coordinator to workers on other processes or hosts.')
+    parser.add_argument('--address', default=DEFAULT_ADDRESS, help='host:port the coordinator listens on')
+    parser.add_argument('--authkey', default=os.environ.get('AOC_AUTHKEY'), help='shared secret (default: $AOC_AUTHKEY)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    coordinator = commands.add_parser('coordinator', help='hand out jobs and collect the results')
+    coordinator.add_argument('days', nargs='+', type=int)
+    coordinator.add_argument('--part', type=int, choices=PARTS, action='append', help='only run the given part')
+    coordinator.add_argument('--directory', help='solve every file in this directory instead of day-N-input.txt (single day only)')
+    coordinator.add_argument('--pattern', default='*.txt', help='glob for the input files inside the directory')
+    coordinator.add_argument('--summary-json', action='store_true', help='print the summary to stderr as JSON')
+
+    worker = commands.add_parser('worker', help='solve jobs until the coordinator is done')
+    worker.add_argument('--name', help='worker name in the results (default: host:pid)')
+    worker.add_argument('--wait', type=float, default=CONNECT_TIMEOUT, help='seconds to keep trying to reach the coordinator')
+
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    address = parse_address(args.address)
+
+    if args.command == 'worker':
+        if not args.authkey:
+            print('workers need the coordinator\'s key: pass --authkey or set AOC_AUTHKEY', file=sys.stderr)
+            return 2
+        work(address, args.authkey.encode(), args.name, args.wait)
+        return 0
+
+    if args.directory and len(args.days) != 1:
+        print('--directory requires exactly one day', file=sys.stderr)
+        return 2
+
+    authkey = args.authkey
+    if not authkey:
+        if not is_loopback(address[0]):
+            print(f'refusing to listen on {address[0]} without --authkey or AOC_AUTHKEY', file=sys.stderr)
+            return 2
+        authkey = secrets.token_hex(16)
+        print(f'no authkey given, workers must use AOC_AUTHKEY={authkey}', file=sys.stderr)
+
+    parts = tuple(args.part) if args.part else PARTS
+    jobs = make_jobs(args.days, parts, args.directory, args.pattern)
+    if not jobs:
+        print('no jobs to run', file=sys.stderr)
+        return 2
+
+    summary = coordinate(jobs, address, authkey.encode())
+
+    if args.summary_json:
+        print(json.dumps(summary), file=sys.stderr)
+    else:
+        print(format_summary(summary), file=sys.stderr)
+
+    return 1 if summary['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
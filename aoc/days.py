@@ -0,0 +1,76 @@
+import ast
+import glob
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+PROFILE_DIR = os.path.join(ROOT, 'profiles')
+ADVERSARIAL_DIR = os.path.join(ROOT, 'benchmarks', 'adversarial')
+
+TOTAL_DAYS = 25
+PARTS = (1, 2)
+
+_modules: dict[int, ModuleType] = {}
+
+def day_dir(day: int) -> str:
+    return os.path.join(ROOT, f'day-{day}')
+
+def module_path(day: int) -> str:
+    return os.path.join(day_dir(day), f'day-{day}.py')
+
+def input_path(day: int) -> str:
+    return os.path.join(day_dir(day), f'day-{day}-input.txt')
+
+def test_input_paths(day: int) -> list[str]:
+    return sorted(glob.glob(os.path.join(day_dir(day), f'day-{day}-input*.test.txt')))
+
+def adversarial_input_paths(day: int) -> list[tuple[int, str]]:
+    # Worst-case inputs found by aoc.adversarial, each for one part.
+    paths = glob.glob(os.path.join(ADVERSARIAL_DIR, f'day-{day}-part-*.txt'))
+    return sorted((int(path[:-len('.txt')].rsplit('-', 1)[1]), path) for path in paths)
+
+def available_days() -> list[int]:
+    return [day for day in range(1, TOTAL_DAYS + 1) if os.path.exists(module_path(day))]
+
+def load_day(day: int) -> ModuleType:
+    if day in _modules:
+        return _modules[day]
+
+    spec = importlib.util.spec_from_file_location(f'day_{day}', module_path(day))
+    if spec is None or spec.loader is None:
+        raise ImportError(f'day {day} has no solver at {module_path(day)}')
+
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that pickle can find the classes of parsed inputs.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    _modules[day] = module
+
+    return module
+
+def get_solver(module: ModuleType, part: int) -> Callable | None:
+    return getattr(module, f'solve0{part}', None)
+
+def solver_parts(day: int) -> tuple[int, ...]:
+    # Read the parts from the source so that callers don't have to import the
+    # module (and its dependencies) just to know what it provides.
+    with open(module_path(day), 'r') as file:
+        tree = ast.parse(file.read())
+
+    names = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    return tuple(part for part in PARTS if f'solve0{part}' in names)
+
+def read_input(path: str) -> str:
+    with open(path, 'r') as file:
+        return file.read()
+
+def reset_caches(module: ModuleType):
+    # Solvers such as day-12's `count` memoize with functools.cache; clear them
+    # so that every timed run starts cold instead of replaying the first one.
+    for value in vars(module).values():
+        if callable(value) and hasattr(value, 'cache_clear'):
+            value.cache_clear()
@@ -0,0 +1,163 @@
+'''
+Differential tests of alternative engines against the reference solvers.
+
+The reference is a day's `solve01`/`solve02` on its `parse` output. An
+engine is any other way a day module offers to get the same answer:
+
+    solve01_<name>(parsed)   same parsed input, e.g. solve01_automaton, or
+                             the output of parse_<name>(data) if the day has one
+    stream01(lines)          the lines streamed from disk by aoc.stream
+    chunk01(buffer)          summed over the raw chunks aoc.stream maps
+
+Both run on the real input and on generated inputs of growing scale. Every
+answer is compared with the reference's and the end-to-end time (reading
+and parsing included) gives the speedup per input size.
+'''
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.days import PARTS, available_days, get_solver, input_path, load_day, read_input, reset_caches, solver_parts
+from aoc.generators import DEFAULT_SEED, write_generated
+from aoc.runner import format_seconds
+from aoc.stream import iter_byte_chunks, iter_lines
+
+def engines(module: ModuleType, part: int) -> dict[str, Callable[[str], Any]]:
+    found = {}
+    prefix = f'solve0{part}_'
+
+    for name, fn in vars(module).items():
+        if name.startswith(prefix) and callable(fn):
+            parse = getattr(module, f'parse_{name[len(prefix):]}', module.parse)
+            found[name[len(prefix):]] = lambda path, fn=fn, parse=parse: fn(parse(read_input(path)))
+
+    stream = getattr(module, f'stream0{part}', None)
+    if stream is not None:
+        found['stream'] = lambda path: stream(iter_lines(path))
+
+    chunk = getattr(module, f'chunk0{part}', None)
+    if chunk is not None:
+        found['chunks'] = lambda path: sum(chunk(buffer) for buffer in iter_byte_chunks(path))
+
+    return found
+
+def reference(module: ModuleType, part: int) -> Callable[[str], Any]:
+    solver = get_solver(module, part)
+    return lambda path: solver(module.parse(read_input(path)))
+
+def timed(module: ModuleType, run: Callable[[str], Any], path: str, repeat: int) -> dict:
+    times = []
+
+    try:
+        for _ in range(repeat):
+            reset_caches(module)
+            start = perf_counter()
+            answer = run(path)
+            times.append(perf_counter() - start)
+    except Exception as error:
+        return {'status': 'error', 'error': f'{type(error).__name__}: {error}'}
+
+    return {'status': 'ok', 'answer': str(answer), 'median': statistics.median(times)}
+
+def compare_engines(day: int, part: int, scales: list[float], seed: int, repeat: int) -> list[dict]:
+    module = load_day(day)
+    alternatives = engines(module, part)
+    rows = []
+
+    if not alternatives:
+        return rows
+
+    for label, path in inputs_for(day, scales, seed):
+        expected = timed(module, reference(module, part), path, repeat)
+
+        for name, run in alternatives.items():
+            row = {
+                'day': day,
+                'part': part,
+                'engine': name,
+                'input': label,
+                'size': os.path.getsize(path),
+                'reference': expected.get('median'),
+            }
+            result = timed(module, run, path, repeat)
+
+            if expected['status'] != 'ok':
+                row.update(status='error', error=f'reference failed: {expected["error"]}')
+            elif result['status'] != 'ok':
+                row.update(status='error', error=result['error'])
+            elif result['answer'] != expected['answer']:
+                row.update(status='mismatch', error=f'{result["answer"]} != reference {expected["answer"]}')
+            else:
+                row.update(status='ok', time=result['median'], speedup=expected['median'] / max(result['median'], 1e-9))
+
+            rows.append(row)
+
+    return rows
+
+def inputs_for(day: int, scales: list[float], seed: int) -> list[tuple[str, str]]:
+    inputs = [('input', input_path(day))]
+    for scale in scales:
+        inputs.append((f'x{scale:g}', write_generated(day, scale, seed)))
+
+    return inputs
+
+def format_rows(rows: list[dict]) -> str:
+    lines = [f'{"day":>3} {"part":>4} {"engine":<16} {"input":<8} {"size":>10} {"reference":>10} {"engine":>10} {"speedup":>8}']
+
+    for row in rows:
+        prefix = f'{row["day"]:>3} {row["part"]:>4} {row["engine"]:<16} {row["input"]:<8} {row["size"]:>10,}'
+        if row['status'] != 'ok':
+            lines.append(f'{prefix}  {row["status"].upper()}: {row["error"]}')
+            continue
+
+        lines.append(
+            f'{prefix} {format_seconds(row["reference"]):>10} {format_seconds(row["time"]):>10} '
+            f'{row["speedup"]:>7.2f}x'
+        )
+
+    return '\n'.join(lines)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Check alternative engines against the reference solvers and measure their speedup.')
+    parser.add_argument('days', nargs='*', type=int, help='days to check (default: every day with an engine)')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only check the given part')
+    parser.add_argument('--scale', type=float, nargs='*', default=[1, 10, 100], help='generated input scales')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per engine and input')
+    parser.add_argument('--json', action='store_true', help='print the rows as JSON')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    rows = []
+
+    for day in args.days or available_days():
+        for part in solver_parts(day):
+            if args.part and part not in args.part:
+                continue
+
+            try:
+                rows += compare_engines(day, part, args.scale, args.seed, args.repeat)
+            except ImportError as error:
+                print(f'skipping day {day}: {error}', file=sys.stderr)
+                break
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(format_rows(rows))
+
+    failed = [row for row in rows if row['status'] != 'ok']
+    for row in failed:
+        print(f'FAIL day {row["day"]} part {row["part"]} {row["engine"]} on {row["input"]}: {row["error"]}', file=sys.stderr)
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,734 @@
+'''
+Synthetic input generators for every day.
+
+Each generator takes a seeded `random.Random` and a scale factor and returns an
+input in the same format as `day-N-input.txt`. A scale of 1 produces roughly the
+size of the checked-in input; larger scales grow the dimension that drives the
+solver's cost (lines, grid cells, bricks, hailstones, nodes, ...). Grids grow
+in area, so their side grows with the square root of the scale.
+'''
+
+import argparse
+import math
+import os
+import random
+import string
+import sys
+from typing import Callable
+
+from aoc.days import ROOT, available_days
+
+DEFAULT_SEED = 2023
+GENERATED_DIR = os.path.join(ROOT, 'generated')
+
+GENERATORS: dict[int, Callable[[random.Random, float], str]] = {}
+
+# Days whose inputs cannot follow the scale, so a growth exponent fitted on
+# them means nothing: day 21's grid can only be 131 or 393 wide.
+CAPPED_DAYS = {21}
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+PIPE_BY_DIRS = {
+    frozenset(['up', 'down']): '|',
+    frozenset(['left', 'right']): '-',
+    frozenset(['up', 'right']): 'L',
+    frozenset(['up', 'left']): 'J',
+    frozenset(['down', 'left']): '7',
+    frozenset(['down', 'right']): 'F',
+}
+
+def generator(day: int):
+    def register(fn: Callable[[random.Random, float], str]):
+        GENERATORS[day] = fn
+        return fn
+    return register
+
+def generate(day: int, scale: float = 1, seed: int = DEFAULT_SEED) -> str:
+    return GENERATORS[day](random.Random(f'{seed}-{day}-{scale}'), scale)
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+def scaled_side(base: int, scale: float, minimum: int = 3) -> int:
+    return max(minimum, round(base * math.sqrt(scale)))
+
+def names(count: int, length: int = 2, exclude: set[str] = frozenset(), alphabet: str = string.ascii_lowercase) -> list[str]:
+    while len(alphabet) ** length < count + len(exclude):
+        length += 1
+
+    result = []
+    idx = 0
+    while len(result) < count:
+        name = ''
+        n = idx
+        for _ in range(length):
+            n, r = divmod(n, len(alphabet))
+            name = alphabet[r] + name
+        idx += 1
+        if name not in exclude:
+            result.append(name)
+
+    return result
+
+def random_grid(rng: random.Random, rows: int, cols: int, weights: dict[str, float]) -> list[list[str]]:
+    chars = list(weights)
+    probs = list(weights.values())
+    return [rng.choices(chars, probs, k=cols) for _ in range(rows)]
+
+def join_grid(grid: list[list[str]]) -> str:
+    return '\n'.join(''.join(row) for row in grid)
+
+@generator(1)
+def generate_day_1(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled(1000, scale)):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.3:
+                tokens.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append(''.join(tokens))
+
+    return '\n'.join(lines)
+
+@generator(2)
+def generate_day_2(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for game in range(1, scaled(100, scale) + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            reveals.append(', '.join(f'{rng.randint(1, 20)} {color}' for color in colors))
+        lines.append(f'Game {game}: ' + '; '.join(reveals))
+
+    return '\n'.join(lines)
+
+@generator(3)
+def generate_day_3(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    lines = []
+
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            kind = rng.random()
+            if kind < 0.08:
+                digits = str(rng.randint(1, 999))
+                row.extend(digits[:side - len(row)])
+                if len(row) < side:
+                    row.append('.')
+            elif kind < 0.10:
+                row.append('*')
+            elif kind < 0.12:
+                row.append(rng.choice('#$%&+-/=@'))
+            else:
+                row.append('.')
+        lines.append(''.join(row))
+
+    return '\n'.join(lines)
+
+@generator(4)
+def generate_day_4(rng: random.Random, scale: float) -> str:
+    # Cards only win copies of cards inside their own block of BLOCK cards, so
+    # the number of card instances grows linearly with the scale instead of
+    # exploding along one long chain.
+    BLOCK = 20
+    total = scaled(200, scale)
+    lines = []
+
+    for card in range(1, total + 1):
+        remaining = min(BLOCK - (card - 1) % BLOCK - 1, total - card)
+        matches = min(rng.choice([0, 0, 1, 1, 2, 3, 4, 5, 6, 8, 10]), remaining)
+        lines.append(card_line(rng, card, total, matches))
+
+    return '\n'.join(lines)
+
+def card_line(rng: random.Random, card: int, total: int, matches: int) -> str:
+    numbers = rng.sample(range(1, 100), 35)
+    winning = numbers[:10]
+    have = winning[:matches] + numbers[10:35 - matches]
+    rng.shuffle(have)
+
+    return (
+        f'Card {card:>{len(str(total))}}: '
+        + ' '.join(f'{n:>2}' for n in winning)
+        + ' | '
+        + ' '.join(f'{n:>2}' for n in have)
+    )
+
+@generator(5)
+def generate_day_5(rng: random.Random, scale: float) -> str:
+    SPAN = 2 ** 32
+    CATEGORIES = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(SPAN // 2)
+        seeds += [start, rng.randrange(1, SPAN // 16)]
+
+    sections = ['seeds: ' + ' '.join(map(str, seeds))]
+    ranges_per_map = scaled(30, scale, 2)
+
+    for source, dest in zip(CATEGORIES, CATEGORIES[1:]):
+        cuts = sorted(rng.sample(range(1, SPAN), ranges_per_map))
+        sources = list(zip([0] + cuts, cuts + [SPAN]))
+        lengths = [end - start for start, end in sources]
+
+        order = list(range(len(lengths)))
+        rng.shuffle(order)
+        dest_starts = {}
+        offset = 0
+        for idx in order:
+            dest_starts[idx] = offset
+            offset += lengths[idx]
+
+        lines = [f'{source}-to-{dest} map:']
+        for idx, (start, _) in enumerate(sources):
+            if rng.random() < 0.9:
+                lines.append(f'{dest_starts[idx]} {start} {lengths[idx]}')
+        sections.append('\n'.join(lines))
+
+    return '\n\n'.join(sections)
+
+@generator(6)
+def generate_day_6(rng: random.Random, scale: float) -> str:
+    # Part 2 is linear in the concatenated race time, so that is what scales.
+    RACES = 4
+    digits = max(2 * RACES, len(str(scaled(40_000_000, scale))))
+    sizes = [digits // RACES + (1 if i < digits % RACES else 0) for i in range(RACES)]
+
+    times = []
+    distances = []
+    for size in sizes:
+        # A leading digit of 3 or more leaves room for a record distance with
+        # 2 * size - 1 digits, which keeps the concatenated record beatable.
+        time = rng.randrange(3 * 10 ** (size - 1), 10 ** size)
+        low = 10 ** (2 * size - 2)
+        high = min(time * time // 4, 10 ** (2 * size - 1) - 1)
+        times.append(time)
+        distances.append(rng.randint(low, high))
+
+    return (
+        'Time:     ' + ' '.join(f'{t:>6}' for t in times) + '\n'
+        + 'Distance: ' + ' '.join(f'{d:>6}' for d in distances)
+    )
+
+@generator(7)
+def generate_day_7(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled(1000, scale)):
+        hand = ''.join(rng.choices('23456789TJQKA', k=5))
+        lines.append(f'{hand} {rng.randint(1, 1000)}')
+
+    return '\n'.join(lines)
+
+@generator(8)
+def generate_day_8(rng: random.Random, scale: float) -> str:
+    # Every ghost walks its own ring of nodes whose left and right exits agree,
+    # so the path is valid for any instruction string and reaches its Z node
+    # after exactly `length` steps, and then again every `length` steps.
+    GHOSTS = 6
+    lengths = [rng.randint(100, 150) * max(1, round(scale)) for _ in range(GHOSTS)]
+    inner = names(sum(lengths), 3, alphabet=string.ascii_uppercase[1:-1])
+    inner = [name + rng.choice('BCDEFGHIJKLMNOPQRSTUVWXY') for name in inner]
+
+    lines = []
+    cursor = 0
+    for ghost, length in enumerate(lengths):
+        start = 'AAA' if ghost == 0 else f'{inner[cursor]}A'
+        end = 'ZZZ' if ghost == 0 else f'{inner[cursor]}Z'
+        ring = inner[cursor:cursor + length - 1]
+        cursor += length
+
+        path = [start] + ring + [end]
+        for a, b in zip(path, path[1:]):
+            lines.append(f'{a} = ({b}, {b})')
+        lines.append(f'{end} = ({path[1]}, {path[1]})')
+
+    rng.shuffle(lines)
+    instructions = ''.join(rng.choices('LR', k=263))
+
+    return instructions + '\n\n' + '\n'.join(lines)
+
+@generator(9)
+def generate_day_9(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        values = [sum(c * x ** i for i, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(' '.join(map(str, values)))
+
+    return '\n'.join(lines)
+
+def spanning_tree_loop(rng: random.Random, rows: int, cols: int, fill: float) -> dict[tuple[int, int], set[str]]:
+    # Grow a random tree over a connected part of a rows x cols lattice and
+    # trace its outline on a grid twice as fine. The outline is a single simple
+    # loop that visits every fine cell of the covered region.
+    start = (rows // 2, cols // 2)
+    region = {start}
+    tree = []
+    frontier = [(start, step) for step in [(0, 1), (1, 0), (0, -1), (-1, 0)]]
+    target = max(2, int(rows * cols * fill))
+
+    while frontier and len(region) < target:
+        (r, c), (dr, dc) = frontier.pop(rng.randrange(len(frontier)))
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < rows and 0 <= nc < cols) or (nr, nc) in region:
+            continue
+        region.add((nr, nc))
+        tree.append(((r, c), (nr, nc)))
+        frontier += [((nr, nc), step) for step in [(0, 1), (1, 0), (0, -1), (-1, 0)]]
+
+    edges = set()
+    for r, c in region:
+        a, b, d, e = (2 * r, 2 * c), (2 * r, 2 * c + 1), (2 * r + 1, 2 * c), (2 * r + 1, 2 * c + 1)
+        edges |= {frozenset([a, b]), frozenset([a, d]), frozenset([b, e]), frozenset([d, e])}
+
+    for (r1, c1), (r2, c2) in tree:
+        (r, c) = min((r1, c1), (r2, c2))
+        if r1 == r2:
+            tl, bl = (2 * r, 2 * c + 1), (2 * r + 1, 2 * c + 1)
+            tr, br = (2 * r, 2 * c + 2), (2 * r + 1, 2 * c + 2)
+            edges -= {frozenset([tl, bl]), frozenset([tr, br])}
+            edges |= {frozenset([tl, tr]), frozenset([bl, br])}
+        else:
+            lt, rt = (2 * r + 1, 2 * c), (2 * r + 1, 2 * c + 1)
+            lb, rb = (2 * r + 2, 2 * c), (2 * r + 2, 2 * c + 1)
+            edges -= {frozenset([lt, rt]), frozenset([lb, rb])}
+            edges |= {frozenset([lt, lb]), frozenset([rt, rb])}
+
+    dirs = {}
+    for edge in edges:
+        (r1, c1), (r2, c2) = sorted(edge)
+        first, second = ('right', 'left') if r1 == r2 else ('down', 'up')
+        dirs.setdefault((r1, c1), set()).add(first)
+        dirs.setdefault((r2, c2), set()).add(second)
+
+    return dirs
+
+@generator(10)
+def generate_day_10(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale, 4) // 2 * 2
+    loop = spanning_tree_loop(rng, side // 2, side // 2, 0.6)
+    grid = random_grid(rng, side, side, {'.': 4, '|': 1, '-': 1, 'L': 1, 'J': 1, '7': 1, 'F': 1})
+
+    for (r, c), dirs in loop.items():
+        grid[r][c] = PIPE_BY_DIRS[frozenset(dirs)]
+
+    sr, sc = rng.choice(sorted(loop))
+    grid[sr][sc] = 'S'
+    for nr, nc in [(sr - 1, sc), (sr + 1, sc), (sr, sc - 1), (sr, sc + 1)]:
+        if 0 <= nr < side and 0 <= nc < side and (nr, nc) not in loop:
+            grid[nr][nc] = '.'
+
+    return join_grid(grid)
+
+@generator(11)
+def generate_day_11(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 15))
+    empty_cols = set(rng.sample(range(side), side // 15))
+    grid = []
+
+    for i in range(side):
+        row = []
+        for j in range(side):
+            galaxy = i not in empty_rows and j not in empty_cols and rng.random() < 0.022
+            row.append('#' if galaxy else '.')
+        grid.append(row)
+
+    return join_grid(grid)
+
+@generator(12)
+def generate_day_12(rng: random.Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled(1000, scale)):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 6))]
+        row = '.' * rng.randint(0, 2)
+        for idx, group in enumerate(groups):
+            row += '#' * group
+            if idx < len(groups) - 1:
+                row += '.' * rng.randint(1, 3)
+        row += '.' * rng.randint(0, 2)
+
+        springs = ''.join('?' if rng.random() < 0.5 else char for char in row)
+        lines.append(f'{springs} {",".join(map(str, groups))}')
+
+    return '\n'.join(lines)
+
+@generator(13)
+def generate_day_13(rng: random.Random, scale: float) -> str:
+    # Every pattern mirrors exactly around one column (part 1) and, but for a
+    # single smudge outside that column mirror, around one row (part 2).
+    patterns = []
+
+    for _ in range(scaled(100, scale)):
+        rows = rng.choice([7, 9, 11, 13, 15, 17])
+        cols = rng.choice([9, 11, 13, 15, 17])
+        grid = random_grid(rng, rows, cols, {'.': 1, '#': 1})
+
+        col_axis = rng.randrange(0, (cols - 1) // 2)
+        for k in range(col_axis + 1):
+            for i in range(rows):
+                grid[i][col_axis + 1 + k] = grid[i][col_axis - k]
+
+        row_axis = rng.randrange(rows - 1)
+        span = min(row_axis + 1, rows - row_axis - 1)
+        for k in range(span):
+            grid[row_axis + 1 + k] = list(grid[row_axis - k])
+
+        i = rng.randrange(row_axis - span + 1, row_axis + span + 1)
+        j = rng.randrange(2 * col_axis + 2, cols)
+        grid[i][j] = '#' if grid[i][j] == '.' else '.'
+
+        patterns.append(join_grid(grid))
+
+    return '\n\n'.join(patterns)
+
+@generator(14)
+def generate_day_14(rng: random.Random, scale: float) -> str:
+    side = scaled_side(100, scale)
+    return join_grid(random_grid(rng, side, side, {'.': 55, 'O': 25, '#': 20}))
+
+@generator(15)
+def generate_day_15(rng: random.Random, scale: float) -> str:
+    labels = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(scaled(500, scale))]
+    steps = []
+
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f'{label}={rng.randint(1, 9)}' if rng.random() < 0.6 else f'{label}-')
+
+    return ','.join(steps)
+
+@generator(16)
+def generate_day_16(rng: random.Random, scale: float) -> str:
+    side = scaled_side(110, scale)
+    return join_grid(random_grid(rng, side, side, {'.': 90, '/': 2.5, '\\': 2.5, '|': 2.5, '-': 2.5}))
+
+@generator(17)
+def generate_day_17(rng: random.Random, scale: float) -> str:
+    side = scaled_side(141, scale)
+    return '\n'.join(''.join(rng.choices('123456789', k=side)) for _ in range(side))
+
+def split_evenly(total: int, pieces: int) -> list[int]:
+    return [total // pieces + (1 if i < total % pieces else 0) for i in range(pieces)]
+
+def histogram_plan(rng: random.Random, columns: int, max_step: int, tail_pieces: int) -> list[tuple[str, int]]:
+    # A histogram-shaped polygon: up, then across the columns at random
+    # heights, then down and back left along the base, which is split into
+    # `tail_pieces` moves so that both plans can have the same number of lines.
+    heights = [rng.randint(1, max_step)]
+    while len(heights) < columns:
+        height = rng.randint(1, max_step)
+        if height != heights[-1]:
+            heights.append(height)
+
+    widths = [rng.randint(1, max_step) for _ in range(columns)]
+    plan = [('U', heights[0]), ('R', widths[0])]
+
+    for prev, height, width in zip(heights, heights[1:], widths[1:]):
+        plan.append(('U', height - prev) if height > prev else ('D', prev - height))
+        plan.append(('R', width))
+
+    plan.append(('D', heights[-1]))
+    plan += [('L', step) for step in split_evenly(sum(widths), tail_pieces)]
+
+    return plan
+
+@generator(18)
+def generate_day_18(rng: random.Random, scale: float) -> str:
+    MAX_HEX_STEP = 0xFFFFF
+    columns = scaled(160, scale, 2)
+
+    # Walking back along the base in `columns` moves keeps every hex step
+    # within five digits.
+    first = histogram_plan(rng, columns, 10, columns)
+    second = histogram_plan(rng, columns, MAX_HEX_STEP, columns)
+    dir_numbers = {'R': 0, 'D': 1, 'L': 2, 'U': 3}
+
+    return '\n'.join(
+        f'{dir} {steps} (#{hex_steps:05x}{dir_numbers[hex_dir]})'
+        for (dir, steps), (hex_dir, hex_steps) in zip(first, second)
+    )
+
+@generator(19)
+def generate_day_19(rng: random.Random, scale: float) -> str:
+    # Workflows form a tree rooted at `in`, so every part ends in A or R and
+    # part 2 explores each workflow once. Each condition splits the ranges that
+    # can reach it into two non-empty halves, which day-19's `Range.intersect`
+    # relies on.
+    total = scaled(550, scale)
+    workflow_names = ['in'] + names(total - 1, 2, exclude={'in'})
+    next_child = 1
+    queue = [('in', {letter: (1, 4000) for letter in 'xmas'})]
+    lines = []
+
+    def destination(ranges: dict[str, tuple[int, int]]) -> str:
+        nonlocal next_child
+        if next_child < total and rng.random() < 0.6:
+            name = workflow_names[next_child]
+            next_child += 1
+            queue.append((name, ranges))
+            return name
+        return rng.choice('AR')
+
+    while queue:
+        name, ranges = queue.pop(0)
+        rules = []
+
+        for _ in range(rng.randint(1, 3)):
+            letters = [letter for letter in 'xmas' if ranges[letter][1] > ranges[letter][0]]
+            if not letters:
+                break
+
+            letter = rng.choice(letters)
+            low, high = ranges[letter]
+            operator = rng.choice('<>')
+
+            if operator == '<':
+                value = rng.randint(low + 1, high)
+                matched, rest = (low, value - 1), (value, high)
+            else:
+                value = rng.randint(low, high - 1)
+                matched, rest = (value + 1, high), (low, value)
+
+            to = destination({**ranges, letter: matched})
+            rules.append(f'{letter}{operator}{value}:{to}')
+            ranges = {**ranges, letter: rest}
+
+        lines.append(f'{name}{{{",".join(rules + [destination(ranges)])}}}')
+
+    ratings = []
+    for _ in range(scaled(200, scale)):
+        ratings.append('{' + ','.join(f'{letter}={rng.randint(1, 4000)}' for letter in 'xmas') + '}')
+
+    return '\n'.join(lines) + '\n\n' + '\n'.join(ratings)
+
+@generator(20)
+def generate_day_20(rng: random.Random, scale: float) -> str:
+    # Four binary counters, like the real input: a chain of flip-flops counts
+    # button presses and a hub conjunction resets it when it reaches a target,
+    # firing the inverters that day-20's part 2 watches.
+    INVERTERS = ['mr', 'kk', 'bb', 'gl']
+    HUBS = ['cr', 'nl', 'vj', 'jx']
+    bits = 12 + max(0, round(math.log2(scale)))
+
+    flip_flop_names = names(4 * bits, 2, exclude=set(INVERTERS + HUBS + ['qt', 'rx']))
+    heads = []
+    lines = []
+
+    for chain, (inverter, hub) in enumerate(zip(INVERTERS, HUBS)):
+        target = rng.randrange(2 ** (bits - 1), 2 ** bits) | 1
+        chain_names = flip_flop_names[chain * bits:(chain + 1) * bits]
+        heads.append(chain_names[0])
+        hub_destinations = []
+
+        for bit, name in enumerate(chain_names):
+            destinations = []
+            if bit + 1 < bits:
+                destinations.append(chain_names[bit + 1])
+            if target >> bit & 1:
+                destinations.append(hub)
+            if not target >> bit & 1 or bit == 0:
+                hub_destinations.append(name)
+            lines.append(f'%{name} -> {", ".join(destinations)}')
+
+        lines.append(f'&{hub} -> {", ".join(hub_destinations + [inverter])}')
+        lines.append(f'&{inverter} -> qt')
+
+    lines.append(f'broadcaster -> {", ".join(heads)}')
+    lines.append('&qt -> rx')
+    rng.shuffle(lines)
+
+    return '\n'.join(lines)
+
+@generator(21)
+def generate_day_21(rng: random.Random, scale: float) -> str:
+    # day-21's part 2 requires 26501365 % size == size // 2, which only holds
+    # for the divisors of 2 * 26501365 + 1: the grid can be 131 or 393 wide
+    # (the next one, 134867, is far too large to generate).
+    SIZES = [131, 393]
+    target = 131 * math.sqrt(scale)
+    # Ties go to the larger grid, so x4 is already 393 wide.
+    size = min(SIZES, key=lambda s: (abs(s - target), -s))
+    middle = size // 2
+
+    grid = random_grid(rng, size, size, {'.': 85, '#': 15})
+    for k in range(size):
+        grid[middle][k] = grid[k][middle] = '.'
+        grid[0][k] = grid[size - 1][k] = grid[k][0] = grid[k][size - 1] = '.'
+    grid[middle][middle] = 'S'
+
+    return join_grid(grid)
+
+@generator(22)
+def generate_day_22(rng: random.Random, scale: float) -> str:
+    lines = []
+    z = 1
+
+    for _ in range(scaled(1454, scale)):
+        axis = rng.choices('xyz', [4, 4, 2])[0]
+        length = rng.randint(0, 4)
+        x, y = rng.randint(0, 9), rng.randint(0, 9)
+        end = [x, y, z]
+
+        if axis == 'x':
+            x = min(x, 9 - length)
+            end = [x + length, y, z]
+        elif axis == 'y':
+            y = min(y, 9 - length)
+            end = [x, y + length, z]
+        else:
+            end = [x, y, z + length]
+
+        lines.append(f'{x},{y},{z}~{end[0]},{end[1]},{end[2]}')
+        z = end[2] + rng.randint(1, 2)
+
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+@generator(23)
+def generate_day_23(rng: random.Random, scale: float) -> str:
+    # Junctions sit on a lattice joined by straight corridors, like the real
+    # input's 6x6 junction layout; slopes next to each junction only lead
+    # right or down, so part 1 is a DAG while part 2 has to try every path.
+    lattice = max(2, round(6 * math.sqrt(scale)))
+    edges = lattice_edges(lattice)
+
+    for edge in rng.sample(sorted(edges), len(edges) // 20):
+        edges.discard(edge)
+        if not lattice_connected(lattice, edges):
+            edges.add(edge)
+
+    return lattice_maze(lattice, edges)
+
+def lattice_edges(lattice: int) -> set:
+    edges = set()
+    for i in range(lattice):
+        for j in range(lattice):
+            if j + 1 < lattice:
+                edges.add(((i, j), (i, j + 1)))
+            if i + 1 < lattice:
+                edges.add(((i, j), (i + 1, j)))
+
+    return edges
+
+def lattice_maze(lattice: int, edges: set, spacing: int = 27) -> str:
+    size = (lattice - 1) * spacing + 3
+    grid = [['#'] * size for _ in range(size)]
+    grid[0][1] = '.'
+    grid[size - 1][size - 2] = '.'
+
+    def cell(i: int, j: int) -> tuple[int, int]:
+        return 1 + i * spacing, 1 + j * spacing
+
+    for (i1, j1), (i2, j2) in edges:
+        (r1, c1), (r2, c2) = cell(i1, j1), cell(i2, j2)
+        for r in range(r1, r2 + 1):
+            for c in range(c1, c2 + 1):
+                grid[r][c] = '.'
+        slope = '>' if r1 == r2 else 'v'
+        grid[r1 + (r1 != r2)][c1 + (c1 != c2)] = slope
+        grid[r2 - (r1 != r2)][c2 - (c1 != c2)] = slope
+
+    return join_grid(grid)
+
+def lattice_connected(lattice: int, edges: set) -> bool:
+    neighbors = {}
+    for a, b in edges:
+        neighbors.setdefault(a, []).append(b)
+        neighbors.setdefault(b, []).append(a)
+
+    seen = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        for n in neighbors.get(stack.pop(), []):
+            if n not in seen:
+                seen.add(n)
+                stack.append(n)
+
+    return len(seen) == lattice * lattice
+
+@generator(24)
+def generate_day_24(rng: random.Random, scale: float) -> str:
+    # Hailstones are placed so that a single thrown rock hits all of them.
+    rock_pos = [rng.randint(200_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    rock_vel = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(1_000_000_000, 100_000_000_000), scaled(300, scale, 3))
+    lines = []
+
+    for t in times:
+        vel = [rng.randint(-500, 500) or 1 for _ in range(3)]
+        pos = [p + (v - w) * t for p, v, w in zip(rock_pos, rock_vel, vel)]
+        lines.append(', '.join(map(str, pos)) + ' @ ' + ', '.join(map(str, vel)))
+
+    return '\n'.join(lines)
+
+@generator(25)
+def generate_day_25(rng: random.Random, scale: float) -> str:
+    # Two densely connected halves joined by exactly three wires.
+    nodes = names(scaled(1500, scale, 8), 3)
+    rng.shuffle(nodes)
+    half = len(nodes) // 2
+    edges = set()
+
+    for group in (nodes[:half], nodes[half:]):
+        for a, b in zip(group, group[1:] + group[:1]):
+            edges.add(tuple(sorted((a, b))))
+        for a in group:
+            for b in rng.sample(group, min(3, len(group))):
+                if a != b:
+                    edges.add(tuple(sorted((a, b))))
+
+    for a, b in zip(rng.sample(nodes[:half], 3), rng.sample(nodes[half:], 3)):
+        edges.add((a, b))
+
+    by_node = {}
+    for a, b in edges:
+        by_node.setdefault(a, []).append(b)
+
+    return '\n'.join(f'{a}: {" ".join(others)}' for a, others in by_node.items())
+
+def generated_path(day: int, scale: float, seed: int = DEFAULT_SEED, directory: str = GENERATED_DIR) -> str:
+    return os.path.join(directory, f'day-{day}', f'day-{day}-input.x{scale:g}.s{seed}.txt')
+
+def write_generated(day: int, scale: float, seed: int = DEFAULT_SEED, directory: str = GENERATED_DIR) -> str:
+    path = generated_path(day, scale, seed, directory)
+
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(generate(day, scale, seed))
+
+    return path
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Write scaled synthetic inputs for the day-N solvers.')
+    parser.add_argument('days', nargs='*', type=int, help='days to generate (default: all)')
+    parser.add_argument('--scale', type=float, nargs='+', default=[10, 100, 1000], help='scale factors')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--out', default=GENERATED_DIR, help='output directory')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    for day in args.days or available_days():
+        for scale in args.scale:
+            print(write_generated(day, scale, args.seed, args.out))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+'''
+Character grids stored as one contiguous byte array.
+
+The input is surrounded by a one-cell border, so every cell has four
+neighbours at `index + offset` and a walk reads the border byte instead of
+checking bounds. Cells are addressed by a flat index, `row * stride + col` in
+padded coordinates; `index` and `position` convert from and to the (row, col)
+of the input.
+'''
+
+from aoc import metrics
+
+OUTSIDE = '\0'
+
+class Grid:
+    def __init__(self, rows: list[str], border: str = OUTSIDE) -> None:
+        self.height = len(rows)
+        self.width = len(rows[0])
+        self.stride = self.width + 2
+        self.border = ord(border)
+
+        pad = border.encode()
+        self.cells = bytearray(pad * self.stride)
+        for row in rows:
+            self.cells += pad + row.encode() + pad
+        self.cells += pad * self.stride
+
+        # Neighbour offsets, clockwise from up, then the four diagonals.
+        self.up, self.right, self.down, self.left = -self.stride, 1, self.stride, -1
+        self.offsets = (self.up, self.right, self.down, self.left)
+        self.diagonals = (self.up + self.left, self.up + self.right, self.down + self.right, self.down + self.left)
+
+    @classmethod
+    def parse(cls, data: str, border: str = OUTSIDE):
+        rows = data.split('\n')
+        with metrics.phase('build'):
+            return cls(rows, border)
+
+    def copy(self):
+        grid = object.__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def __getitem__(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def inside(self, index: int) -> bool:
+        return self.cells[index] != self.border
+
+    def find(self, char: str) -> int:
+        return self.cells.index(ord(char))
+
+    def find_all(self, char: str) -> list[int]:
+        value = ord(char)
+        return [index for index in self.indices() if self.cells[index] == value]
+
+    def indices(self) -> list[int]:
+        return [index for row in range(self.height) for index in self.row_indices(row)]
+
+    def row_indices(self, row: int) -> range:
+        start = self.index(row, 0)
+        return range(start, start + self.width)
+
+    def column_indices(self, col: int) -> range:
+        return range(self.index(0, col), self.index(self.height - 1, col) + 1, self.stride)
+
+    def row(self, row: int) -> bytes:
+        start = self.index(row, 0)
+        return bytes(self.cells[start:start + self.width])
+
+    def column(self, col: int) -> bytes:
+        return bytes(self.cells[self.index(0, col):self.index(self.height, col):self.stride])
+
+    def rows(self) -> list[bytes]:
+        return [self.row(row) for row in range(self.height)]
+
+    def columns(self) -> list[bytes]:
+        return [self.column(col) for col in range(self.width)]
+
+    def array(self):
+        # A (height + 2, stride) uint8 view that shares memory with `cells`.
+        import numpy
+
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(self.height + 2, self.stride)
+
+    def __str__(self) -> str:
+        return '\n'.join(row.decode() for row in self.rows())
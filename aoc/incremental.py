@@ -0,0 +1,152 @@
+'''
+Per-line results kept on disk between runs.
+
+Solvers that work out an independent value for every input line wrap that
+function with `per_line`. Once incremental mode is on (`enable()` or
+AOC_INCREMENTAL=1, before the day module is imported), each result is
+stored under .cache/lines/ keyed by the function's arguments, that is by the
+line's content, so a re-run after editing a few lines only recomputes those
+lines. A store is dropped when the file defining the function changes.
+Otherwise `per_line` returns the function unchanged.
+'''
+
+import atexit
+import functools
+import os
+import sys
+from typing import Any, Callable
+
+from aoc.lazy import lazy_import
+
+# The day modules import this one, so anything only needed once incremental
+# mode is on (or by the command line) is loaded on first use.
+argparse = lazy_import('argparse')
+hashlib = lazy_import('hashlib')
+pickle = lazy_import('pickle')
+shutil = lazy_import('shutil')
+
+ENV_VAR = 'AOC_INCREMENTAL'
+
+# Same as aoc.days.ROOT, without importing aoc.days into every day module.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'lines')
+
+_enabled = os.environ.get(ENV_VAR) == '1'
+
+class LineStore:
+    def __init__(self, path: str, source: str) -> None:
+        self.path = path
+        self.source = source
+        self.values: dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+        try:
+            with open(path, 'rb') as file:
+                stored = pickle.load(file)
+            if stored['source'] == source:
+                self.values = stored['values']
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+            pass
+
+    def save(self):
+        if not self.dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        partial = f'{self.path}.{os.getpid()}.tmp'
+        with open(partial, 'wb') as file:
+            pickle.dump({'source': self.source, 'values': self.values}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, self.path)
+        self.dirty = False
+
+# Stores by name, '<day file>/<function>'.
+_stores: dict[str, LineStore] = {}
+
+def enable():
+    global _enabled
+    _enabled = True
+    # Inherited by worker processes that import the day modules themselves.
+    os.environ[ENV_VAR] = '1'
+
+def enabled() -> bool:
+    return _enabled
+
+def file_hash(path: str) -> str:
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+def get_store(fn: Callable) -> LineStore:
+    source = fn.__code__.co_filename
+    name = f'{os.path.splitext(os.path.basename(source))[0]}/{fn.__name__}'
+
+    if name not in _stores:
+        if not _stores:
+            # Scripts run on their own save on exit; the runner also saves after every day.
+            atexit.register(save)
+        _stores[name] = LineStore(os.path.join(CACHE_DIR, f'{name}.pickle'), file_hash(source))
+
+    return _stores[name]
+
+def per_line(key: Callable = None) -> Callable[[Callable], Callable]:
+    def decorator(fn: Callable) -> Callable:
+        if not _enabled:
+            return fn
+
+        store = None
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            nonlocal store
+            if store is None:
+                store = get_store(fn)
+
+            args_key = args if key is None else key(*args)
+            if args_key in store.values:
+                store.hits += 1
+                return store.values[args_key]
+
+            store.misses += 1
+            value = store.values[args_key] = fn(*args)
+            store.dirty = True
+            return value
+
+        return wrapper
+
+    return decorator
+
+def save():
+    for store in _stores.values():
+        store.save()
+
+def stats(prefix: str = '') -> dict[str, dict[str, int]]:
+    return {
+        name: {'hits': store.hits, 'misses': store.misses, 'entries': len(store.values)}
+        for name, store in sorted(_stores.items())
+        if name.startswith(prefix)
+    }
+
+def clear():
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+def parse_args(argv: list[str]) -> 'argparse.Namespace':
+    parser = argparse.ArgumentParser(description='Manage the on-disk cache of per-line results.')
+    parser.add_argument('--clear', action='store_true', help='remove every stored result')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.clear:
+        clear()
+        return 0
+
+    for directory in sorted(os.listdir(CACHE_DIR)) if os.path.isdir(CACHE_DIR) else []:
+        for name in sorted(os.listdir(os.path.join(CACHE_DIR, directory))):
+            path = os.path.join(CACHE_DIR, directory, name)
+            print(f'{directory}/{os.path.splitext(name)[0]}: {os.path.getsize(path)} bytes')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+'''
+Deferred imports for heavy or optional modules.
+
+`lazy_import('numpy')` returns a placeholder module right away and imports
+the real one on first attribute access. Importing a day therefore costs
+nothing for dependencies that only its solver uses, and a missing
+dependency only fails the solver that needs it.
+'''
+
+import importlib
+from types import ModuleType
+
+class LazyModule(ModuleType):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        # Only reached for attributes the placeholder itself doesn't have.
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f'<lazy module {self.__name__!r} ({state})>'
+
+def lazy_import(name: str) -> ModuleType:
+    return LazyModule(name)
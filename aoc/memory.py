@@ -0,0 +1,204 @@
+'''
+Peak memory of every part, split into parsing and solving.
+
+Each part runs in a fresh child process, first untraced for its peak RSS
+and then under tracemalloc. The report gives the traced peak while parsing
+and the size of the parsed input, the extra peak while solving and what the
+solver still holds afterwards (memoization caches, for instance). Solvers
+free most of their working set before returning, so a sampling thread
+snapshots the traced allocations whenever they grow by another GROWTH_STEP.
+The last snapshot, taken close to the solve peak and diffed against the
+parsed input, gives the allocation sites behind the peak, each charged to
+the innermost line of the repository that led to it.
+'''
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import tracemalloc
+
+from aoc.budget import format_megabytes, peak_rss
+from aoc.days import PARTS, ROOT, available_days, get_solver, input_path, load_day, read_input, reset_caches, solver_parts
+
+SAMPLE_INTERVAL = 0.005
+# Deep enough to get from a stdlib or builtin allocation back to the repo code behind it.
+TRACE_FRAMES = 16
+# Snapshots are taken each time the traced size grows by this factor.
+GROWTH_STEP = 1.25
+
+class PeakSampler(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.snapshot = None
+        self.snapshot_size = 0
+
+    def run(self):
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * GROWTH_STEP:
+                # Drop the previous snapshot first; large ones cost real memory.
+                self.snapshot = None
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+def repo_frame(traceback: tracemalloc.Traceback) -> tracemalloc.Frame | None:
+    # The innermost frame in the repository, leaving out this module's own
+    # sampling; allocations with none come from the measuring itself.
+    for frame in reversed(traceback):
+        if frame.filename.startswith(ROOT) and frame.filename != __file__:
+            return frame
+
+    return None
+
+def top_sites(stats: list, top: int, size: str = 'size') -> list[dict]:
+    count = 'count_diff' if size == 'size_diff' else 'count'
+    totals: dict[str, list[int]] = {}
+
+    for stat in stats:
+        frame = repo_frame(stat.traceback)
+        if frame is None:
+            continue
+
+        site = totals.setdefault(f'{os.path.relpath(frame.filename, ROOT)}:{frame.lineno}', [0, 0])
+        site[0] += getattr(stat, size)
+        site[1] += getattr(stat, count)
+
+    ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+    return [{'site': site, 'size': total, 'count': blocks} for site, (total, blocks) in ranked[:top] if total > 0]
+
+def _worker(conn, day: int, part: int, path: str, top: int):
+    try:
+        module = load_day(day)
+        solver = get_solver(module, part)
+        data = read_input(path)
+
+        # One untraced run first, as tracemalloc and its snapshots need memory of their own.
+        solver(module.parse(data))
+        rss = peak_rss()
+        reset_caches(module)
+
+        tracemalloc.start(TRACE_FRAMES)
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        parsed = module.parse(data)
+        parsed_size, parse_peak = tracemalloc.get_traced_memory()
+        parsed_snapshot = tracemalloc.take_snapshot()
+
+        sampler = PeakSampler()
+        sampler.snapshot_size = parsed_size
+        tracemalloc.reset_peak()
+        sampler.start()
+        try:
+            answer = solver(parsed)
+        finally:
+            sampler.stop()
+        solved_size, solve_peak = tracemalloc.get_traced_memory()
+
+        peak_snapshot = sampler.snapshot or tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        conn.send({
+            'status': 'ok',
+            'answer': str(answer),
+            'parse_peak': parse_peak - base,
+            'parsed': parsed_size - base,
+            'solve_peak': solve_peak - parsed_size,
+            'retained': solved_size - parsed_size,
+            'peak_rss': rss,
+            'parse_sites': top_sites(parsed_snapshot.statistics('traceback'), top),
+            'solve_sites': top_sites(peak_snapshot.compare_to(parsed_snapshot, 'traceback'), top, 'size_diff'),
+        })
+    except Exception as error:
+        conn.send({'status': 'error', 'error': f'{type(error).__name__}: {error}'})
+    finally:
+        conn.close()
+
+def measure_memory(day: int, part: int, path: str = None, top: int = 5, timeout: float = None) -> dict:
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_worker, args=(sender, day, part, path or input_path(day), top))
+    process.start()
+    sender.close()
+
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = {'status': 'error', 'error': f'worker exited with code {process.exitcode}'}
+    else:
+        result = {'status': 'timeout', 'error': f'no answer after {timeout}s'}
+
+    if process.is_alive():
+        process.kill()
+    process.join()
+    receiver.close()
+
+    result['day'] = day
+    result['part'] = part
+    return result
+
+def format_report(results: list[dict], sites: bool) -> str:
+    lines = [f'{"day":>3} {"part":>4} {"parse peak":>11} {"parsed":>10} {"solve peak":>11} {"retained":>10} {"peak rss":>10}  top solve site']
+
+    for result in results:
+        prefix = f'{result["day"]:>3} {result["part"]:>4}'
+        if result['status'] != 'ok':
+            lines.append(f'{prefix}  {result["status"]}: {result["error"]}')
+            continue
+
+        hog = result['solve_sites'][0]['site'] if result['solve_sites'] else '-'
+        lines.append(
+            f'{prefix} {format_megabytes(result["parse_peak"]):>11} {format_megabytes(result["parsed"]):>10} '
+            f'{format_megabytes(result["solve_peak"]):>11} {format_megabytes(result["retained"]):>10} '
+            f'{format_megabytes(result["peak_rss"]):>10}  {hog}'
+        )
+
+        if sites:
+            for phase in ('parse', 'solve'):
+                for site in result[f'{phase}_sites']:
+                    lines.append(f'{"":>9} {phase:<5} {format_megabytes(site["size"]):>10} {site["count"]:>9} blocks  {site["site"]}')
+
+    return '\n'.join(lines)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Report the peak memory of each part, split into parsing and solving.')
+    parser.add_argument('days', nargs='*', type=int, help='days to measure (default: all)')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only measure the given part')
+    parser.add_argument('--input', help='input file to use instead of day-N-input.txt (single day only)')
+    parser.add_argument('--top', type=int, default=5, help='allocation sites kept per phase')
+    parser.add_argument('--sites', action='store_true', help='list the top allocation sites under every part')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds before a part is killed')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    days = args.days or available_days()
+
+    if args.input and len(days) != 1:
+        print('--input requires exactly one day', file=sys.stderr)
+        return 2
+
+    results = []
+    for day in days:
+        for part in solver_parts(day):
+            if args.part is None or part in args.part:
+                results.append(measure_memory(day, part, args.input, args.top, args.timeout))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_report(results, args.sites))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
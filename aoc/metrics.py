@@ -0,0 +1,66 @@
+'''
+Opt-in counters that explain where a solver spends its time.
+
+Solvers wrap their hot functions with `counted` and report totals they
+already have with `add`. Both are decided when the day module is imported:
+unless metrics were enabled first (`enable()` or AOC_METRICS=1), `counted`
+returns the function unchanged and `add` returns at once, so a normal run
+pays nothing for them.
+
+Steps that build a structure out of the parsed input, such as a Grid or a
+graph, are wrapped in `phase('build')`. That is a no-op unless a profiler
+has installed a phase hook (see aoc.profiling), which then records the step
+as its own span.
+'''
+
+import functools
+import os
+from collections import Counter
+from contextlib import nullcontext
+from typing import Callable, ContextManager
+
+ENV_VAR = 'AOC_METRICS'
+
+_enabled = os.environ.get(ENV_VAR) == '1'
+_counters: Counter = Counter()
+_phase_hook: Callable[[str], ContextManager] | None = None
+
+def enable():
+    global _enabled
+    _enabled = True
+    # Inherited by worker processes that import the day modules themselves.
+    os.environ[ENV_VAR] = '1'
+
+def enabled() -> bool:
+    return _enabled
+
+def counted(name: str) -> Callable[[Callable], Callable]:
+    def decorator(fn: Callable) -> Callable:
+        if not _enabled:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            _counters[name] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+def add(name: str, amount: int = 1):
+    if _enabled:
+        _counters[name] += amount
+
+def set_phase_hook(hook: Callable[[str], ContextManager] | None):
+    global _phase_hook
+    _phase_hook = hook
+
+def phase(name: str) -> ContextManager:
+    return nullcontext() if _phase_hook is None else _phase_hook(name)
+
+def reset():
+    _counters.clear()
+
+def snapshot() -> dict[str, int]:
+    return dict(sorted(_counters.items()))
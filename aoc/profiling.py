@@ -0,0 +1,128 @@
+'''
+Profile one day under cProfile and tracemalloc.
+
+For each day `profile_day` writes three files: day-N.pstats (load it with
+`python -m pstats` or snakeviz), day-N.alloc.txt with the peak memory of every
+phase and the top allocation sites, and day-N.trace.json, a Chrome trace of
+the import, read, parse and solve phases (open it in chrome://tracing or
+Perfetto). Days mark the steps that build a structure, such as a Grid, day
+22's settled bricks or day 23's junction graph, with `metrics.phase('build')`;
+while profiling these show up as build spans nested in parse or solve.
+'''
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+
+from aoc import metrics
+from aoc.days import PARTS, PROFILE_DIR, ROOT, get_solver, input_path, load_day, read_input
+
+TRACE_FRAMES = 1
+
+class Trace:
+    def __init__(self) -> None:
+        self.origin = perf_counter()
+        self.events = []
+        self.peaks = {}
+        # Peak so far of every open span, as a nested span resets the peak.
+        self.open = []
+
+    @contextmanager
+    def span(self, name: str):
+        if self.open:
+            self.open[-1] = max(self.open[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self.open.append(0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            peak = max(tracemalloc.get_traced_memory()[1], self.open.pop())
+            if self.open:
+                self.open[-1] = max(self.open[-1], peak)
+            # Spans such as build may repeat; keep the largest.
+            self.peaks[name] = max(self.peaks.get(name, 0), peak)
+            self.events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': (start - self.origin) * 1e6,
+                'dur': duration * 1e6,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': {'peak_bytes': peak},
+            })
+
+    def write(self, path: str):
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, file, indent=2)
+
+def format_allocations(trace: Trace, snapshot: tracemalloc.Snapshot, top: int) -> str:
+    lines = ['peak traced memory by phase:']
+    for name, peak in trace.peaks.items():
+        lines.append(f'  {name:<10} {peak / 2 ** 20:>9.2f}MB')
+
+    lines.append('')
+    lines.append(f'top {top} allocation sites still alive at the end:')
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        lines.append(f'  {stat.size / 2 ** 10:>9.1f}KB {stat.count:>8} blocks  {os.path.relpath(frame.filename, ROOT)}:{frame.lineno}')
+
+    return '\n'.join(lines)
+
+def format_hot_functions(profiler: cProfile.Profile, top: int) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return stream.getvalue()
+
+def profile_day(
+    day: int,
+    parts: tuple[int, ...] = PARTS,
+    path: str = None,
+    out_dir: str = PROFILE_DIR,
+    top: int = 20
+) -> tuple[dict[str, object], str]:
+    path = path or input_path(day)
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, f'day-{day}')
+
+    trace = Trace()
+    profiler = cProfile.Profile()
+    answers = {}
+
+    tracemalloc.start(TRACE_FRAMES)
+    metrics.set_phase_hook(trace.span)
+    try:
+        with trace.span('import'):
+            module = load_day(day)
+        with trace.span('read'):
+            data = read_input(path)
+        with trace.span('parse'):
+            parsed = profiler.runcall(module.parse, data)
+
+        for part in parts:
+            solver = get_solver(module, part)
+            if solver is None:
+                continue
+
+            with trace.span(f'solve0{part}'):
+                answers[str(part)] = profiler.runcall(solver, parsed)
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    finally:
+        metrics.set_phase_hook(None)
+        tracemalloc.stop()
+
+    profiler.dump_stats(f'{base}.pstats')
+    trace.write(f'{base}.trace.json')
+    with open(f'{base}.alloc.txt', 'w') as file:
+        file.write(format_allocations(trace, snapshot, top) + '\n')
+
+    return answers, format_hot_functions(profiler, top)
@@ -0,0 +1,362 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+from time import perf_counter
+from typing import Any, Callable
+
+from aoc import metrics
+from aoc.days import (
+    BASELINE_PATH,
+    PARTS,
+    PROFILE_DIR,
+    ROOT,
+    available_days,
+    get_solver,
+    input_path,
+    load_day,
+    read_input,
+    reset_caches,
+    solver_parts,
+)
+from aoc.lazy import lazy_import
+
+# Only needed by some of the options; loaded when first used.
+budget = lazy_import('aoc.budget')
+cache = lazy_import('aoc.cache')
+futures = lazy_import('concurrent.futures')
+incremental = lazy_import('aoc.incremental')
+profiling = lazy_import('aoc.profiling')
+
+def summarize_times(times: list[float]) -> dict[str, float]:
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+    }
+
+def time_call(fn: Callable, arg: Any, repeat: int, before: Callable = None) -> tuple[Any, list[float]]:
+    result = None
+    times = []
+
+    for _ in range(repeat):
+        if before is not None:
+            before()
+
+        start = perf_counter()
+        result = fn(arg)
+        times.append(perf_counter() - start)
+
+    return result, times
+
+# Parsed inputs by (day, path). Solvers must not mutate what `parse` returns,
+# so every part run in this process shares a single parse of each input.
+_parsed: dict[tuple[int, str], tuple[Any, float, dict[str, float]]] = {}
+
+def load_parsed(day: int, path: str, repeat: int = 1, use_cache: bool = False) -> tuple[Any, float, dict[str, float]]:
+    key = (day, path)
+    if key in _parsed:
+        return _parsed[key]
+
+    module = load_day(day)
+
+    start = perf_counter()
+    data = read_input(path)
+    load_time = perf_counter() - start
+
+    parse = (lambda data: cache.cached_parse(day, data)) if use_cache else module.parse
+    parsed, times = time_call(parse, data, repeat)
+    _parsed[key] = (parsed, load_time, summarize_times(times))
+
+    return _parsed[key]
+
+def run_day(day: int, parts: tuple[int, ...] = PARTS, repeat: int = 1, path: str = None, use_cache: bool = False) -> dict:
+    module = load_day(day)
+    path = path or input_path(day)
+    parsed, load_time, parse_times = load_parsed(day, path, repeat, use_cache)
+
+    report = {
+        'day': day,
+        'input': os.path.relpath(path, ROOT),
+        'load': load_time,
+        'parse': parse_times,
+        'parts': {},
+    }
+
+    def before_run():
+        reset_caches(module)
+        metrics.reset()
+
+    for part in parts:
+        solver = get_solver(module, part)
+        if solver is None:
+            continue
+
+        try:
+            answer, times = time_call(solver, parsed, repeat, before_run)
+        except ImportError as error:
+            # A lazily imported dependency of this part is missing.
+            print(f'skipping day {day} part {part}: {error}', file=sys.stderr)
+            continue
+
+        report['parts'][str(part)] = {
+            'answer': answer,
+            **summarize_times(times),
+            'runs': times,
+        }
+
+        if metrics.enabled():
+            # Counters of the last timed run.
+            report['parts'][str(part)]['counters'] = metrics.snapshot()
+
+    if incremental.enabled():
+        incremental.save()
+        report['lines'] = incremental.stats(f'day-{day}/')
+
+    return report
+
+def run_day_budgeted(
+    day: int,
+    parts: tuple[int, ...],
+    repeat: int,
+    path: str,
+    time_limit: float | None,
+    memory_limit: int | None,
+    use_cache: bool = False
+) -> dict:
+    # Every part runs in its own process, which is killed once it goes over a budget.
+    path = path or input_path(day)
+    report = {
+        'day': day,
+        'input': os.path.relpath(path, ROOT),
+        'load': None,
+        'parse': None,
+        'parts': {},
+    }
+
+    for part in parts:
+        if part not in solver_parts(day):
+            continue
+
+        result = budget.run_budgeted(day, part, path, repeat, time_limit, memory_limit, use_cache)
+        if result['status'] != 'ok':
+            report['parts'][str(part)] = {'status': result['status'], 'error': result['error'], 'wall': result['wall']}
+            continue
+
+        if report['parse'] is None:
+            report['parse'] = summarize_times([result['parse']])
+
+        report['parts'][str(part)] = {
+            'status': 'ok',
+            'answer': result['answer'],
+            **summarize_times(result['times']),
+            'runs': result['times'],
+            'peak_rss': result['peak_rss'],
+        }
+
+    return report
+
+def load_estimates(path: str = BASELINE_PATH) -> dict[tuple[int, int], float]:
+    # Median solve times on the real input, as recorded by `python -m aoc.bench --save`.
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r') as file:
+        results = json.load(file).get('results', {})
+
+    estimates = {}
+    for result in results.values():
+        if result.get('status') == 'ok' and result['input'] == os.path.relpath(input_path(result['day']), ROOT):
+            estimates[(result['day'], result['part'])] = result['median']
+
+    return estimates
+
+def schedule(tasks: list[tuple[int, int]], estimates: dict[tuple[int, int], float]) -> list[tuple[int, int]]:
+    # Longest first: the pool hands tasks out in submission order, so starting
+    # with the slowest parts keeps one of them from being the last to start.
+    # Parts without a recorded time go first, as they may be just as slow.
+    return sorted(tasks, key=lambda task: estimates.get(task, float('inf')), reverse=True)
+
+def run_parallel(
+    days: list[int],
+    parts: tuple[int, ...],
+    repeat: int,
+    path: str,
+    jobs: int,
+    estimates: dict[tuple[int, int], float],
+    use_cache: bool = False
+) -> list[dict]:
+    tasks = [(day, part) for day in days for part in solver_parts(day) if part in parts]
+    reports = {}
+
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        submitted = {
+            executor.submit(run_day, day, (part,), repeat, path, use_cache): (day, part)
+            for day, part in schedule(tasks, estimates)
+        }
+
+        for future in futures.as_completed(submitted):
+            day, part = submitted[future]
+            try:
+                report = future.result()
+            except ImportError as error:
+                print(f'skipping day {day} part {part}: {error}', file=sys.stderr)
+                continue
+
+            if day in reports:
+                reports[day]['parts'].update(report['parts'])
+                reports[day].get('lines', {}).update(report.get('lines', {}))
+            else:
+                reports[day] = report
+
+    for report in reports.values():
+        report['parts'] = dict(sorted(report['parts'].items()))
+
+    return [reports[day] for day in sorted(reports)]
+
+def format_seconds(seconds: float | None) -> str:
+    if seconds is None:
+        return '-'
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.1f}us'
+    if seconds < 1:
+        return f'{seconds * 1e3:.2f}ms'
+    return f'{seconds:.3f}s'
+
+def format_table(reports: list[dict]) -> str:
+    header = ('day', 'part', 'answer', 'parse', 'min', 'median')
+    rows = []
+
+    for report in reports:
+        parse = report['parse']['median'] if report['parse'] is not None else None
+
+        for part, result in report['parts'].items():
+            rows.append((
+                str(report['day']),
+                part,
+                str(result['answer']) if 'answer' in result else result['status'],
+                format_seconds(parse),
+                format_seconds(result.get('min')),
+                format_seconds(result.get('median')),
+            ))
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = ['  '.join(cell.rjust(width) for cell, width in zip(header, widths))]
+    lines.append('  '.join('-' * width for width in widths))
+
+    for row in rows:
+        lines.append('  '.join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+    total = sum(result.get('median', 0) for report in reports for result in report['parts'].values())
+    lines.append(f'total median solve time: {format_seconds(total)}')
+
+    for report in reports:
+        for part, result in report['parts'].items():
+            if 'error' in result:
+                lines.append(f'day {report["day"]} part {part}: {result["error"]}')
+
+    return '\n'.join(lines)
+
+def format_counters(reports: list[dict]) -> str:
+    lines = []
+
+    for report in reports:
+        for part, result in report['parts'].items():
+            counters = result.get('counters')
+            if counters:
+                cells = ', '.join(f'{name}={value:,}' for name, value in counters.items())
+                lines.append(f'day {report["day"]} part {part}: {cells}')
+
+    return '\n'.join(lines)
+
+def format_line_stats(reports: list[dict]) -> str:
+    lines = []
+
+    for report in reports:
+        for name, counts in report.get('lines', {}).items():
+            lines.append(f'{name}: {counts["hits"]:,} hits, {counts["misses"]:,} misses, {counts["entries"]:,} stored')
+
+    return '\n'.join(lines)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run and time the day-N solvers.')
+    parser.add_argument('days', nargs='*', type=int, help='days to run (default: all)')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only run the given part')
+    parser.add_argument('--repeat', type=int, default=1, help='timed runs per part')
+    parser.add_argument('--input', help='input file to use instead of day-N-input.txt (single day only)')
+    parser.add_argument('--jobs', type=int, default=1, help='worker processes, 0 for one per CPU')
+    parser.add_argument('--cache', action='store_true', help='load parsed inputs from the on-disk cache (see aoc.cache)')
+    parser.add_argument('--time-limit', type=float, help='seconds before a part is killed (runs each part in its own process)')
+    parser.add_argument('--memory-limit', type=float, help='megabytes of resident memory before a part is killed (runs each part in its own process)')
+    parser.add_argument('--incremental', action='store_true', help='reuse per-line results stored by earlier runs (see aoc.incremental)')
+    parser.add_argument('--metrics', action='store_true', help='collect the solvers\' counters (slows the instrumented parts)')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_DIR, help='run under cProfile and tracemalloc and write the reports to this directory')
+    parser.add_argument('--profile-top', type=int, default=20, help='functions and allocation sites listed per profile')
+    parser.add_argument('--timings', default=BASELINE_PATH, help='baseline JSON used to start the slowest parts first')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    days = args.days or available_days()
+    parts = tuple(args.part) if args.part else PARTS
+
+    if args.input and len(days) != 1:
+        print('--input requires exactly one day', file=sys.stderr)
+        return 2
+
+    if args.metrics:
+        metrics.enable()
+
+    if args.incremental:
+        incremental.enable()
+
+    if args.profile:
+        for day in days:
+            try:
+                answers, hot_functions = profiling.profile_day(day, parts, args.input, args.profile, args.profile_top)
+            except ImportError as error:
+                print(f'skipping day {day}: {error}', file=sys.stderr)
+                continue
+
+            print(f'day {day}: ' + ', '.join(f'part {part} = {answer}' for part, answer in answers.items()))
+            print(hot_functions)
+
+        print(f'profiles written to {os.path.relpath(args.profile, ROOT)}')
+        return 0
+
+    jobs = args.jobs or os.cpu_count()
+    start = perf_counter()
+
+    if args.time_limit is not None or args.memory_limit is not None:
+        memory_limit = None if args.memory_limit is None else int(args.memory_limit * 2 ** 20)
+        reports = [
+            run_day_budgeted(day, parts, args.repeat, args.input, args.time_limit, memory_limit, args.cache)
+            for day in days
+        ]
+    elif jobs > 1:
+        reports = run_parallel(days, parts, args.repeat, args.input, jobs, load_estimates(args.timings), args.cache)
+    else:
+        reports = []
+        for day in days:
+            try:
+                reports.append(run_day(day, parts, args.repeat, args.input, args.cache))
+            except ImportError as error:
+                print(f'skipping day {day}: {error}', file=sys.stderr)
+
+    wall = perf_counter() - start
+
+    if args.json:
+        print(json.dumps({'repeat': args.repeat, 'jobs': jobs, 'wall': wall, 'days': reports}, indent=2, default=str))
+    else:
+        print(format_table(reports))
+        if args.metrics:
+            print(format_counters(reports))
+        if args.incremental:
+            print(format_line_stats(reports))
+        print(f'wall time with {jobs} job(s): {format_seconds(wall)}')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
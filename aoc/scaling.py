@@ -0,0 +1,102 @@
+import argparse
+import json
+import math
+import os
+import sys
+
+from aoc.bench import measure
+from aoc.days import available_days, solver_parts
+from aoc.generators import CAPPED_DAYS, DEFAULT_SEED, write_generated
+from aoc.runner import format_seconds
+
+def fit_exponent(points: list[tuple[float, float]]) -> float | None:
+    # Least-squares slope of log(time) against log(size): time ~ size ** slope.
+    if len(points) < 2:
+        return None
+
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(max(time, 1e-9)) for _, time in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+def scaling_curve(day: int, part: int, scales: list[float], seed: int, repeat: int, timeout: float) -> dict:
+    points = []
+
+    for scale in scales:
+        path = write_generated(day, scale, seed)
+        result = measure(day, part, path, repeat, timeout)
+        result['scale'] = scale
+        result['size'] = os.path.getsize(path)
+        points.append(result)
+
+        # Larger inputs will not finish either.
+        if result['status'] == 'timeout':
+            break
+
+    ok = [(point['size'], point['median']) for point in points if point['status'] == 'ok']
+
+    return {
+        'day': day,
+        'part': part,
+        'points': points,
+        'exponent': None if day in CAPPED_DAYS else fit_exponent(ok),
+        'capped': day in CAPPED_DAYS,
+    }
+
+def format_curves(curves: list[dict], scales: list[float]) -> str:
+    header = f'{"day":>3} {"part":>4} ' + ' '.join(f'{f"x{scale:g}":>10}' for scale in scales) + f' {"exponent":>9}'
+    lines = [header]
+
+    for curve in curves:
+        cells = []
+        for scale in scales:
+            point = next((p for p in curve['points'] if p['scale'] == scale), None)
+            if point is None:
+                cells.append('-')
+            elif point['status'] != 'ok':
+                cells.append(point['status'])
+            else:
+                cells.append(format_seconds(point['median']))
+
+        if curve['capped']:
+            exponent = 'capped'
+        else:
+            exponent = '-' if curve['exponent'] is None else f'{curve["exponent"]:.2f}'
+        lines.append(f'{curve["day"]:>3} {curve["part"]:>4} ' + ' '.join(f'{cell:>10}' for cell in cells) + f' {exponent:>9}')
+
+    return '\n'.join(lines)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Fit the empirical growth exponent of each solver on generated inputs.')
+    parser.add_argument('days', nargs='*', type=int, help='days to measure (default: all)')
+    parser.add_argument('--scale', type=float, nargs='+', default=[1, 10, 100], help='scale factors')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per point')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds before a point is abandoned')
+    parser.add_argument('--json', action='store_true', help='print the curves as JSON')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    scales = sorted(args.scale)
+    curves = []
+
+    for day in args.days or available_days():
+        for part in solver_parts(day):
+            curves.append(scaling_curve(day, part, scales, args.seed, args.repeat, args.timeout))
+
+    if args.json:
+        print(json.dumps({'seed': args.seed, 'scales': scales, 'curves': curves}, indent=2))
+    else:
+        print(format_curves(curves, scales))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
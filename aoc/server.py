@@ -0,0 +1,177 @@
+'''
+A long-lived solver process that answers requests over a Unix socket.
+
+`python -m aoc.server serve` imports every day once and keeps the parsed
+inputs it has seen, so repeated requests skip both interpreter startup and
+parsing. The protocol is one JSON object per line in each direction:
+
+    {"day": 12, "part": 2, "path": "day-12/day-12-input.txt"}
+    {"day": 12, "part": 2, "data": "???.### 1,1,3\\n..."}
+
+and every request gets back one line with the answer and the parse and solve
+times, or an error. `python -m aoc.server solve DAY PART` is a small client.
+'''
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from collections import OrderedDict
+from time import perf_counter
+from typing import Any
+
+from aoc.days import ROOT, available_days, get_solver, input_path, load_day, read_input, reset_caches
+
+SOCKET_PATH = os.path.join(ROOT, '.cache', 'server.sock')
+
+# Parsed inputs kept in memory, least recently used first.
+PARSED_CACHE_SIZE = 64
+
+class SolverState:
+    def __init__(self, cache_size: int = PARSED_CACHE_SIZE) -> None:
+        self.cache_size = cache_size
+        self.parsed: OrderedDict[tuple[int, str], Any] = OrderedDict()
+        self.modules = {}
+
+        for day in available_days():
+            try:
+                self.modules[day] = load_day(day)
+            except ImportError as error:
+                print(f'day {day} not loaded: {error}', file=sys.stderr)
+
+    def get_parsed(self, day: int, data: str) -> tuple[Any, float, bool]:
+        key = (day, hashlib.sha256(data.encode()).hexdigest())
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key], 0.0, True
+
+        start = perf_counter()
+        parsed = self.modules[day].parse(data)
+        parse_time = perf_counter() - start
+
+        self.parsed[key] = parsed
+        if len(self.parsed) > self.cache_size:
+            self.parsed.popitem(last=False)
+
+        return parsed, parse_time, False
+
+    def solve(self, request: dict) -> dict:
+        day = int(request['day'])
+        part = int(request['part'])
+
+        module = self.modules.get(day)
+        if module is None:
+            raise ValueError(f'day {day} is not loaded')
+
+        solver = get_solver(module, part)
+        if solver is None:
+            raise ValueError(f'day {day} has no part {part}')
+
+        if 'data' in request:
+            data = request['data']
+        else:
+            data = read_input(os.path.join(ROOT, request.get('path') or input_path(day)))
+
+        parsed, parse_time, cached = self.get_parsed(day, data)
+
+        reset_caches(module)
+        start = perf_counter()
+        answer = solver(parsed)
+        solve_time = perf_counter() - start
+
+        return {
+            'status': 'ok',
+            'day': day,
+            'part': part,
+            'answer': str(answer),
+            'parse': parse_time,
+            'solve': solve_time,
+            'cached': cached,
+        }
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                response = self.server.state.solve(json.loads(line))
+            except Exception as error:
+                response = {'status': 'error', 'error': f'{type(error).__name__}: {error}'}
+
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+class SolverServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, state: SolverState) -> None:
+        self.state = state
+        super().__init__(path, RequestHandler)
+
+def serve(path: str = SOCKET_PATH, cache_size: int = PARSED_CACHE_SIZE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)
+
+    state = SolverState(cache_size)
+    # Stop cleanly on `kill` too, so the socket file is removed.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with SolverServer(path, state) as server:
+        print(f'serving {len(state.modules)} days on {path}', file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+def request(day: int, part: int, path: str = None, data: str = None, socket_path: str = SOCKET_PATH) -> dict:
+    message = {'day': day, 'part': part}
+    if data is not None:
+        message['data'] = data
+    elif path is not None:
+        message['path'] = os.path.abspath(path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(message).encode() + b'\n')
+
+        with client.makefile('rb') as reader:
+            return json.loads(reader.readline())
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Keep the solvers loaded in a server process and query it over a Unix socket.')
+    parser.add_argument('--socket', default=SOCKET_PATH, help='Unix socket path')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help='start the server')
+    serve_parser.add_argument('--cache-size', type=int, default=PARSED_CACHE_SIZE, help='parsed inputs kept in memory')
+
+    solve_parser = commands.add_parser('solve', help='send one request to a running server')
+    solve_parser.add_argument('day', type=int)
+    solve_parser.add_argument('part', type=int)
+    solve_parser.add_argument('--input', help='input file to use instead of day-N-input.txt')
+    solve_parser.add_argument('--stdin', action='store_true', help='send the input read from stdin')
+
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == 'serve':
+        serve(args.socket, args.cache_size)
+        return 0
+
+    data = sys.stdin.read() if args.stdin else None
+    response = request(args.day, args.part, args.input, data, args.socket)
+    print(json.dumps(response))
+
+    return 0 if response['status'] == 'ok' else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+'''
+Cold-start cost of the runner and of each day module.
+
+Every measurement runs in a fresh interpreter, so nothing is already in
+sys.modules: `runner` is the time to import aoc.runner, `import` the time
+to load the day module, and `process` the wall time of the whole child,
+interpreter startup included.
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+from aoc.days import ROOT, available_days
+from aoc.runner import format_seconds
+
+PROBE = '''
+import json
+from time import perf_counter
+
+start = perf_counter()
+import aoc.runner
+runner = perf_counter() - start
+
+from aoc.days import load_day
+
+start = perf_counter()
+try:
+    load_day({day})
+    error = None
+except ImportError as exc:
+    error = str(exc)
+
+print(json.dumps({{'runner': runner, 'import': perf_counter() - start, 'error': error}}))
+'''
+
+def probe(day: int) -> dict:
+    start = perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(day=day)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output)
+    result['process'] = perf_counter() - start
+    return result
+
+def measure_startup(day: int, repeat: int) -> dict:
+    runs = [probe(day) for _ in range(repeat)]
+
+    return {
+        'day': day,
+        'runner': statistics.median(run['runner'] for run in runs),
+        'import': statistics.median(run['import'] for run in runs),
+        'process': statistics.median(run['process'] for run in runs),
+        'error': runs[-1]['error'],
+    }
+
+def format_startup(results: list[dict]) -> str:
+    lines = [f'{"day":>3} {"runner":>10} {"import":>10} {"process":>10}']
+
+    for result in results:
+        line = (
+            f'{result["day"]:>3} {format_seconds(result["runner"]):>10} '
+            f'{format_seconds(result["import"]):>10} {format_seconds(result["process"]):>10}'
+        )
+        if result['error']:
+            line += f'  ({result["error"]})'
+        lines.append(line)
+
+    return '\n'.join(lines)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Measure the import time of the runner and of each day module in a fresh interpreter.')
+    parser.add_argument('days', nargs='*', type=int, help='days to measure (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per day')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    results = [measure_startup(day, args.repeat) for day in args.days or available_days()]
+
+    if args.json:
+        print(json.dumps({'repeat': args.repeat, 'days': results}, indent=2))
+    else:
+        print(format_startup(results))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
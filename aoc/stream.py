@@ -0,0 +1,235 @@
+'''
+Stream a line-oriented input from disk instead of reading it whole.
+
+`iter_lines` memory-maps the file and decodes it a chunk at a time, cutting
+every chunk at a line break, so only the current chunk is ever held as text.
+Pages already read are handed back to the kernel as it goes, which keeps the
+resident size flat even for inputs larger than memory.
+
+Days whose parts can consume their lines one at a time define `stream01` /
+`stream02`, taking any iterable of lines. The reader only bounds the memory
+taken by the text; a day must also drop whatever it keeps per line, such as
+a memoization cache, for the whole run to stay small. A day whose part sums
+one value per line can instead define `chunk01` / `chunk02`, which get the
+raw bytes of each chunk and return that chunk's share of the sum without
+splitting it into lines:
+
+    python -m aoc.stream 12 --input generated/day-12/huge.txt
+'''
+
+import argparse
+import itertools
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from types import ModuleType
+from typing import Callable, Iterator
+
+from aoc.budget import format_megabytes, peak_rss
+from aoc.days import PARTS, available_days, input_path, load_day, module_path
+from aoc.runner import format_seconds
+
+CHUNK_SIZE = 1 << 20
+
+def content_end(buffer: mmap.mmap, size: int) -> int:
+    # A final line break ends the last line rather than starting another.
+    return size - 1 if buffer[size - 1] == ord('\n') else size
+
+def iter_byte_chunks(path: str, chunk_size: int = CHUNK_SIZE, start: int = 0, stop: int = None) -> Iterator[bytes]:
+    # `start` and `stop` select the lines of one range from line_ranges.
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+
+            limit = content_end(buffer, size) if stop is None else stop
+            released = start // mmap.PAGESIZE * mmap.PAGESIZE
+
+            while start < limit:
+                # A chunk runs to the first line break after chunk_size bytes,
+                # so a line is never split and neither is a UTF-8 character.
+                end = buffer.find(b'\n', start + chunk_size - 1, limit)
+                if end == -1:
+                    end = limit
+
+                yield buffer[start:end]
+                start = end + 1
+
+                done = min(start, size) // mmap.PAGESIZE * mmap.PAGESIZE
+                if hasattr(mmap, 'MADV_DONTNEED') and done > released:
+                    buffer.madvise(mmap.MADV_DONTNEED, released, done - released)
+                    released = done
+
+def iter_chunks(path: str, chunk_size: int = CHUNK_SIZE, start: int = 0, stop: int = None) -> Iterator[str]:
+    for chunk in iter_byte_chunks(path, chunk_size, start, stop):
+        yield chunk.decode()
+
+def iter_lines(path: str, chunk_size: int = CHUNK_SIZE, start: int = 0, stop: int = None) -> Iterator[str]:
+    # Same lines as data.split('\n'), except that a final line break doesn't
+    # add an empty line.
+    for chunk in iter_chunks(path, chunk_size, start, stop):
+        yield from chunk.split('\n')
+
+def line_ranges(path: str, pieces: int) -> list[tuple[int, int]]:
+    # Byte ranges of about size / pieces each that split the file at line
+    # breaks; the break between two ranges belongs to neither.
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return []
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            limit = content_end(buffer, size)
+            ranges = []
+            start = 0
+
+            for piece in range(1, pieces):
+                end = buffer.find(b'\n', max(start, limit * piece // pieces), limit)
+                if end == -1:
+                    break
+                ranges.append((start, end))
+                start = end + 1
+
+            ranges.append((start, limit))
+
+    return ranges
+
+def iter_batches(path: str, batch_size: int, chunk_size: int = CHUNK_SIZE) -> Iterator[list[str]]:
+    lines = iter_lines(path, chunk_size)
+
+    while True:
+        batch = list(itertools.islice(lines, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def get_stream_solver(module: ModuleType, part: int) -> Callable | None:
+    return getattr(module, f'stream0{part}', None)
+
+def get_chunk_solver(module: ModuleType, part: int) -> Callable | None:
+    return getattr(module, f'chunk0{part}', None)
+
+def stream_part(module: ModuleType, part: int, path: str, chunk_size: int = CHUNK_SIZE, start: int = 0, stop: int = None) -> tuple:
+    # (answer, lines). A chunk solver gets the raw bytes of every chunk and
+    # returns its share of the sum; otherwise the lines go to stream0N.
+    chunk_solver = get_chunk_solver(module, part)
+    if chunk_solver is not None:
+        answer = lines = 0
+        for chunk in iter_byte_chunks(path, chunk_size, start, stop):
+            answer += chunk_solver(chunk)
+            lines += chunk.count(b'\n') + 1
+        return answer, lines
+
+    # zip draws a line before a count, so the counter ends at the number of lines.
+    counter = itertools.count()
+    answer = get_stream_solver(module, part)(line for line, _ in zip(iter_lines(path, chunk_size, start, stop), counter))
+    return answer, next(counter)
+
+def streaming_days() -> list[int]:
+    days = []
+    for day in available_days():
+        with open(module_path(day), 'r') as file:
+            if 'def stream01(' in file.read():
+                days.append(day)
+
+    return days
+
+def run_stream(day: int, parts: tuple[int, ...], path: str, chunk_size: int = CHUNK_SIZE) -> list[dict]:
+    module = load_day(day)
+    results = []
+
+    for part in parts:
+        if get_stream_solver(module, part) is None and get_chunk_solver(module, part) is None:
+            continue
+
+        start = perf_counter()
+        answer, lines = stream_part(module, part, path, chunk_size)
+        results.append({'part': part, 'answer': answer, 'time': perf_counter() - start, 'lines': lines})
+
+    return results
+
+def solve_range(day: int, part: int, path: str, start: int, stop: int, chunk_size: int = CHUNK_SIZE):
+    answer, _ = stream_part(load_day(day), part, path, chunk_size, start, stop)
+    return answer
+
+def run_split(day: int, parts: tuple[int, ...], path: str, workers: int, chunk_size: int = CHUNK_SIZE) -> list[dict]:
+    # Only for days whose parts sum independent per-line values
+    # (INDEPENDENT_LINES): every worker streams its own range of lines and
+    # the partial sums are added up.
+    module = load_day(day)
+    if not getattr(module, 'INDEPENDENT_LINES', False):
+        raise ValueError(f'day {day} does not sum independent lines')
+
+    ranges = line_ranges(path, workers)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in parts:
+            if get_stream_solver(module, part) is None and get_chunk_solver(module, part) is None:
+                continue
+
+            start = perf_counter()
+            futures = [executor.submit(solve_range, day, part, path, *bounds, chunk_size) for bounds in ranges]
+            answer = sum(future.result() for future in futures)
+            results.append({'part': part, 'answer': answer, 'time': perf_counter() - start})
+
+    return results
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Solve a line-oriented day while streaming its input from disk.')
+    parser.add_argument('day', type=int, help=f'day to run, one of {streaming_days()}')
+    parser.add_argument('--input', help='input file to use instead of day-N-input.txt')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only run the given part')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='bytes decoded at a time')
+    parser.add_argument('--workers', type=int, nargs='+', help='split the lines over this many processes; several counts compare their scaling')
+    return parser.parse_args(argv)
+
+def report_scaling(day: int, parts: tuple[int, ...], path: str, counts: list[int], chunk_size: int) -> int:
+    baseline = {}
+
+    for workers in counts:
+        try:
+            results = run_split(day, parts, path, workers, chunk_size)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+
+        for result in results:
+            part = result['part']
+            baseline.setdefault(part, result['time'])
+            speedup = baseline[part] / max(result['time'], 1e-9)
+            print(
+                f'day {day} part {part}: {result["answer"]} in {format_seconds(result["time"])} '
+                f'with {workers} worker(s), {speedup:.2f}x against {counts[0]}'
+            )
+
+    return 0
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    parts = tuple(args.part) if args.part else PARTS
+    path = args.input or input_path(args.day)
+
+    if args.workers:
+        return report_scaling(args.day, parts, path, args.workers, args.chunk_size)
+
+    results = run_stream(args.day, parts, path, args.chunk_size)
+    if not results:
+        print(f'day {args.day} has no streaming solver', file=sys.stderr)
+        return 2
+
+    for result in results:
+        rate = result['lines'] / max(result['time'], 1e-9)
+        print(f'day {args.day} part {result["part"]}: {result["answer"]} in {format_seconds(result["time"])}, {rate:,.0f} lines/s')
+    print(f'peak memory: {format_megabytes(peak_rss())}')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,15 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import incremental
+from aoc.automaton import Automaton
+
+# Both parts sum one value per line, so aoc.stream --workers may solve
+# separate ranges of lines and add them up.
+INDEPENDENT_LINES = True
+
 '''
 --- Day 1: Trebuchet?! ---
 Something is wrong with global snow production, and you've been selected to take a look. The Elves have even given you a map; on it, they've used stars to mark the top fifty locations that are likely to be having problems.
@@ -25,32 +37,62 @@ Consider your entire calibration document. What is the sum of all of the calibra
 Your puzzle answer was 54708.
 '''
 
-def solve01(data):
+def parse(data: str) -> list[str]:
+    return data.split('\n')
+
+@incremental.per_line()
+def calibration_value(line: str) -> int:
     numbers = ['1','2', '3', '4', '5', '6', '7', '8', '9']
-    ans = 0
+    lenght = len(line)
+    num = ''
+
+    for i in range(lenght):
+        if line[i] in numbers:
+            a = line[i]
+            num = a 
+            break
+
+    for j in range(lenght - 1, -1, -1):
+        if line[j] in numbers:
+            b = line[j]
+            num = num + b
+            break
 
-    for line in data.split('\n'):
-        lenght = len(line)
+    return int(num)
 
-        if lenght == 0:
+def solve01(lines):
+    ans = 0
+
+    for line in lines:
+        if len(line) == 0:
             continue
-        
-        num = ''
-
-        for i in range(lenght):
-            if line[i] in numbers:
-                a = line[i]
-                num = a 
-                break
-
-        for j in range(lenght - 1, -1, -1):
-            if line[j] in numbers:
-                b = line[j]
-                num = num + b
-                break
-        ans += int(num)
+
+        ans += calibration_value(line)
 
     return ans
+
+def stream01(lines) -> int:
+    return solve01(lines)
+
+# Every byte but the digits and the line breaks.
+NOT_DIGITS = bytes(byte for byte in range(256) if not ord('0') <= byte <= ord('9') and byte != ord('\n'))
+
+def calibration_sum(buffer: bytes) -> int:
+    # Whole-buffer passes in C: drop everything but digits and line breaks,
+    # then each remaining line starts with its first digit and ends with its last.
+    digits = [line for line in buffer.translate(None, NOT_DIGITS).split(b'\n') if line]
+    zero = ord('0')
+
+    return 10 * sum(line[0] for line in digits) + sum(line[-1] for line in digits) - 11 * zero * len(digits)
+
+def parse_bytes(data: str) -> bytes:
+    return data.encode()
+
+def solve01_bytes(buffer: bytes) -> int:
+    return calibration_sum(buffer)
+
+def chunk01(buffer: bytes) -> int:
+    return calibration_sum(buffer)
     
 '''
 --- Part Two ---
@@ -72,7 +114,8 @@ What is the sum of all of the calibration values?
 Your puzzle answer was 54087.
 '''
 
-def solve02(data):
+@incremental.per_line()
+def calibration_value_with_letters(line: str) -> int:
     numbers = ['1','2', '3', '4', '5', '6', '7', '8', '9']
     nums_in_letters = {
         'one': '1',
@@ -97,48 +140,78 @@ def solve02(data):
         'thgie': '8',
         'enin': '9'
     }
+
+    lenght = len(line)
+    first_idx = 9999999999
+    second_idx = 9999999999
     
+    first_digit = ''
+    second_digit = ''
+
+    for i in range(lenght):
+        if line[i] in numbers:
+            first_idx = i
+            first_digit = line[i]
+            break
+
+    for num_in_letter in nums_in_letters:
+        idx = line.find(num_in_letter)
+
+        if idx != -1 and idx < first_idx:
+            first_digit = nums_in_letters[num_in_letter]
+            first_idx = idx
+
+    reverse = ''.join(reversed(line))
+
+    for j in range(lenght):
+        if reverse[j] in numbers:
+            second_idx = j
+            second_digit = reverse[j]
+            break
+
+    for num_in_letter in reversed_num_in_letters:
+        idx = reverse.find(num_in_letter)
+
+        if idx != -1 and idx < second_idx:
+            second_digit = reversed_num_in_letters[num_in_letter]
+            second_idx = idx
+
+    return int(first_digit + second_digit)
+
+def solve02(lines):
     ans = 0
     
-    for line in data.split('\n'):
-        lenght = len(line)
-        if lenght == 0:
+    for line in lines:
+        if len(line) == 0:
             continue
-        first_idx = 9999999999
-        second_idx = 9999999999
-        
-        first_digit = ''
-        second_digit = ''
 
-        for i in range(lenght):
-            if line[i] in numbers:
-                first_idx = i
-                first_digit = line[i]
-                break
+        ans += calibration_value_with_letters(line)
 
-        for num_in_letter in nums_in_letters:
-            idx = line.find(num_in_letter)
+    return ans
+
+def stream02(lines) -> int:
+    return solve02(lines)
 
-            if idx != -1 and idx < first_idx:
-                first_digit = nums_in_letters[num_in_letter]
-                first_idx = idx
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
 
-        reverse = ''.join(reversed(line))
+def digit_automaton(words: list[str] = DIGIT_WORDS) -> Automaton:
+    # The digits 1-9 plus words[i] spelling i + 1.
+    patterns = {str(digit): digit for digit in range(1, 10)}
+    for digit, word in enumerate(words, 1):
+        patterns[word] = digit
 
-        for j in range(lenght):
-            if reverse[j] in numbers:
-                second_idx = j
-                second_digit = reverse[j]
-                break
+    return Automaton(patterns)
 
-        for num_in_letter in reversed_num_in_letters:
-            idx = reverse.find(num_in_letter)
+DIGITS = digit_automaton()
 
-            if idx != -1 and idx < second_idx:
-                second_digit = reversed_num_in_letters[num_in_letter]
-                second_idx = idx
+def solve02_automaton(lines) -> int:
+    # One forward pass per line instead of 18 finds and a reversed copy.
+    ans = 0
 
-        ans += int(first_digit + second_digit)
+    for line in lines:
+        found = DIGITS.first_last(line)
+        if found is not None:
+            ans += found[0] * 10 + found[1]
 
     return ans
 
@@ -146,6 +219,7 @@ if __name__ == "__main__":
     # data = open('day-1-input.test.txt', 'r').read()
     # data = open('day-1-input-2.test.txt', 'r').read()
     data = open('day-1-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
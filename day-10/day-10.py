@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid
+
 '''
 --- Day 10: Pipe Maze ---
 You use the hang glider to ride the hot air from Desert Island all the way up to the floating metal island. This island is surprisingly cold and there definitely aren't any thermals to glide on, so you leave your hang glider behind.
@@ -142,49 +149,33 @@ PIPES_TO = {
 }
 }
 
-def parse_input(data: str) -> list[list[str]]:
-    return list(list(line) for line in data.split('\n'))
+def parse(data: str) -> Grid:
+    # A border of ground keeps the walk from leaving the grid.
+    return Grid.parse(data, border='.')
 
-def get_starting_pos(matrix: list[list[str]]) -> tuple[int, int]:
-    rows = len(matrix)
-    cols = len(matrix[0])
-
-    for i in range(rows):
-        for j in range(cols):
-            if matrix[i][j] == 'S':
-                return (i, j)
-    return (-1, -1)
-    
-def get_adjacent_pipes(pos: tuple[int, int], matrix: list[list[str]], exclude: tuple[int, int] = None) -> list[tuple[str, int, int]]:
-    rows = len(matrix)
-    cols = len(matrix[0])
-    
-    x, y = pos
-    next_positions = [('up', -1, 0), ('right', 0, 1), ('down', 1, 0), ('left', 0, -1)]
+def get_adjacent_pipes(pos: int, grid: Grid, exclude: int = None) -> list[tuple[str, int]]:
+    next_positions = [('up', grid.up), ('right', grid.right), ('down', grid.down), ('left', grid.left)]
     pipes = []
 
-    for name, i, j in next_positions:
-        i = x + i
-        j = y + j
+    for name, offset in next_positions:
+        idx = pos + offset
         
         if exclude is not None:
-            if (i, j) == exclude:
+            if idx == exclude:
                 continue
 
-        if (0 <= i < rows) and (0 <= j < cols):
-            if matrix[i][j] in PIPES_TO[name][matrix[x][y]]:
-                pipes.append((matrix[i][j], i, j))
+        if grid[idx] in PIPES_TO[name][grid[pos]]:
+            pipes.append((grid[idx], idx))
     return pipes
 
-def solve01(data: str):
-    matrix = parse_input(data)
-    start_pos = get_starting_pos(matrix)
-    starting_pipes = get_adjacent_pipes(start_pos, matrix)
+def solve01(grid: Grid):
+    start_pos = grid.find('S')
+    starting_pipes = get_adjacent_pipes(start_pos, grid)
 
     pipes = {}
     idx = 0
-    for pipe, i, j in starting_pipes:
-        pipes[idx] = (pipe, i, j, 1)
+    for pipe, pos in starting_pipes:
+        pipes[idx] = (pipe, pos, 1)
         idx += 1
     
     prevs = {}
@@ -193,17 +184,17 @@ def solve01(data: str):
         to_delete = []
 
         for idx in pipes.keys():
-            pipe, i, j, count = pipes[idx]
+            pipe, pos, count = pipes[idx]
 
             prev = None
             if idx in prevs:
                 prev = prevs[idx]
 
-            next = get_adjacent_pipes((i, j), matrix, prev)
+            next = get_adjacent_pipes(pos, grid, prev)
             if len(next) == 1:
-               p, x, y = next[0]
-               pipes[idx] = (p, x, y, count + 1)
-               prevs[idx] = (i, j)
+               p, next_pos = next[0]
+               pipes[idx] = (p, next_pos, count + 1)
+               prevs[idx] = pos
             if len(next) == 0:
                to_delete.append(idx)
 
@@ -212,7 +203,7 @@ def solve01(data: str):
             if idx in prevs:
                 del prevs[idx]
 
-    _, _, _, count = set(pipes.values()).pop()
+    _, _, count = set(pipes.values()).pop()
 
     return count
 
@@ -312,7 +303,7 @@ Figure out whether you have time to search for the nest by calculating the area
 Your puzzle answer was 273.
 '''
 
-def solve02(data: str):
+def solve02(grid: Grid):
     def area_by_shoelace(points_in_clock_order: list[tuple[int, int]]) -> float:
         size = len(points_in_clock_order)
         area = 0
@@ -328,23 +319,21 @@ def solve02(data: str):
     def points_inside_by_picks_theorem(area: float, number_of_points: int) -> int:
         return int(area + 1 - (number_of_points / 2))
 
-    matrix = parse_input(data)
-    start_pos = get_starting_pos(matrix)
-    starting_pipes = get_adjacent_pipes(start_pos, matrix)
+    start_pos = grid.find('S')
+    starting_pipes = get_adjacent_pipes(start_pos, grid)
 
-    _, x, y = starting_pipes[0]
+    _, curr = starting_pipes[0]
 
-    curr = (x, y)
     prev = None
     border_points_in_clock_order = []
 
     while curr != start_pos:
-        next = get_adjacent_pipes(curr, matrix, prev)
+        next = get_adjacent_pipes(curr, grid, prev)
         if len(next) == 1:
-            p, x, y = next[0]
-            border_points_in_clock_order.append((x, y))
+            _, pos = next[0]
+            border_points_in_clock_order.append(grid.position(pos))
             prev = curr
-            curr = (x, y)
+            curr = pos
         elif len(next) == 0:
             curr = start_pos
             prev = curr
@@ -356,6 +345,7 @@ def solve02(data: str):
 if __name__ == "__main__":
     # data = open('day-10-input.test.txt', 'r').read()
     data = open('day-10-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
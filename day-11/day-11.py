@@ -1,5 +1,11 @@
+import os
+import sys
 from itertools import combinations
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid
+
 '''
 --- Day 11: Cosmic Expansion ---
 You continue following signs for "Hot Springs" and eventually come across an observatory. The Elf within turns out to be a researcher studying cosmic expansion using the giant telescope here.
@@ -103,41 +109,18 @@ def shortest_path_lenght(a: tuple[int, int], b: tuple[int, int]) -> int:
 
     return m + n
 
-def calculate_sum_of_distances(data: str, constant: int) -> int:
-    matrix = list(list(line) for line in data.split('\n'))
-    cols = {}
-    rows = {}
-    
-    total_rows = len(matrix)
-    total_cols = len(matrix[0])
-    
-    for i in range(total_rows):
-        for j in range(total_cols):
-            if matrix[i][j] == '.':
-                if i not in rows:
-                    rows[i] = 0
-                if j not in cols:
-                    cols[j] = 0
-                rows[i] += 1
-                cols[j] += 1
-    
-    expanded_rows = []
-    expanded_cols = []
-    for i in rows:
-        if rows[i] == total_cols:
-            expanded_rows.append(i)
-    
-    for i in cols:
-        if cols[i] == total_rows:
-            expanded_cols.append(i)
+def parse(data: str) -> tuple[list[tuple[int, int]], list[int], list[int]]:
+    grid = Grid.parse(data)
+    galaxy = ord('#')
 
-    points = []
-    
-    for i in range(total_rows):
-        for j in range(total_cols):
-            if matrix[i][j] == '#':
-                points.append((i, j))
+    expanded_rows = [i for i, row in enumerate(grid.rows()) if galaxy not in row]
+    expanded_cols = [j for j, col in enumerate(grid.columns()) if galaxy not in col]
+    points = [grid.position(idx) for idx in grid.find_all('#')]
+
+    return points, expanded_rows, expanded_cols
 
+def calculate_sum_of_distances(parsed: tuple[list[tuple[int, int]], list[int], list[int]], constant: int) -> int:
+    points, expanded_rows, expanded_cols = parsed
     combinations_of_two = list(combinations(points, 2))
 
     ans = 0
@@ -165,8 +148,8 @@ def calculate_sum_of_distances(data: str, constant: int) -> int:
     
     return ans
 
-def solve01(data: str) -> int:
-    return calculate_sum_of_distances(data, 1)
+def solve01(parsed) -> int:
+    return calculate_sum_of_distances(parsed, 1)
 
 '''
 --- Part Two ---
@@ -181,12 +164,13 @@ Starting with the same initial image, expand the universe according to these new
 Your puzzle answer was 377318892554.
 '''
 
-def solve02(data: str) -> int:
-    return calculate_sum_of_distances(data, 1_000_000)
+def solve02(parsed) -> int:
+    return calculate_sum_of_distances(parsed, 1_000_000)
 
 if __name__ == "__main__":
     # data = open('day-11-input.test.txt', 'r').read()
     data = open('day-11-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
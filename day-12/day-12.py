@@ -1,5 +1,11 @@
+import os
+import sys
 from functools import cache
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import incremental, metrics
+
 '''
 --- Day 12: Hot Springs ---
 You finally reach the hot springs! You can see steam rising from secluded areas attached to the primary, ornate building.
@@ -94,23 +100,55 @@ def count(line: str, nums: tuple) -> int:
 
     return result
 
-def parse_input(data: str) -> list[tuple[str, tuple]]:
+def record_cache_info():
+    if metrics.enabled():
+        info = count.cache_info()
+        metrics.add('cache_hits', info.hits)
+        metrics.add('cache_misses', info.misses)
+
+@incremental.per_line()
+def arrangements(springs: str, nums: tuple) -> int:
+    return count(springs, nums)
+
+@incremental.per_line()
+def unfolded_arrangements(springs: str, nums: tuple) -> int:
+    return count("?".join([springs] * 5), nums * 5)
+
+def parse_record(line: str) -> tuple[str, tuple]:
+    springs, nums = line.split()
+    return (springs, tuple(map(int, nums.split(","))))
+
+def parse(data: str) -> list[tuple[str, tuple]]:
     parsed = []
     for line in data.split('\n'):
-        springs, nums = line.split()
-        nums = tuple(map(int, nums.split(",")))
-        parsed.append((springs, nums))
+        parsed.append(parse_record(line))
 
     return parsed
 
-def solve01(data: str) -> int:
+def solve01(parsed: list[tuple[str, tuple]]) -> int:
+    ans = 0
+
+    for springs, nums in parsed:
+        ans += arrangements(springs, nums)
+
+    record_cache_info()
+    return ans
+
+def stream_records(lines, arrangements_of) -> int:
+    # The count cache is emptied after every record so that memory stays
+    # bound by the longest record rather than growing with the input.
     ans = 0
 
-    for springs, nums in parse_input(data):
-        ans += count(springs, nums)
+    for line in lines:
+        ans += arrangements_of(*parse_record(line))
+        record_cache_info()
+        count.cache_clear()
 
     return ans
 
+def stream01(lines) -> int:
+    return stream_records(lines, arrangements)
+
 '''
 --- Part Two ---
 As you look out at the field of springs, you feel like there are way more springs than the condition records list. When you examine the records, you discover that they were actually folded up this whole time!
@@ -141,20 +179,22 @@ Unfold your condition records; what is the new sum of possible arrangement count
 Your puzzle answer was 8475948826693.
 '''
 
-def solve02(data: str) -> int:
+def solve02(parsed: list[tuple[str, tuple]]) -> int:
     ans = 0
 
-    for springs, nums in parse_input(data):
-        springs = "?".join([springs] * 5)
-        nums *= 5
-
-        ans += count(springs, nums)
+    for springs, nums in parsed:
+        ans += unfolded_arrangements(springs, nums)
 
+    record_cache_info()
     return ans
 
+def stream02(lines) -> int:
+    return stream_records(lines, unfolded_arrangements)
+
 if __name__ == "__main__":
     # data = open('day-12-input.test.txt', 'r').read()
     data = open('day-12-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
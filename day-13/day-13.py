@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid
+
 '''
 --- Day 13: Point of Incidence ---
 With your help, the hot springs team locates an appropriate spring which launches you neatly and precisely up to the edge of Lava Island.
@@ -76,15 +83,12 @@ def summarize(val: tuple[str, int]) -> int:
 
     return -1
 
-def are_equals(matrix, j, k):
-    a = tuple(matrix[j])
-    b = tuple(matrix[k])
+def are_equals(lines: list[bytes], j, k):
+    return lines[j] == lines[k]
 
-    return a == b
-
-def are_similar(matrix, j, k):
-    a = matrix[j]
-    b = matrix[k]
+def are_similar(lines: list[bytes], j, k):
+    a = lines[j]
+    b = lines[k]
     counts = 0
 
     for i in range(len(a)):
@@ -93,15 +97,15 @@ def are_similar(matrix, j, k):
 
     return counts == (len(a) - 1)
 
-def find_reflection_index(matrix: list[list[str]]) -> int:
-    nrows = len(matrix)
+def find_reflection_index(lines: list[bytes]) -> int:
+    nrows = len(lines)
     
     for i in range(nrows - 1):
         j = i
         k = i + 1
         found = True
         while j >= 0 and k < nrows:
-            if not are_equals(matrix, j, k):
+            if not are_equals(lines, j, k):
                 found = False
                 break
                     
@@ -111,8 +115,8 @@ def find_reflection_index(matrix: list[list[str]]) -> int:
             return i
     return -1
     
-def find_reflection_index_with_smug(matrix: list[list[str]]) -> int:
-    nrows = len(matrix)
+def find_reflection_index_with_smug(lines: list[bytes]) -> int:
+    nrows = len(lines)
     
     for i in range(nrows - 1):
         j = i
@@ -120,10 +124,10 @@ def find_reflection_index_with_smug(matrix: list[list[str]]) -> int:
         found = True
         smug_found = False
         while j >= 0 and k < nrows:
-            equals = are_equals(matrix, j, k)
+            equals = are_equals(lines, j, k)
             if not equals:
                 if not smug_found:
-                    if are_similar(matrix, j, k):
+                    if are_similar(lines, j, k):
                         smug_found = True
                     else:
                         found = False
@@ -138,33 +142,33 @@ def find_reflection_index_with_smug(matrix: list[list[str]]) -> int:
     return -1
     
     
-def get_reflection_idx(matrix: list[list[str]], solution: int) -> tuple[str, int]:
-    idx = find_reflection_index(matrix) if solution == 1 else find_reflection_index_with_smug(matrix)
-    
+def get_reflection_idx(grid: Grid, solution: int) -> tuple[str, int]:
+    find = find_reflection_index if solution == 1 else find_reflection_index_with_smug
+
+    idx = find(grid.rows())
     if idx != -1:
         return ('row', idx)
     
-    transposed = list(zip(*matrix))
-    idx = find_reflection_index(transposed) if solution == 1 else find_reflection_index_with_smug(transposed)
+    idx = find(grid.columns())
     if idx != -1:
         return ('col', idx)
 
     return (None, -1)
 
-def solve(data: str, solution: int) -> int:
-    matrixes = data.split('\n\n')
-    
+def parse(data: str) -> list[Grid]:
+    return list(Grid.parse(pattern) for pattern in data.split('\n\n'))
+
+def solve(grids: list[Grid], solution: int) -> int:
     ans = 0
-    for mtrx in matrixes:
-        matrix = list(list(line) for line in mtrx.split('\n'))
-        val = get_reflection_idx(matrix, solution)
+    for grid in grids:
+        val = get_reflection_idx(grid, solution)
         ans += summarize(val)
 
     return ans
 
-def solve01(data: str) -> int:
-    return solve(data, 1)
-    
+def solve01(grids: list[Grid]) -> int:
+    return solve(grids, 1)
+
 '''
 --- Part Two ---
 You resume walking through the valley of mirrors and - SMACK! - run directly into one. Hopefully nobody was watching, because that must have been pretty embarrassing.
@@ -219,12 +223,13 @@ In each pattern, fix the smudge and find the different line of reflection. What
 Your puzzle answer was 32497.
 '''
 
-def solve02(data: str) -> int:
-    return solve(data, 2)
+def solve02(grids: list[Grid]) -> int:
+    return solve(grids, 2)
 
 if __name__ == "__main__":
     # data = open('day-13-input.test.txt', 'r').read()
     data = open('day-13-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
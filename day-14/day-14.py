@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid
+
 '''
 --- Day 14: Parabolic Reflector Dish ---
 You reach the place where all of the mirrors were pointing: a massive parabolic reflector dish attached to the side of another large mountain.
@@ -53,50 +60,53 @@ Tilt the platform so that the rounded rocks all roll north. Afterward, what is t
 Your puzzle answer was 112773.
 '''
 
-def transpose(matrix: list[list[str]]) -> list[list[str]]:
-    transposed = list(zip(*matrix))
-    for i in range(len(transposed)):
-        transposed[i] = list(transposed[i])
-    return transposed
-
-def tilt_north(matrix: list[list[str]]) -> list[list[str]]:
-    transposed = transpose(matrix)
-
-    total_rows = len(transposed)
-    total_cols = len(transposed[0])
-
-    for i in range(total_rows):
-        current_j = -1
-        idx = []
-        for j in range(total_cols):
-            if transposed[i][j] == '#':
-                current_j = j
-            elif transposed[i][j] == 'O':
-                current_j += 1
-                idx.append(current_j)
-
-        for j in range(total_cols):
-            if j in idx:
-                transposed[i][j] = 'O'
-            elif transposed[i][j] != '#':
-                transposed[i][j] = '.'
-
-    return transpose(transposed)
-
-def summarize(matrix: list[list[str]]) -> int:
-    total_rows = len(matrix)
-    total_cols = len(matrix[0])
+ROUNDED = ord('O')
+CUBE = ord('#')
+EMPTY = ord('.')
+
+def get_lanes(grid: Grid) -> dict[str, list[list[int]]]:
+    # Each lane lists the cells of one row or column, starting from the edge
+    # the rocks roll towards.
+    columns = [list(grid.column_indices(col)) for col in range(grid.width)]
+    rows = [list(grid.row_indices(row)) for row in range(grid.height)]
+
+    return {
+        'north': columns,
+        'west': rows,
+        'south': [column[::-1] for column in columns],
+        'east': [row[::-1] for row in rows],
+    }
+
+def tilt(grid: Grid, lanes: list[list[int]]) -> Grid:
+    cells = grid.cells
+
+    for lane in lanes:
+        free = 0
+        for k, idx in enumerate(lane):
+            cell = cells[idx]
+            if cell == CUBE:
+                free = k + 1
+            elif cell == ROUNDED:
+                if k != free:
+                    cells[lane[free]] = ROUNDED
+                    cells[idx] = EMPTY
+                free += 1
+
+    return grid
+
+def summarize(grid: Grid) -> int:
     ans = 0
-    for i in range(total_rows):
-        for j in range(total_cols):
-            if matrix[i][j] == 'O':
-                ans += (total_cols - i)
+    for idx in grid.find_all('O'):
+        i, _ = grid.position(idx)
+        ans += (grid.height - i)
     return ans
 
-def solve01(data: str):
-    matrix = list(list(line) for line in data.split('\n'))
-    matrix = tilt_north(matrix)
-    return summarize(matrix)
+def parse(data: str) -> Grid:
+    return Grid.parse(data)
+
+def solve01(grid: Grid):
+    grid = tilt(grid.copy(), get_lanes(grid)['north'])
+    return summarize(grid)
 
 '''
 --- Part Two ---
@@ -150,84 +160,14 @@ Run the spin cycle for 1000000000 cycles. Afterward, what is the total load on t
 Your puzzle answer was 98894.
 '''
 
-def tilt_east(matrix: list[list[str]]) -> list[list[str]]:
-    total_rows = len(matrix)
-    total_cols = len(matrix[0])
-
-    for i in range(total_rows):
-        current_j = total_cols
-        idx = []
-        for j in range(total_cols - 1, -1, -1):
-            if matrix[i][j] == '#':
-                current_j = j
-            elif matrix[i][j] == 'O':
-                current_j -= 1
-                idx.append(current_j)
-
-        for j in range(total_cols):
-            if j in idx:
-                matrix[i][j] = 'O'
-            elif matrix[i][j] != '#':
-                matrix[i][j] = '.'
-    return matrix
-
-def tilt_south(matrix: list[list[str]]) -> list[list[str]]:
-    transposed = transpose(matrix)
-
-    total_rows = len(transposed)
-    total_cols = len(transposed[0])
-
-    for i in range(total_rows):
-        current_j = total_cols
-        idx = []
-        for j in range(total_cols - 1, -1, -1):
-            if transposed[i][j] == '#':
-                current_j = j
-            elif transposed[i][j] == 'O':
-                current_j -= 1
-                idx.append(current_j)
-
-        for j in range(total_cols):
-            if j in idx:
-                transposed[i][j] = 'O'
-            elif transposed[i][j] != '#':
-                transposed[i][j] = '.'
-
-    return transpose(transposed)
-
-def tilt_west(matrix: list[list[str]]) -> list[list[str]]:
-    total_rows = len(matrix)
-    total_cols = len(matrix[0])
-
-    for i in range(total_rows):
-        current_j = -1
-        idx = []
-        for j in range(total_cols):
-            if matrix[i][j] == '#':
-                current_j = j
-            elif matrix[i][j] == 'O':
-                current_j += 1
-                idx.append(current_j)
-
-        for j in range(total_cols):
-            if j in idx:
-                matrix[i][j] = 'O'
-            elif matrix[i][j] != '#':
-                matrix[i][j] = '.'
-    return matrix
-
-def do_cycle(matrix: list[list[str]]) -> list[list[str]]:
-    new_matrix = tilt_north(matrix)
-    new_matrix = tilt_west(new_matrix)
-    new_matrix = tilt_south(new_matrix)
-    new_matrix = tilt_east(new_matrix)
-    return new_matrix
-
-def hash(matrix: list[list[str]]) -> str:
-    return ''.join(''.join(i) for i in matrix)
-
-def solve02(data: str):
-    matrix = list(list(line) for line in data.split('\n'))
+def do_cycle(grid: Grid, lanes: dict[str, list[list[int]]]) -> Grid:
+    for direction in ['north', 'west', 'south', 'east']:
+        tilt(grid, lanes[direction])
+    return grid
+
+def solve02(grid: Grid):
+    grid = grid.copy()
+    lanes = get_lanes(grid)
 
     times = {}
     cache = True
@@ -235,10 +175,10 @@ def solve02(data: str):
     total = 1_000_000_000
     i = 0
     while i < total:
-        matrix = do_cycle(matrix)
+        grid = do_cycle(grid, lanes)
 
         if cache:
-            key = hash(matrix)
+            key = bytes(grid.cells)
 
             if key not in times:
                 times[key] = {
@@ -260,11 +200,12 @@ def solve02(data: str):
 
         i += 1
 
-    return summarize(matrix)
+    return summarize(grid)
 
 if __name__ == "__main__":
     # data = open('day-14-input.test.txt', 'r').read()
     data = open('day-14-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
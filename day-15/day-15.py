@@ -76,8 +76,10 @@ def hash(step: str) -> int:
 
     return current
 
-def solve01(data: str) -> int:
-    steps = data.split(',')
+def parse(data: str) -> list[str]:
+    return data.split(',')
+
+def solve01(steps: list[str]) -> int:
 
     ans = 0
     for step in steps:
@@ -174,8 +176,7 @@ With the help of an over-enthusiastic reindeer in a hard hat, follow the initial
 Your puzzle answer was 265462.
 '''
 
-def solve02(data: str) -> int:
-    steps = data.split(',')
+def solve02(steps: list[str]) -> int:
     boxes = {}
     
     for i in range(256):
@@ -228,6 +229,7 @@ def solve02(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-15-input.test.txt', 'r').read()
     data = open('day-15-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
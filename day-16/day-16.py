@@ -1,3 +1,12 @@
+import os
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import metrics
+from aoc.grid import Grid
+
 '''
 --- Day 16: The Floor Will Be Lava ---
 With the beam of light completely focused somewhere, the reindeer leads you deeper still into the Lava Production Facility. At some point, you realize that the steel facility walls have been replaced with cave, and the doorways are just cave, and the floor is cave, and you're pretty sure this is actually just a giant cave.
@@ -59,13 +68,6 @@ The light isn't energizing enough tiles to produce lava; to debug the contraptio
 Your puzzle answer was 7608.
 '''
 
-OFFSET_BY_DIR = {
-    'right': (0, 1),
-    'left': (0, -1),
-    'up': (-1, 0),
-    'down': (1, 0),
-}
-
 NEW_DIRS = {
     'right': {
         '.': ['right'],
@@ -97,28 +99,32 @@ NEW_DIRS = {
     },
 }
 
-def in_bounds(i: int, j: int, matrix: list[list[str]]) -> bool:
-    return i >= 0 and j >= 0 and i < len(matrix) and j < len(matrix[0])
+def get_energyzed_tiles(starting_point: tuple[int, str], grid: Grid) -> set:
+    offset_by_dir = {
+        'right': grid.right,
+        'left': grid.left,
+        'up': grid.up,
+        'down': grid.down,
+    }
 
-def get_energyzed_tiles(starting_point: tuple[int, int, str], matrix: list[list[str]]) -> set:
     tiles = set()
     visited = set()
 
-    rays = [starting_point]
+    rays = deque([starting_point])
 
     while len(rays) > 0:
-            i, j, dir = rays.pop(0)
-            di, dj = i + OFFSET_BY_DIR[dir][0], j + OFFSET_BY_DIR[dir][1]
+            idx, dir = rays.popleft()
+            next_idx = idx + offset_by_dir[dir]
 
-            if not in_bounds(di, dj, matrix):
+            if not grid.inside(next_idx):
                 continue
 
-            tiles.add((di, dj))
+            tiles.add(next_idx)
 
-            new_dirs = NEW_DIRS[dir][matrix[di][dj]]
+            new_dirs = NEW_DIRS[dir][grid[next_idx]]
 
             for new_dir in new_dirs:
-                n = (di, dj, new_dir)
+                n = (next_idx, new_dir)
 
                 if n in visited:
                     continue
@@ -126,11 +132,14 @@ def get_energyzed_tiles(starting_point: tuple[int, int, str], matrix: list[list[
                 visited.add(n)
                 rays.append(n)
 
+    metrics.add('beam_steps', len(visited))
     return tiles
 
-def solve01(data: str):
-    matrix = list(list(line) for line in data.split('\n'))
-    return len(get_energyzed_tiles((0, -1, 'right'), matrix))
+def parse(data: str) -> Grid:
+    return Grid.parse(data)
+
+def solve01(grid: Grid):
+    return len(get_energyzed_tiles((grid.index(0, -1), 'right'), grid))
 
 '''
 --- Part Two ---
@@ -167,32 +176,31 @@ Find the initial beam configuration that energizes the largest number of tiles;
 Your puzzle answer was 8221.
 '''
 
-def get_starting_points_with_dirs(matrix: list[list[str]]) -> list[tuple[int, int, str]]:
+def get_starting_points_with_dirs(grid: Grid) -> list[tuple[int, str]]:
     starting_points = []
-    rows = len(matrix)
-    cols = len(matrix[0])
+    rows = grid.height
+    cols = grid.width
 
     for i in range(rows):
-        starting_points.append((i, -1, 'right'))
-        starting_points.append((i, cols, 'left'))
+        starting_points.append((grid.index(i, -1), 'right'))
+        starting_points.append((grid.index(i, cols), 'left'))
 
     for j in range(cols):
-        starting_points.append((-1, j, 'down'))
-        starting_points.append((rows, j, 'up'))
+        starting_points.append((grid.index(-1, j), 'down'))
+        starting_points.append((grid.index(rows, j), 'up'))
 
     return starting_points
 
-def solve02(data: str):
-    matrix = list(list(line) for line in data.split('\n'))
-
+def solve02(grid: Grid):
     ans = -1
-    for point in get_starting_points_with_dirs(matrix):
-        ans = max(ans, len(get_energyzed_tiles(point, matrix)))    
+    for point in get_starting_points_with_dirs(grid):
+        ans = max(ans, len(get_energyzed_tiles(point, grid)))    
     return ans
 
 if __name__ == "__main__":
     # data = open('day-16-input.test.txt', 'r').read()
     data = open('day-16-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -1,5 +1,12 @@
+import os
+import sys
 from heapq import heappop, heappush
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import metrics
+from aoc.grid import Grid
+
 '''
 --- Day 17: Clumsy Crucible ---
 The lava starts flowing rapidly once the Lava Production Facility is operational. As you leave, the reindeer offers you a parachute, allowing you to quickly reach Gear Island.
@@ -55,51 +62,51 @@ Directing the crucible from the lava pool to the machine parts factory, but not
 Your puzzle answer was 936.
 '''
 
-MOVEMENTS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-STARTING_POINT = (0, 0)
-
-def in_bounds(matrix: list[list[int]], row: int, col: int) -> bool:
-    return 0 <= row < len(matrix) and 0 <= col < len(matrix[0])
+heappush = metrics.counted('heap_pushes')(heappush)
+heappop = metrics.counted('heap_pops')(heappop)
 
-def is_last(matrix: list[list[int]], row: int, col: int) -> bool:
-    return row == len(matrix) - 1 and col == len(matrix[0]) - 1
+ZERO = ord('0')
+STARTING_DIR = 0
 
-def solve01(data: str) -> int:
-    matrix = [list(map(int, line.strip())) for line in data.split('\n')]
+def parse(data: str) -> Grid:
+    return Grid.parse(data)
 
+def solve01(grid: Grid) -> int:
     MAX_CONSECUTIVE_BLOCKS = 3
 
+    cells = grid.cells
+    last = grid.index(grid.height - 1, grid.width - 1)
+
     visited = set()
-    priority_queue = [(0, 0, 0, 0, 0, 0)]
+    priority_queue = [(0, grid.index(0, 0), STARTING_DIR, 0)]
     
     while priority_queue:
-        heat_loss, row, col, dir_row, dir_col, n = heappop(priority_queue)
+        heat_loss, idx, dir, n = heappop(priority_queue)
         
-        if is_last(matrix, row, col):
+        if idx == last:
+            metrics.add('states_expanded', len(visited))
             return heat_loss
 
-        label = (row, col, dir_row, dir_col, n)
+        label = (idx, dir, n)
 
         if label in visited:
             continue
     
         visited.add(label)
 
-        if n < MAX_CONSECUTIVE_BLOCKS and (dir_row, dir_col) != STARTING_POINT:
-            nr = row + dir_row
-            nc = col + dir_col
+        if n < MAX_CONSECUTIVE_BLOCKS and dir != STARTING_DIR:
+            next_idx = idx + dir
 
-            if in_bounds(matrix, nr, nc):
-                label = (heat_loss + matrix[nr][nc], nr, nc, dir_row, dir_col, n + 1)
+            if grid.inside(next_idx):
+                label = (heat_loss + cells[next_idx] - ZERO, next_idx, dir, n + 1)
                 heappush(priority_queue, label)
     
-        for ndr, ndc in MOVEMENTS:
-            if (ndr, ndc) != (dir_row, dir_col) and (ndr, ndc) != (-dir_row, -dir_col):
-                nr = row + ndr
-                nc = col + ndc
+        for new_dir in grid.offsets:
+            if new_dir != dir and new_dir != -dir:
+                next_idx = idx + new_dir
 
-                if in_bounds(matrix, nr, nc):
-                    label = (heat_loss + matrix[nr][nc], nr, nc, ndr, ndc, 1)
+                if grid.inside(next_idx):
+                    label = (heat_loss + cells[next_idx] - ZERO, next_idx, new_dir, 1)
                     heappush(priority_queue, label)
 
     return -1
@@ -150,41 +157,41 @@ Directing the ultra crucible from the lava pool to the machine parts factory, wh
 Your puzzle answer was 1157.
 '''
 
-def solve02(data: str) -> int:
-    matrix = [list(map(int, line.strip())) for line in data.split('\n')]
-
+def solve02(grid: Grid) -> int:
     MAX_CONSECUTIVE_BLOCKS = 10
     MIN_BLOCKS_TO_TURN = 4
 
+    cells = grid.cells
+    last = grid.index(grid.height - 1, grid.width - 1)
+
     visited = set()
-    priority_queue = [(0, 0, 0, 0, 0, 0)]
+    priority_queue = [(0, grid.index(0, 0), STARTING_DIR, 0)]
 
     while priority_queue:
-        heat_loss, row, col, dir_row, dir_col, n = heappop(priority_queue)
+        heat_loss, idx, dir, n = heappop(priority_queue)
 
-        if is_last(matrix, row, col) and n >= MIN_BLOCKS_TO_TURN:
+        if idx == last and n >= MIN_BLOCKS_TO_TURN:
+            metrics.add('states_expanded', len(visited))
             return heat_loss
 
-        if (row, col, dir_row, dir_col, n) in visited:
+        if (idx, dir, n) in visited:
             continue
 
-        visited.add((row, col, dir_row, dir_col, n))
+        visited.add((idx, dir, n))
 
-        if n < MAX_CONSECUTIVE_BLOCKS and (dir_row, dir_col) != STARTING_POINT:
-            nr = row + dir_row
-            nc = col + dir_col
-            if in_bounds(matrix, nr, nc):
-                label = (heat_loss + matrix[nr][nc], nr, nc, dir_row, dir_col, n + 1)
+        if n < MAX_CONSECUTIVE_BLOCKS and dir != STARTING_DIR:
+            next_idx = idx + dir
+            if grid.inside(next_idx):
+                label = (heat_loss + cells[next_idx] - ZERO, next_idx, dir, n + 1)
                 heappush(priority_queue, label)
 
-        if n >= MIN_BLOCKS_TO_TURN or (dir_row, dir_col) == STARTING_POINT:
-            for ndr, ndc in MOVEMENTS:
-                if (ndr, ndc) != (dir_row, dir_col) and (ndr, ndc) != (-dir_row, -dir_col):
-                    nr = row + ndr
-                    nc = col + ndc
+        if n >= MIN_BLOCKS_TO_TURN or dir == STARTING_DIR:
+            for new_dir in grid.offsets:
+                if new_dir != dir and new_dir != -dir:
+                    next_idx = idx + new_dir
 
-                    if in_bounds(matrix, nr, nc):
-                        label = (heat_loss + matrix[nr][nc], nr, nc, ndr, ndc, 1)
+                    if grid.inside(next_idx):
+                        label = (heat_loss + cells[next_idx] - ZERO, next_idx, new_dir, 1)
                         heappush(priority_queue, label)
 
     return -1
@@ -192,6 +199,7 @@ def solve02(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-17-input.test.txt', 'r').read()
     data = open('day-17-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
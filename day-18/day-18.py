@@ -51,31 +51,20 @@ The Elves are concerned the lagoon won't be large enough; if they follow their d
 Your puzzle answer was 108909.
 '''
 
-def area_by_shoelace(points_in_clock_order: list[tuple[int, int]]) -> float:
-        size = len(points_in_clock_order)
-        area = 0
-        i = 0
-
-        while i < size:
-            x1, y1 = points_in_clock_order[i]
-            x2, y2 = points_in_clock_order[(i + 1) % size]
-
-            area += (x1 * y2 - x2 * y1)
-            i += 1
-
-        return abs(area) / 2.0
-
 def points_inside_by_picks_theorem(area: float, number_of_points: int) -> int:
     return int(area + 1 - (number_of_points / 2))
 
 def calculate_cubic_meters(dig_plan: list[tuple[str, int]]) -> int:
     initial = (0, 0)
     current = (0, 0)
-    points = [current]
     total_points = 0
+    # Shoelace sum added edge by edge, so the corners are never kept. The
+    # closing edge back to the origin adds nothing.
+    area = 0
 
     for dir, steps in dig_plan:
         total_points += steps
+        previous = current
         if dir == 'U':
             current = (current[0] - steps, current[1])
         elif dir == 'D':
@@ -88,20 +77,21 @@ def calculate_cubic_meters(dig_plan: list[tuple[str, int]]) -> int:
         if current == initial:
             break
 
-        points.append(current)
+        area += previous[0] * current[1] - current[0] * previous[1]
 
-    area = area_by_shoelace(points)
-    return points_inside_by_picks_theorem(area, total_points) + total_points
+    return points_inside_by_picks_theorem(abs(area) / 2.0, total_points) + total_points
 
-def solve01(data: str) -> int:
-    dig_plan = list(line.split(' ') for line in data.split('\n'))
+def parse(data: str) -> list[list[str]]:
+    return list(line.split(' ') for line in data.split('\n'))
 
-    new_dig_plan = []
-    for dir, steps, _ in dig_plan:
-        new_dig_plan.append((dir, int(steps)))
+def solve01(dig_plan: list[list[str]]) -> int:
+    new_dig_plan = ((dir, int(steps)) for dir, steps, _ in dig_plan)
 
     return calculate_cubic_meters(new_dig_plan)
 
+def stream01(lines) -> int:
+    return solve01(line.split(' ') for line in lines)
+
 '''
 --- Part Two ---
 The Elves were right to be concerned; the planned lagoon would be much too small.
@@ -133,9 +123,7 @@ Convert the hexadecimal color codes into the correct instructions; if the Elves
 Your puzzle answer was 133125706867777.
 '''
 
-def solve02(data: str) -> int:
-    dig_plan = list(line.split(' ') for line in data.split('\n'))
-
+def solve02(dig_plan: list[list[str]]) -> int:
     DIRS_BY_NUMBER = {
         '0': 'R',
         '1': 'D',
@@ -143,21 +131,25 @@ def solve02(data: str) -> int:
         '3': 'U',
     }
 
-    new_dig_plan = []
-
-    for _, _, color in dig_plan:
+    def decode(color: str) -> tuple[str, int]:
         color = color[1:8]
 
         dir = DIRS_BY_NUMBER[color[6]]
         steps = int(color[1:6], 16)
 
-        new_dig_plan.append((dir, steps))
+        return (dir, steps)
+
+    new_dig_plan = (decode(color) for _, _, color in dig_plan)
 
     return calculate_cubic_meters(new_dig_plan)
 
+def stream02(lines) -> int:
+    return solve02(line.split(' ') for line in lines)
+
 if __name__ == "__main__":
     # data = open('day-18-input.test.txt', 'r').read()
     data = open('day-18-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
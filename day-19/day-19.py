@@ -96,11 +96,12 @@ def parse_ratings(data: str) -> int:
     
     return ratings
 
-def solve01(data: str):
+def parse(data: str):
     workflow_data, ratings_data = data.split('\n\n')
+    return parse_workflows(workflow_data), parse_ratings(ratings_data)
 
-    workflows = parse_workflows(workflow_data)
-    ratings = parse_ratings(ratings_data)
+def solve01(parsed):
+    workflows, ratings = parsed
 
     ans = 0
     STOP_WORKFLOW_NAMES = ['A', 'R']
@@ -196,9 +197,8 @@ def generate_ranges(operator: str, value: int) -> tuple[Range, Range]:
 def sum_possible_values(rating: dict[str, Range]) -> int:
     return rating['x'].size() * rating['m'].size() * rating['a'].size() * rating['s'].size()
 
-def solve02(data: str) -> int:
-    workflows_data, _ = data.split('\n\n')
-    workflows = parse_workflows(workflows_data)
+def solve02(parsed) -> int:
+    workflows, _ = parsed
 
     ratings = [{
         'workflow': 'in',
@@ -274,6 +274,7 @@ def solve02(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-19-input.test.txt', 'r').read()
     data = open('day-19-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
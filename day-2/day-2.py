@@ -1,3 +1,12 @@
+import os
+import sys
+from array import array
+from bisect import bisect_right
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import incremental
+
 '''
 --- Day 2: Cube Conundrum ---
 You're launched high into the atmosphere! The apex of your trajectory just barely reaches the surface of a large island floating in the sky. You gently land in a fluffy pile of leaves. It's quite cold, but you don't see much snow. An Elf runs over to greet you.
@@ -28,30 +37,45 @@ Determine which games would have been possible if the bag had been loaded with o
 Your puzzle answer was 2617.
 '''
 
-def solve01(data):
+@incremental.per_line()
+def parse_game(line: str) -> tuple[int, list[dict[str, int]]]:
+    game, subset = line.split(': ')
+    reveals = []
+
+    for cubes in subset.split('; '):
+        totals = {
+            'red': 0,
+            'blue': 0,
+            'green': 0,
+        }
+
+        for cube in cubes.split(', '):
+            amount, type = cube.split(' ')
+            amount = int(amount)
+
+            totals[type] += amount
+
+        reveals.append(totals)
+
+    return int(game[len('Game '):]), reveals
+
+def parse(data: str) -> list[tuple[int, list[dict[str, int]]]]:
+    games = []
+
+    for line in data.split('\n'):
+        games.append(parse_game(line))
+
+    return games
+
+def solve01(games):
     max_reds = 12
     max_greens = 13
     max_blues = 14
     ans = 0
-    game = 0
 
-    for line in data.split('\n'):
-        game += 1
-        _, subset = line.split(': ')
+    for game, reveals in games:
         ok = True
-        for cubes in subset.split('; '):
-            totals = {
-                'red': 0,
-                'blue': 0,
-                'green': 0,
-            }
-
-            for cube in cubes.split(', '):
-                amount, type = cube.split(' ')
-                amount = int(amount)
-                
-                totals[type] += amount
-            
+        for totals in reveals:
             if totals['red'] > max_reds:
                 ok = False
                 break
@@ -68,6 +92,9 @@ def solve01(data):
             ans += game
     
     return ans
+
+def stream01(lines) -> int:
+    return GameAggregator().feed_all(lines).possible_id_sum
         
 '''
 --- Part Two ---
@@ -94,24 +121,19 @@ For each game, find the minimum set of cubes that must have been present. What i
 Your puzzle answer was 59795.
 '''
 
-def solve02(data):
+def solve02(games):
     ans = 0
     game = 0
 
-    for line in data.split('\n'):
-        _, subset = line.split(': ')
-        
+    for _, reveals in games:
         max_by_subsets = {
             'red': 0,
             'blue': 0,
             'green': 0,
         }
         
-        for cubes in subset.split('; '):
-            for cube in cubes.split(', '):
-                amount, type = cube.split(' ')
-                amount = int(amount)
-                
+        for totals in reveals:
+            for type, amount in totals.items():
                 if max_by_subsets[type] < amount:
                     max_by_subsets[type] = amount
 
@@ -120,9 +142,149 @@ def solve02(data):
 
     return ans
 
+def stream02(lines) -> int:
+    return GameAggregator().feed_all(lines).power_sum
+
+COLORS = ('red', 'green', 'blue')
+
+class GameTable:
+    # One row per game: its id and the most cubes of each color it revealed.
+    def __init__(self) -> None:
+        self.ids = array('l')
+        self.columns = {color: array('l') for color in COLORS}
+
+    def add(self, game_id: int, most: dict[str, int]):
+        self.ids.append(game_id)
+        for color in COLORS:
+            self.columns[color].append(most[color])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def powers(self) -> list[int]:
+        return [red * green * blue for red, green, blue in zip(*self.columns.values())]
+
+    def allowed_id_sum(self, bag: tuple[int, int, int]) -> int:
+        # One pass over the columns; BagIndex answers many bags faster.
+        red, green, blue = bag
+        columns = zip(self.ids, *self.columns.values())
+        return sum(game_id for game_id, most_red, most_green, most_blue in columns if most_red <= red and most_green <= green and most_blue <= blue)
+
+def parse_table(data: str) -> GameTable:
+    table = GameTable()
+
+    for line in data.split('\n'):
+        game, subset = line.split(': ')
+        most = dict.fromkeys(COLORS, 0)
+
+        for cubes in subset.split('; '):
+            for cube in cubes.split(', '):
+                amount, color = cube.split(' ')
+                most[color] = max(most[color], int(amount))
+
+        table.add(int(game[len('Game '):]), most)
+
+    return table
+
+class BagIndex:
+    # Sums over the games a bag allows, as a 3-D prefix sum over the distinct
+    # red, green and blue maxima: cell (r, g, b) holds the games whose maxima
+    # are all at most those values, so a bag is three bisects and one lookup.
+    # The axes only hold values that occur, so the cube has at most
+    # |red| * |green| * |blue| cells for the distinct maxima; about 20 per
+    # color in the puzzle's inputs, 9,261 cells on the generated ones.
+    def __init__(self, table: GameTable) -> None:
+        self.axes = [sorted(set(table.columns[color])) for color in COLORS]
+        sizes = [len(axis) for axis in self.axes]
+        self.strides = (sizes[1] * sizes[2], sizes[2], 1)
+        self.id_sums = [0] * (sizes[0] * sizes[1] * sizes[2])
+        self.power_sums = [0] * len(self.id_sums)
+
+        positions = [{value: idx for idx, value in enumerate(axis)} for axis in self.axes]
+        for game_id, power, *most in zip(table.ids, table.powers(), *table.columns.values()):
+            cell = sum(position[value] * stride for position, value, stride in zip(positions, most, self.strides))
+            self.id_sums[cell] += game_id
+            self.power_sums[cell] += power
+
+        for axis, stride in enumerate(self.strides):
+            for cell in range(len(self.id_sums)):
+                if cell // stride % sizes[axis]:
+                    self.id_sums[cell] += self.id_sums[cell - stride]
+                    self.power_sums[cell] += self.power_sums[cell - stride]
+
+    def cell(self, bag: tuple[int, int, int]) -> int | None:
+        cell = 0
+        for axis, stride, limit in zip(self.axes, self.strides, bag):
+            idx = bisect_right(axis, limit) - 1
+            if idx < 0:
+                return None
+            cell += idx * stride
+
+        return cell
+
+    def query(self, bags: list[tuple[int, int, int]]) -> list[tuple[int, int]]:
+        # (sum of ids, sum of powers) of the games each (red, green, blue) bag allows.
+        answers = []
+        for bag in bags:
+            cell = self.cell(bag)
+            answers.append((0, 0) if cell is None else (self.id_sums[cell], self.power_sums[cell]))
+
+        return answers
+
+class GameAggregator:
+    # Running answers over game records as they arrive. Only the maxima of
+    # each game are kept; a later record for a known game raises them and
+    # swaps the game's old contribution for the new one.
+    def __init__(self, bag: tuple[int, int, int] = (12, 13, 14)) -> None:
+        self.bag = bag
+        self.most: dict[int, tuple[int, int, int]] = {}
+        self.possible_id_sum = 0
+        self.power_sum = 0
+
+    def contribution(self, game_id: int, most: tuple[int, int, int]) -> tuple[int, int]:
+        red, green, blue = most
+        possible = red <= self.bag[0] and green <= self.bag[1] and blue <= self.bag[2]
+        return (game_id if possible else 0), red * green * blue
+
+    def feed(self, line: str):
+        if not line:
+            return
+
+        game, _, subset = line.partition(': ')
+        game_id = int(game[len('Game '):])
+        most = dict(zip(COLORS, self.most.get(game_id, (0, 0, 0))))
+
+        for cube in subset.replace(';', ',').split(', '):
+            amount, color = cube.split(' ')
+            if int(amount) > most[color]:
+                most[color] = int(amount)
+
+        if game_id in self.most:
+            possible, power = self.contribution(game_id, self.most[game_id])
+            self.possible_id_sum -= possible
+            self.power_sum -= power
+
+        self.most[game_id] = (most['red'], most['green'], most['blue'])
+        possible, power = self.contribution(game_id, self.most[game_id])
+        self.possible_id_sum += possible
+        self.power_sum += power
+
+    def feed_all(self, lines):
+        for line in lines:
+            self.feed(line)
+
+        return self
+
+def solve01_table(table: GameTable) -> int:
+    return table.allowed_id_sum((12, 13, 14))
+
+def solve02_table(table: GameTable) -> int:
+    return sum(table.powers())
+
 if __name__ == "__main__":
     # data = open('day-2-input.test.txt', 'r').read()
     data = open('day-2-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -1,5 +1,11 @@
+import os
+import sys
 from math import lcm
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import metrics
+
 '''
 --- Day 20: Pulse Propagation ---
 With your help, the Elves manage to find the right parts and fix all of the machines. Now, they just need to send the command to boot up the machines and get the sand flowing again.
@@ -164,6 +170,7 @@ class Broadcaster(Module):
     def __repr__(self) -> str:
         return f'B({self.name}, {self.destinations})'
 
+@metrics.counted('pulses_processed')
 def process_module(
     module: Module,
     from_name: str,
@@ -194,13 +201,20 @@ def process_module(
         for destination in module.destinations:
             queue.append((module.name, destination, pulse))
 
-def parse_modules(data: str) -> map:
-    modules: map[str, Module] = {}
+def parse(data: str) -> list[tuple[str, list[str]]]:
+    specs = []
 
     for line in data.split('\n'):
         name, destinations = line.split(' -> ')
-        destinations = destinations.split(', ')
+        specs.append((name, destinations.split(', ')))
+
+    return specs
+
+# Modules hold state, so every part builds its own set from the parsed specs.
+def build_modules(specs: list[tuple[str, list[str]]]) -> map:
+    modules: map[str, Module] = {}
 
+    for name, destinations in specs:
         if '%' in name:
             modules[name[1:]] = FlipFlop(name[1:], destinations)
         elif '&' in name:
@@ -215,8 +229,9 @@ def parse_modules(data: str) -> map:
 
     return modules
 
-def solve01(data: str):
-    modules = parse_modules(data)
+def solve01(specs: list[tuple[str, list[str]]]):
+    with metrics.phase('build'):
+        modules = build_modules(specs)
 
     total_pulses = {
         HIGH_PULSE: 0,
@@ -248,8 +263,9 @@ Reset all modules to their default states. Waiting for all pulses to be fully ha
 Your puzzle answer was 243037165713371.
 '''
 
-def solve02(data: str):
-    modules = parse_modules(data)
+def solve02(specs: list[tuple[str, list[str]]]):
+    with metrics.phase('build'):
+        modules = build_modules(specs)
 
     conjunctions_need_to_be_high_pulsed = {
         'mr': [-1, False],
@@ -286,6 +302,7 @@ def solve02(data: str):
 if __name__ == "__main__":
     # data = open('day-20-input.test.txt', 'r').read()
     data = open('day-20-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
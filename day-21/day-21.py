@@ -1,5 +1,12 @@
+import os
+import sys
 from collections import deque
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import metrics
+from aoc.grid import Grid
+
 '''
 --- Day 21: Step Counter ---
 You manage to catch the airship right as it's dropping someone else off on their all-expenses-paid trip to Desert Island! It even helpfully drops you off near the gardener and his massive farm.
@@ -84,46 +91,44 @@ Starting from the garden plot marked S on your map, how many garden plots could
 Your puzzle answer was 3562.
 '''
 
-def in_bounds(i: int, j: int, matrix: list[str]) -> bool:
-    return i >= 0 and j >= 0 and i < len(matrix) and j < len(matrix[0])            
+ROCK = ord('#')
 
-def count_garden_plots(start_row: int, start_col: int, steps: int, matrix: list[str]) -> int:
+def count_garden_plots(start_row: int, start_col: int, steps: int, grid: Grid) -> int:
+    start = grid.index(start_row, start_col)
     garden_plots_reached = set()
-    visited = {(start_row, start_col)}
-    queue = deque([(start_row, start_col, steps)])
+    visited = {start}
+    queue = deque([(start, steps)])
 
     while queue:
-        i, j, remaining_steps = queue.popleft()
+        idx, remaining_steps = queue.popleft()
 
         if remaining_steps % 2 == 0:
-            garden_plots_reached.add((i, j))
+            garden_plots_reached.add(idx)
         if remaining_steps == 0:
             continue
 
-        for x, y in [(1, 0), (- 1, 0), (0, 1), (0, -1)]:
-            di = x + i
-            dj = y + j
+        for offset in grid.offsets:
+            next_idx = idx + offset
 
-            if not in_bounds(di, dj, matrix) or matrix[di][dj] == "#" or (di, dj) in visited:
+            if grid.cells[next_idx] == ROCK or next_idx in visited:
                 continue
 
-            visited.add((di, dj))
-            queue.append((di, dj, remaining_steps - 1))
+            visited.add(next_idx)
+            queue.append((next_idx, remaining_steps - 1))
 
+    metrics.add('bfs_nodes', len(visited))
     return len(garden_plots_reached)
 
-def find_start(matrix: list[str]) -> tuple[int, int]:
-    for i in range(len(matrix)):
-        for j in range(len(matrix[0])):
-            if matrix[i][j] == 'S':
-                return (i, j)
+def find_start(grid: Grid) -> tuple[int, int]:
+    return grid.position(grid.find('S'))
 
-    return (-1, -1)
+def parse(data: str) -> Grid:
+    # Rocks all around, so the walk never leaves the grid.
+    return Grid.parse(data, border='#')
 
-def solve01(data: str) -> int:
-    matrix = list(list(line) for line in data.split('\n'))
-    start_row, start_col = find_start(matrix)
-    return count_garden_plots(start_row, start_col, 64, matrix)
+def solve01(grid: Grid) -> int:
+    start_row, start_col = find_start(grid)
+    return count_garden_plots(start_row, start_col, 64, grid)
 
 '''
 --- Part Two ---
@@ -184,13 +189,12 @@ However, the step count the Elf needs is much larger! Starting from the garden p
 Your puzzle answer was 592723929260582.
 '''
 
-def solve02(data: str) -> int:
-    matrix = list(list(line) for line in data.split('\n'))
-    start_row, start_col = find_start(matrix)
+def solve02(grid: Grid) -> int:
+    start_row, start_col = find_start(grid)
     
-    assert len(matrix) == len(matrix[0])
+    assert grid.height == grid.width
 
-    size = len(matrix)
+    size = grid.height
     steps = 26501365
 
     assert start_row == start_col == size // 2
@@ -201,23 +205,23 @@ def solve02(data: str) -> int:
     odd = (grid_width // 2 * 2 + 1) ** 2
     even = ((grid_width + 1) // 2 * 2) ** 2
 
-    odd_points = count_garden_plots(start_row, start_col, size * 2 + 1, matrix)
-    even_points = count_garden_plots(start_row, start_col, size * 2, matrix)
+    odd_points = count_garden_plots(start_row, start_col, size * 2 + 1, grid)
+    even_points = count_garden_plots(start_row, start_col, size * 2, grid)
 
-    corner_t = count_garden_plots(size - 1, start_col, size - 1, matrix)
-    corner_r = count_garden_plots(start_row, 0, size - 1, matrix)
-    corner_b = count_garden_plots(0, start_col, size - 1, matrix)
-    corner_l = count_garden_plots(start_row, size - 1, size - 1, matrix)
+    corner_t = count_garden_plots(size - 1, start_col, size - 1, grid)
+    corner_r = count_garden_plots(start_row, 0, size - 1, grid)
+    corner_b = count_garden_plots(0, start_col, size - 1, grid)
+    corner_l = count_garden_plots(start_row, size - 1, size - 1, grid)
 
-    small_tr = count_garden_plots(size - 1, 0, size // 2 - 1, matrix)
-    small_tl = count_garden_plots(size - 1, size - 1, size // 2 - 1, matrix)
-    small_br = count_garden_plots(0, 0, size // 2 - 1, matrix)
-    small_bl = count_garden_plots(0, size - 1, size // 2 - 1, matrix)
+    small_tr = count_garden_plots(size - 1, 0, size // 2 - 1, grid)
+    small_tl = count_garden_plots(size - 1, size - 1, size // 2 - 1, grid)
+    small_br = count_garden_plots(0, 0, size // 2 - 1, grid)
+    small_bl = count_garden_plots(0, size - 1, size // 2 - 1, grid)
 
-    large_tr = count_garden_plots(size - 1, 0, size * 3 // 2 - 1, matrix)
-    large_tl = count_garden_plots(size - 1, size - 1, size * 3 // 2 - 1, matrix)
-    large_br = count_garden_plots(0, 0, size * 3 // 2 - 1, matrix)
-    large_bl = count_garden_plots(0, size - 1, size * 3 // 2 - 1, matrix)
+    large_tr = count_garden_plots(size - 1, 0, size * 3 // 2 - 1, grid)
+    large_tl = count_garden_plots(size - 1, size - 1, size * 3 // 2 - 1, grid)
+    large_br = count_garden_plots(0, 0, size * 3 // 2 - 1, grid)
+    large_bl = count_garden_plots(0, size - 1, size * 3 // 2 - 1, grid)
 
     return (
         odd * odd_points +
@@ -230,6 +234,7 @@ def solve02(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-21-input.test.txt', 'r').read()
     data = open('day-21-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
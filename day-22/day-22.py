@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import metrics
+
 '''
 --- Day 22: Sand Slabs ---
 Enough sand has fallen; it can finally filter water for Snow Island.
@@ -225,10 +232,13 @@ def determine_bricks_on_final_state(bricks: list[Brick]) -> list[Brick]:
 
     return bricks_on_final_state
 
-def solve01(data: str) -> int:
+# Settling the bricks is the expensive step and both parts need it.
+def parse(data: str) -> list[Brick]:
     bricks = parse_bricks(data)
-    bricks_on_final_state = determine_bricks_on_final_state(bricks)
+    with metrics.phase('build'):
+        return determine_bricks_on_final_state(bricks)
 
+def solve01(bricks_on_final_state: list[Brick]) -> int:
     ans = 0
     for brick in bricks_on_final_state:
         if brick.total_bricks_it_support() == 0:
@@ -261,10 +271,7 @@ For each brick, determine how many other bricks would fall if that brick were di
 Your puzzle answer was 71002.
 '''
 
-def solve02(data: str) -> int:
-    bricks = parse_bricks(data)    
-    bricks_on_final_state = determine_bricks_on_final_state(bricks)
-
+def solve02(bricks_on_final_state: list[Brick]) -> int:
     def count_fall(brick: Brick, fell_brick_names: set) -> int:
         if brick.total_bricks_it_support() == 0:
             return 0
@@ -292,6 +299,7 @@ def solve02(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-22-input.test.txt', 'r').read()
     data = open('day-22-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
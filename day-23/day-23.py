@@ -1,3 +1,11 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import metrics
+from aoc.grid import Grid
+
 '''
 --- Day 23: A Long Walk ---
 The Elves resume water filtering operations! Clean water starts flowing over the edge of Island Island.
@@ -67,75 +75,70 @@ Find the longest hike you can take through the hiking trails listed on your map.
 Your puzzle answer was 2386.
 '''
 
-def in_bounds(i: int, j: int, matrix: list[str]) -> bool:
-    return i >= 0 and j >= 0 and i < len(matrix) and j < len(matrix[0])
+PATH = ord('.')
+FOREST = ord('#')
 
 def make_weighted_graph(
-    matrix: list[list[str]],
-    start_node: tuple[int, int],
-    end_node: tuple[int, int],
+    grid: Grid,
+    start_node: int,
+    end_node: int,
     use_all_directions: bool = False
-) -> dict[tuple[int, int], dict[tuple[int, int], int]]:
-    NEIGHBOR_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+) -> dict[int, dict[int, int]]:
+    NEIGHBOR_DIRECTIONS = grid.offsets
     DIRS = {
-        '^': [(-1, 0)],
-        'v': [(1, 0)],
-        '<': [(0, -1)],
-        '>': [(0, 1)],
-        '.': [(-1, 0), (1, 0), (0, -1), (0, 1)],
+        ord('^'): [grid.up],
+        ord('v'): [grid.down],
+        ord('<'): [grid.left],
+        ord('>'): [grid.right],
+        PATH: NEIGHBOR_DIRECTIONS,
     }
 
+    cells = grid.cells
     points = [start_node, end_node]
 
-    rows = len(matrix)
-    cols = len(matrix[0])
-
-    for i in range(rows):
-        for j in range(cols):
-            if matrix[i][j] == '#':
-                continue
+    for idx in grid.indices():
+        if cells[idx] == FOREST:
+            continue
 
-            neighbors = 0
-            for di, dj in NEIGHBOR_DIRECTIONS:
-                ni = di + i
-                nj = dj + j
-                if in_bounds(ni, nj, matrix) and matrix[ni][nj] != '#':
-                    neighbors += 1
+        neighbors = 0
+        for offset in NEIGHBOR_DIRECTIONS:
+            if cells[idx + offset] != FOREST:
+                neighbors += 1
 
-            if neighbors >= 3:
-                points.append((i, j))
+        if neighbors >= 3:
+            points.append(idx)
     
     graph = {pt: {} for pt in points}
 
-    for i, j in points:
-        stack = [(0, i, j)]
-        visited = {(i, j)}
+    for point in points:
+        stack = [(0, point)]
+        visited = {point}
     
         while stack:
-            weight, r, c = stack.pop()
+            weight, idx = stack.pop()
             
-            if weight != 0 and (r, c) in points:
-                graph[(i, j)][(r, c)] = weight
+            if weight != 0 and idx in graph:
+                graph[point][idx] = weight
                 continue
     
-            dirs = DIRS[matrix[r][c]]
+            dirs = DIRS[cells[idx]]
             if use_all_directions:
                 dirs = NEIGHBOR_DIRECTIONS
     
-            for di, dj in dirs:
-                ni = r + di
-                nj = c + dj
-                if in_bounds(ni, nj, matrix) and matrix[ni][nj] != '#' and (ni, nj) not in visited:
-                    stack.append((weight + 1, ni, nj))
-                    visited.add((ni, nj))
+            for offset in dirs:
+                next_idx = idx + offset
+                if cells[next_idx] != FOREST and next_idx not in visited:
+                    stack.append((weight + 1, next_idx))
+                    visited.add(next_idx)
 
     return graph
 
+@metrics.counted('states_expanded')
 def dfs(
-    node: tuple[int, int],
-    graph: dict[tuple[int, int], dict[tuple[int, int], int]],
-    visited: set[tuple[int, int]],
-    end_node: tuple[int, int]
+    node: int,
+    graph: dict[int, dict[int, int]],
+    visited: set[int],
+    end_node: int
 ) -> int:
     if node == end_node:
         return 0
@@ -151,17 +154,21 @@ def dfs(
 
     return ans
 
-def find_longest_path(data: str, use_all_directions: bool) -> int:
-    matrix = list(line for line in data.split('\n'))
+def parse(data: str) -> Grid:
+    # A border of forest keeps the walk from leaving the grid.
+    return Grid.parse(data, border='#')
 
-    start_node = (0, 1)
-    end_node = (len(matrix) - 1, len(matrix[0]) - 2)
-    graph = make_weighted_graph(matrix, start_node, end_node, use_all_directions)
+def find_longest_path(grid: Grid, use_all_directions: bool) -> int:
+    start_node = grid.index(0, 1)
+    end_node = grid.index(grid.height - 1, grid.width - 2)
+    with metrics.phase('build'):
+        graph = make_weighted_graph(grid, start_node, end_node, use_all_directions)
 
+    metrics.add('graph_nodes', len(graph))
     return dfs(start_node, graph, set(), end_node)
 
-def solve01(data: str) -> int:
-    return find_longest_path(data, use_all_directions=False)
+def solve01(grid: Grid) -> int:
+    return find_longest_path(grid, use_all_directions=False)
 
 '''
 --- Part Two ---
@@ -199,12 +206,13 @@ Find the longest hike you can take through the surprisingly dry hiking trails li
 Your puzzle answer was 6246.
 '''
 
-def solve02(data: str) -> int:
-    return find_longest_path(data, use_all_directions=True)
+def solve02(grid: Grid) -> int:
+    return find_longest_path(grid, use_all_directions=True)
 
 if __name__ == "__main__":
     data = open('day-23-input.test.txt', 'r').read()
     data = open('day-23-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -1,4 +1,11 @@
-import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import lazy_import
+
+np = lazy_import('numpy')
 
 '''
 --- Day 24: Never Tell Me The Odds ---
@@ -71,7 +78,7 @@ Considering only the X and Y axes, check all pairs of hailstones' future paths f
 Your puzzle answer was 17776.
 '''
 
-def parse_input(data: str):
+def parse(data: str):
     hailstones = []
 
     for line in data.split('\n'):
@@ -141,9 +148,7 @@ def find_intersection(
 
     return None
 
-def solve01(data: str) -> int:
-    hailstones = parse_input(data)
-
+def solve01(hailstones) -> int:
     vectors = []
 
     for hailstone in hailstones:
@@ -206,9 +211,7 @@ Determine the exact position and velocity the rock needs to have at time 0 so th
 Your puzzle answer was 948978092202212.
 '''
 
-def solve02(data: str) -> int:
-    hailstones = parse_input(data)
-
+def solve02(hailstones) -> int:
     # Solution based on:
     # https://stackoverflow.com/questions/563198/how-do-you-detect-where-two-line-segments-intersect
     (p1, v1), (p2, v2), (p3, v3) = hailstones[:3]
@@ -242,6 +245,7 @@ def solve02(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-24-input.test.txt', 'r').read()
     data = open('day-24-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -1,4 +1,11 @@
-import networkx as nx
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import lazy_import
+
+nx = lazy_import('networkx')
 
 '''
 --- Day 25: Snowverload ---
@@ -50,14 +57,22 @@ Find the three wires you need to disconnect in order to divide the components in
 Your puzzle answer was 495607.
 '''
 
-def solve01(data: str) -> int:
-    graph = nx.Graph()
+def parse(data: str) -> list[tuple[str, str]]:
+    edges = []
 
     for line in data.splitlines():
         parent, others = line.split(":")
         for node in others.strip().split():
-            graph.add_edge(parent, node)
-            graph.add_edge(node, parent)
+            edges.append((parent, node))
+
+    return edges
+
+def solve01(edges: list[tuple[str, str]]) -> int:
+    graph = nx.Graph()
+
+    for parent, node in edges:
+        graph.add_edge(parent, node)
+        graph.add_edge(node, parent)
 
     graph.remove_edges_from(nx.minimum_edge_cut(graph))
     nodes_a, nodes_b = nx.connected_components(graph)
@@ -67,5 +82,6 @@ def solve01(data: str) -> int:
 if __name__ == "__main__":
     # data = open('day-25-input.test.txt', 'r').read()
     data = open('day-25-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
+    print(solve01(parsed))
@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid
+
 '''
 --- Day 3: Gear Ratios ---
 You and the Elf eventually reach a gondola lift station; he says the gondola lift will take you up to the water source, but this is as far as he can bring you. You go inside.
@@ -31,41 +38,32 @@ Of course, the actual engine schematic is much larger. What is the sum of all of
 Your puzzle answer was 546312.
 '''
 
-def add_adjacents(i: int, j: int, special):
-    special.add((i - 1, j - 1))
-    special.add((i - 1, j + 1))
-    
-    special.add((i - 1, j))
-    special.add((i + 1, j))
-    
-    special.add((i, j - 1))
-    special.add((i, j + 1))
-    
-    special.add((i + 1, j - 1))
-    special.add((i + 1, j + 1))
-
-def solve01(data):
+def add_adjacents(idx: int, grid: Grid, special):
+    for offset in grid.offsets + grid.diagonals:
+        special.add(idx + offset)
+
+def parse(data: str) -> tuple[Grid, list[dict], list[tuple[str, int]]]:
     digits = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0']
+    grid = Grid.parse(data, border='.')
     nums = []
-    special = set()
+    symbols = []
 
-    j = 0
-    for line in data.split('\n'):
+    for row in range(grid.height):
         n = ''
         indexes = []
-        i = 0
 
-        for char in list(line):
+        for idx in grid.row_indices(row):
+            char = grid[idx]
             is_num = char in digits
             is_point = char == '.'
             is_special = (not is_num) and (not is_point)
             
             if is_special:
-                add_adjacents(j, i, special)
+                symbols.append((char, idx))
 
             if is_num:
                 n += char
-                indexes.append((j, i))
+                indexes.append(idx)
 
             if (not is_num) and n != '':
                 nums.append({
@@ -75,17 +73,20 @@ def solve01(data):
                 indexes = []
                 n = ''
 
-            i += 1
-
         if n != '':
             nums.append({
                 'val': int(n),
                 'idx' : indexes,
             })
-            indexes = []
-            n = ''
 
-        j += 1
+    return grid, nums, symbols
+
+def solve01(parsed):
+    grid, nums, symbols = parsed
+    special = set()
+
+    for _, idx in symbols:
+        add_adjacents(idx, grid, special)
 
     ans = 0
     for num in nums:
@@ -93,9 +94,7 @@ def solve01(data):
         indexes = num['idx']
 
         for idx in indexes:
-            i, j = idx
-
-            if (i, j) in special:
+            if idx in special:
                 ans += n
                 break
 
@@ -132,54 +131,19 @@ What is the sum of all of the gear ratios in your engine schematic?
 Your puzzle answer was 87449461.
 '''
 
-def solve02(data):
-    digits = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0']
-    nums = []
+def solve02(parsed):
+    grid, nums, symbols = parsed
     special = {}
 
-    j = 0
-    for line in data.split('\n'):
-        n = ''
-        indexes = []
-        i = 0
-
-        for char in list(line):
-            is_num = char in digits
-            is_point = char == '.'
-            is_special = char == '*'
-            
-            if is_special:
-                adjacents = set()
-                add_adjacents(j, i, adjacents)
-                special[(j, i)] = {
-                    'adj': adjacents,
-                    'count': 0,
-                    'vals': [],
-                }
-
-            if is_num:
-                n += char
-                indexes.append((j, i))
-
-            if (not is_num) and n != '':
-                nums.append({
-                    'val': int(n),
-                    'idx' : indexes,
-                })
-                indexes = []
-                n = ''
-
-            i += 1
-
-        if n != '':
-            nums.append({
-                'val': int(n),
-                'idx' : indexes,
-            })
-            indexes = []
-            n = ''
-
-        j += 1
+    for char, idx in symbols:
+        if char == '*':
+            adjacents = set()
+            add_adjacents(idx, grid, adjacents)
+            special[idx] = {
+                'adj': adjacents,
+                'count': 0,
+                'vals': [],
+            }
 
     ans = 0
     for num in nums:
@@ -187,14 +151,13 @@ def solve02(data):
         indexes = num['idx']
 
         for idx in indexes:
-            i, j = idx
             ok = False
             
             for key in special:
                 adjacents = special[key]['adj']
                 count = special[key]['count']
                 
-                if (i, j) in adjacents:
+                if idx in adjacents:
                     special[key]['count'] = count + 1
                     special[key]['vals'].append(n)
                     ok = True
@@ -215,6 +178,7 @@ def solve02(data):
 if __name__ == "__main__":
     # data = open('day-3-input.test.txt', 'r').read()
     data = open('day-3-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
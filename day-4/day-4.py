@@ -1,3 +1,11 @@
+import os
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import incremental, metrics
+
 '''
 --- Day 4: Scratchcards ---
 The gondola takes you up. Strangely, though, the ground doesn't seem to be coming with you; you're not climbing a mountain. As the circle of Snow Island recedes below you, an entire new landmass suddenly appears above you! The gondola carries you to the surface of the new island and lurches into the station.
@@ -36,27 +44,44 @@ Take a seat in the large pile of colorful cards. How many points are they worth
 Your puzzle answer was 33950.
 '''
 
-def solve01(data):
-    ans = 0
-    
+@incremental.per_line()
+def count_matches(line: str) -> int:
+    _, numbers = line.split(':')
+    nums = numbers.split('|')
+
+    winning_numbers = set()
+    for num in nums[0].split():
+        winning_numbers.add(int(num))
+
+    count = 0
+    for num in nums[1].split():
+        if int(num) in winning_numbers:
+            count += 1
+
+    return count
+
+def parse(data: str) -> list[int]:
+    matches = []
+
     for line in data.split('\n'):
-        _, numbers = line.split(':')
-        nums = numbers.split('|')
+        matches.append(count_matches(line))
 
-        winning_numbers = set()
-        for num in nums[0].split():
-            winning_numbers.add(int(num))
+    return matches
 
-        power = -1
-        for num in nums[1].split():
-            if int(num) in winning_numbers:
-                power += 1
+def solve01(matches):
+    ans = 0
+    
+    for count in matches:
+        power = count - 1
         
         if power >= 0:
             ans += (2 ** power)
     
     return ans
 
+def stream01(lines) -> int:
+    return solve01(map(count_matches, lines))
+
 '''
 --- Part Two ---
 Just as you're about to report your findings to the Elf, one of you realizes that the rules have actually been printed on the back of every card this whole time.
@@ -89,35 +114,18 @@ Process all of the original and copied scratchcards until no more scratchcards a
 Your puzzle answer was 14814534.
 '''
 
-def solve02(data):
+def solve02(matches):
     ans = 0
     instances = {}
     
-    lines = data.split('\n')
-    total_cards = len(lines)
+    total_cards = len(matches)
 
     for i in range(1, total_cards + 1):
         instances[i] = {
-            'get': []
+            'get': list(range(i + 1, i + matches[i - 1] + 1))
         }
 
-    i = 1
-    for line in lines:
-        _, numbers = line.split(':')
-        nums = numbers.split('|')
-
-        winning_numbers = set()
-        for num in nums[0].split():
-            winning_numbers.add(int(num))
-        
-        j = i
-        for num in nums[1].split():
-            if int(num) in winning_numbers:
-                j += 1
-                instances[i]['get'].append(j)
-
-        i += 1
-
+    @metrics.counted('get_points_calls')
     def get_points(i):
         points = 0
         cards = instances[i]['get']
@@ -135,9 +143,28 @@ def solve02(data):
     
     return ans + total_cards
 
+def stream02(lines) -> int:
+    # Cards only win copies of the cards after them, so only the copies still
+    # owed to the next few cards are kept.
+    pending = deque()
+    ans = 0
+
+    for line in lines:
+        instances = 1 + (pending.popleft() if pending else 0)
+        ans += instances
+
+        for i in range(count_matches(line)):
+            if i < len(pending):
+                pending[i] += instances
+            else:
+                pending.append(instances)
+
+    return ans
+
 if __name__ == "__main__":
     # data = open('day-4-input.test.txt', 'r').read()
     data = open('day-4-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -97,7 +97,7 @@ What is the lowest location number that corresponds to any of the initial seed n
 Your puzzle answer was 484023871.
 '''
 
-def solve01(data):
+def parse(data: str) -> tuple[list[int], list[list[tuple[int, int, int]]]]:
     data = data.split('\n\n')
     seeds = []
     
@@ -105,13 +105,27 @@ def solve01(data):
         if seed.isnumeric():
             seeds.append(int(seed))
 
-    for maps in data:
-        ranges = maps.split('\n')
+    maps = []
+    for section in data:
+        ranges = section.split('\n')
         ranges.pop(0)
         all_ranges = []
         
         for rn in ranges:
             dest_range_start, source_range_start, range_lenght = map(int, rn.split(' '))
+            all_ranges.append((dest_range_start, source_range_start, range_lenght))
+
+        maps.append(all_ranges)
+
+    return seeds, maps
+
+def solve01(parsed):
+    seeds, maps = parsed
+
+    for ranges in maps:
+        all_ranges = []
+        
+        for dest_range_start, source_range_start, range_lenght in ranges:
             dest_range_end = dest_range_start + range_lenght - 1
             source_range_end = source_range_start + range_lenght - 1
             all_ranges.append([dest_range_start, dest_range_end, source_range_start, source_range_end])
@@ -151,13 +165,8 @@ Consider all of the initial seed numbers listed in the ranges on the first line
 Your puzzle answer was 46294175.
 '''
 
-def solve02(data):
-    data = data.split('\n\n')
-    seeds = []
-    
-    for seed in data.pop(0).split(' '):
-        if seed.isnumeric():
-            seeds.append(int(seed))
+def solve02(parsed):
+    seeds, maps = parsed
     
     all_seeds = []
     i = 1
@@ -168,15 +177,7 @@ def solve02(data):
 
     seeds = all_seeds
 
-    for maps in data:
-        ranges = maps.split('\n')
-        ranges.pop(0)
-        all_ranges = []
-        
-        for rn in ranges:
-            dest_range_start, source_range_start, range_lenght = map(int, rn.split(' '))
-            all_ranges.append([dest_range_start, source_range_start, range_lenght])
-
+    for all_ranges in maps:
         new_seeds = []
         while len(seeds) > 0:
             start, end = seeds.pop()
@@ -202,6 +203,7 @@ def solve02(data):
 if __name__ == "__main__":
     # data = open('day-5-input.test.txt', 'r').read()
     data = open('day-5-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
\ No newline at end of file
+    print(solve01(parsed))
+    print(solve02(parsed))
\ No newline at end of file
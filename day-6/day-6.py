@@ -44,29 +44,27 @@ Determine the number of ways you could beat the record in each race. What do you
 Your puzzle answer was 211904.
 '''
 
-def parse_first(data: str):
+def parse(data: str) -> tuple[list[str], list[str]]:
     times, distances = data.split('\n')
     
     times = times.split(':')[1].split(' ')
     distances = distances.split(':')[1].split(' ')
-    
-    times_nums = []
-    for time in times:
-        if time.strip() != '':
-            times_nums.append(int(time))
-            
-    distances_nums = []
-    for distance in distances:
-        if distance.strip() != '':
-            distances_nums.append(int(distance))
+
+    return (
+        [time for time in times if time.strip() != ''],
+        [distance for distance in distances if distance.strip() != '']
+    )
+
+def parse_first(parsed: tuple[list[str], list[str]]):
+    times, distances = parsed
     
     return [
-        times_nums,
-        distances_nums
+        list(map(int, times)),
+        list(map(int, distances))
     ]
 
-def solve01(data):
-    times, distances = parse_first(data)
+def solve01(parsed):
+    times, distances = parse_first(parsed)
 
     total_ways = 1
 
@@ -105,29 +103,16 @@ How many ways can you beat the record in this one much longer race?
 Your puzzle answer was 43364472.
 '''
 
-def parse_second(data: str):
-    times, distances = data.split('\n')
-
-    times = times.split(':')[1].split(' ')
-    distances = distances.split(':')[1].split(' ')
-
-    times_num = ''
-    for time in times:
-        if time.strip() != '':
-            times_num += time
-
-    distances_num = ''
-    for distance in distances:
-        if distance.strip() != '':
-            distances_num += distance
+def parse_second(parsed: tuple[list[str], list[str]]):
+    times, distances = parsed
 
     return [
-        int(times_num),
-        int(distances_num)
+        int(''.join(times)),
+        int(''.join(distances))
     ]
 
-def solve02(data):
-    time, distance = parse_second(data)
+def solve02(parsed):
+    time, distance = parse_second(parsed)
 
     ways = 0
     j = 0
@@ -142,6 +127,7 @@ def solve02(data):
 if __name__ == "__main__":
     # data = open('day-6-input.test.txt', 'r').read()
     data = open('day-6-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -1,6 +1,12 @@
+import os
+import sys
 from collections import Counter
 from functools import cmp_to_key
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import incremental
+
 '''
 --- Day 7: Camel Cards ---
 Your all-expenses-paid trip turns out to be a one-way, five-minute ride in an airship. (At least it's a cool airship!) It drops you off at the edge of a vast desert and descends back to Island Island.
@@ -81,6 +87,9 @@ CARD_STRENGHTS = {
     'A': 13
 }
 
+CARD_STRENGHTS_WITH_JOKER = {**CARD_STRENGHTS, 'J': 0}
+
+@incremental.per_line()
 def get_type(card: str) -> int:
     if len(set(card)) == 1:
         return FIVE_OF_A_KIND
@@ -108,9 +117,9 @@ def get_type(card: str) -> int:
 
     return HIGH_CARD
 
-def is_chr_greater_than(a: str, b: str):
-    v1 = CARD_STRENGHTS[a]
-    v2 = CARD_STRENGHTS[b]
+def is_chr_greater_than(a: str, b: str, strenghts: dict[str, int] = CARD_STRENGHTS):
+    v1 = strenghts[a]
+    v2 = strenghts[b]
 
     if v1 > v2:
         return -1
@@ -138,12 +147,18 @@ def is_greater_than(first: (str, int), second: (str, int)) -> int:
 
     return 0
 
-def solve01(data: str):
+def parse_hand(line: str) -> tuple[str, int]:
+    card, val = line.split(' ')
+    return (card, int(val))
+
+def parse(data: str) -> list[tuple[str, int]]:
     values = []
     for line in data.split('\n'):
-        card, val = line.split(' ')
-        values.append((card, int(val)))
+        values.append(parse_hand(line))
+
+    return values
 
+def solve01(values: list[tuple[str, int]]):
     values = sorted(values, key=cmp_to_key(is_greater_than))
 
     lenght = len(values)
@@ -156,6 +171,10 @@ def solve01(data: str):
 
     return ans
 
+def stream01(lines) -> int:
+    # Ranking needs every hand, but not the text they were read from.
+    return solve01([parse_hand(line) for line in lines])
+
 '''
 --- Part Two ---
 To make things a little more interesting, the Elf introduces one additional rule. Now, J cards are jokers - wildcards that can act like whatever card would make the hand the strongest type possible.
@@ -181,6 +200,7 @@ Using the new joker rule, find the rank of every hand in your set. What are the
 Your puzzle answer was 253253225.
 '''
 
+@incremental.per_line()
 def get_type_with_joker(card: str) -> int:
     most_common_chars = Counter(card).most_common()
 
@@ -204,20 +224,13 @@ def is_greater_than_joker(first: (str, int), second: (str, int)) -> int:
     
     lenght = len(first_card)
     for i in range(lenght):
-        val = is_chr_greater_than(first_card[i], second_card[i])
+        val = is_chr_greater_than(first_card[i], second_card[i], CARD_STRENGHTS_WITH_JOKER)
         if val != 0:
             return val
 
     return 0
 
-def solve02(data):
-    values = []
-    for line in data.split('\n'):
-        card, val = line.split(' ')
-        values.append((card, int(val)))
-    
-    CARD_STRENGHTS['J'] = 0
-
+def solve02(values: list[tuple[str, int]]):
     values = sorted(values, key=cmp_to_key(is_greater_than_joker))
 
     lenght = len(values)
@@ -230,9 +243,13 @@ def solve02(data):
 
     return ans
 
+def stream02(lines) -> int:
+    return solve02([parse_hand(line) for line in lines])
+
 if __name__ == "__main__":
     # data = open('day-7-input.test.txt', 'r').read()
     data = open('day-7-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
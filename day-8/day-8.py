@@ -46,9 +46,12 @@ def parse_lines(lines: str) -> dict[str, list[str]]:
 
     return nodes
 
-def solve01(data: str):
-    instructions, lines = data.split('\n\n')    
-    nodes = parse_lines(lines)
+def parse(data: str) -> tuple[str, dict[str, list[str]]]:
+    instructions, lines = data.split('\n\n')
+    return instructions, parse_lines(lines)
+
+def solve01(parsed: tuple[str, dict[str, list[str]]]):
+    instructions, nodes = parsed
 
     if 'AAA' not in nodes:
         return -1
@@ -108,9 +111,8 @@ Simultaneously start on every node that ends with A. How many steps does it take
 Your puzzle answer was 20685524831999.
 '''
 
-def solve02(data: str):
-    instructions, lines = data.split('\n\n')
-    nodes = parse_lines(lines)
+def solve02(parsed: tuple[str, dict[str, list[str]]]):
+    instructions, nodes = parsed
     instructions = list(instructions)
 
     ans = 1
@@ -139,6 +141,7 @@ def solve02(data: str):
 if __name__ == "__main__":
     # data = open('day-8-input.test.txt', 'r').read()
     data = open('day-8-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import incremental
+
 '''
 --- Day 9: Mirage Maintenance ---
 You ride the camel through the sandstorm and stop where the ghost's maps told you to stop. The sandstorm subsequently subsides, somehow seeing you standing at an oasis!
@@ -78,23 +85,31 @@ def next_seq(current_seq: list[int]) -> list[int]:
 
     return next
 
-def solve01(data: str):
-    def next_value(init_seq: list[int]) -> int:
-        current_seq = init_seq
-        ans = init_seq[-1]
-        while len(set(current_seq)) != 1:
-            current_seq = next_seq(current_seq)
-            ans += current_seq[-1]
-    
-        return ans
-
-    sequences = list(list(int (j) for j in l.split(' ')) for l in data.split('\n'))
-    
+def parse_sequence(line: str) -> list[int]:
+    return list(int (j) for j in line.split(' '))
+
+def parse(data: str) -> list[list[int]]:
+    return list(parse_sequence(l) for l in data.split('\n'))
+
+@incremental.per_line(key=tuple)
+def next_value(init_seq: list[int]) -> int:
+    current_seq = init_seq
+    ans = init_seq[-1]
+    while len(set(current_seq)) != 1:
+        current_seq = next_seq(current_seq)
+        ans += current_seq[-1]
+
+    return ans
+
+def solve01(sequences: list[list[int]]):
     ans = 0
     for seq in sequences:
         ans += next_value(seq)
     return ans
 
+def stream01(lines) -> int:
+    return solve01(map(parse_sequence, lines))
+
 '''
 --- Part Two ---
 Of course, it would be nice to have even more history included in your report. Surely it's safe to just extrapolate backwards as well, right?
@@ -117,29 +132,32 @@ Analyze your OASIS report again, this time extrapolating the previous value for
 Your puzzle answer was 975.
 '''
 
-def solve02(data: str):
-    def prev_value(init_seq: list[int]) -> int:
-        current_seq = init_seq
-        ans = init_seq[0]
-        sign = -1
-    
-        while len(set(current_seq)) != 1:
-            current_seq = next_seq(current_seq)
-            ans += (sign * current_seq[0])
-            sign *= -1
-    
-        return ans
-
-    sequences = list(list(int (j) for j in l.split(' ')) for l in data.split('\n'))
-    
+@incremental.per_line(key=tuple)
+def prev_value(init_seq: list[int]) -> int:
+    current_seq = init_seq
+    ans = init_seq[0]
+    sign = -1
+
+    while len(set(current_seq)) != 1:
+        current_seq = next_seq(current_seq)
+        ans += (sign * current_seq[0])
+        sign *= -1
+
+    return ans
+
+def solve02(sequences: list[list[int]]):
     ans = 0
     for seq in sequences:
         ans += prev_value(seq)
     return ans
 
+def stream02(lines) -> int:
+    return solve02(map(parse_sequence, lines))
+
 if __name__ == "__main__":
     # data = open('day-9-input.test.txt', 'r').read()
     data = open('day-9-input.txt', 'r').read()
+    parsed = parse(data)
 
-    print(solve01(data))
-    print(solve02(data))
+    print(solve01(parsed))
+    print(solve02(parsed))
@@ -0,0 +1,26 @@
+from aoc.days import load_day
+
+# Ids that are neither sequential nor starting at 1.
+GAMES = '\n'.join([
+    'Game 7: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green',
+    'Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green',
+    'Game 42: 1 blue, 2 green; 3 green, 4 blue, 1 red',
+    'Game 10: 1 green, 3 red, 6 blue; 3 green, 15 blue, 14 red',
+])
+
+def test_part_one_sums_the_parsed_ids():
+    day = load_day(2)
+    table = day.parse_table(GAMES)
+
+    assert day.solve01(day.parse(GAMES)) == 7 + 42
+    assert day.solve01_table(table) == 7 + 42
+    assert day.stream01(GAMES.split('\n')) == 7 + 42
+    assert day.BagIndex(table).query([(12, 13, 14)]) == [(7 + 42, 4 * 2 * 6 + 1 * 3 * 4)]
+
+def test_part_two_does_not_depend_on_ids():
+    day = load_day(2)
+    expected = 4 * 2 * 6 + 20 * 13 * 6 + 1 * 3 * 4 + 14 * 3 * 15
+
+    assert day.solve02(day.parse(GAMES)) == expected
+    assert day.solve02_table(day.parse_table(GAMES)) == expected
+    assert day.stream02(GAMES.split('\n')) == expected
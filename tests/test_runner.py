@@ -0,0 +1,23 @@
+import os
+
+from aoc.days import BASELINE_PATH
+from aoc.runner import load_estimates, schedule
+
+TASKS = [(1, 1), (1, 2), (12, 2), (23, 2)]
+
+def test_schedule_starts_the_slowest_parts_first():
+    estimates = {(1, 1): 0.001, (1, 2): 0.002, (12, 2): 0.3, (23, 2): 4.0}
+
+    assert schedule(TASKS, estimates) == [(23, 2), (12, 2), (1, 2), (1, 1)]
+
+def test_schedule_starts_parts_without_estimates_first():
+    estimates = {(1, 1): 0.001, (1, 2): 0.002, (23, 2): 4.0}
+
+    assert schedule(TASKS, estimates) == [(12, 2), (23, 2), (1, 2), (1, 1)]
+
+def test_committed_baseline_gives_estimates():
+    assert os.path.exists(BASELINE_PATH)
+
+    estimates = load_estimates()
+    assert estimates
+    assert schedule(TASKS, estimates) != TASKS